@@ -0,0 +1 @@
+"""Shared data and tooling modules for the Premier League dashboards."""
@@ -0,0 +1,306 @@
+"""Read-only JSON API over the season data.
+
+    python -m analytics.api --port 8600
+
+A small asyncio HTTP/1.1 server (standard library only) that serves the
+numbers behind the dashboards from the same cached loaders as the pages:
+
+    GET /v1/standings
+    GET /v1/teams                     team_stats.csv, one row per team
+    GET /v1/teams/{team}              one team ("Manchester_Utd" or URL-encoded)
+    GET /v1/players                   player_stats.csv, optionally ?per90=1
+    GET /v1/leaderboards/{metric}     players sorted by a metric, desc
+
+List endpoints take ``limit`` (default 50, max 500) and ``offset``,
+``fields=name,team,goals`` to select columns and ``team=`` / ``position=``
+filters; players and leaderboards also take ``per90=1`` (adds ``*_per90``
+columns, and ranks by the per-90 value on leaderboards) and
+``min_minutes=``. Every endpoint takes ``league=`` and ``season=`` (e.g.
+``league=premier-league&season=2023-24``, default the 2024/25 Premier
+League) to read another partition (see analytics.data). Responses carry a strong ETag (``If-None-Match`` gives a
+304) and are gzip-compressed when the client accepts it.
+"""
+
+import argparse
+import asyncio
+import functools
+import gzip
+import hashlib
+import json
+import logging
+import os
+import sys
+import urllib.parse
+
+# The API runs the cached loaders without a Streamlit runtime; drop the
+# bare-mode warnings that would otherwise be logged on import and per call
+for _name in (
+    "streamlit.runtime.caching.cache_data_api",
+    "streamlit.runtime.scriptrunner_utils.script_run_context",
+):
+    logging.getLogger(_name).addFilter(lambda record: False)
+
+import streamlit as st  # noqa: E402
+
+from analytics.data import (  # noqa: E402
+    DEFAULT_PARTITION,
+    PARTITION_CACHE,
+    dataset,
+    load_player_stats,
+    load_standings,
+    load_team_stats,
+    partitioned,
+    partitions,
+    using,
+)
+
+logger = logging.getLogger("analytics.api")
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+GZIP_MIN_BYTES = 1024
+
+# Count columns of player_stats.csv that get a per-90 version
+PER90_COLUMNS = [
+    "goals", "assists", "expected_goals", "penalty_kicks", "yellow", "red",
+    "progressive_carries", "progressive_passes", "received_progressive_passes",
+]
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+@partitioned
+@st.cache_data(max_entries=PARTITION_CACHE)
+def player_table(partition=None):
+    """Player stats with a ``<column>_per90`` for every count column."""
+    df = load_player_stats()
+    nineties = df["minutes"].where(df["minutes"] > 0) / 90
+    for column in PER90_COLUMNS:
+        df[f"{column}_per90"] = (df[column] / nineties).round(3)
+    return df
+
+
+# Query handling
+def _one(query, name, default=None):
+    values = query.get(name)
+    return values[-1] if values else default
+
+
+def _int(query, name, default, minimum=0, maximum=None):
+    value = _one(query, name)
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise ApiError(400, f"{name} must be an integer")
+    if number < minimum or (maximum is not None and number > maximum):
+        raise ApiError(400, f"{name} must be between {minimum} and {maximum or 'infinity'}")
+    return number
+
+
+def _filter(df, query):
+    for column in ("team", "position"):
+        value = _one(query, column)
+        if value is not None and column in df.columns:
+            df = df[df[column] == value]
+    min_minutes = _int(query, "min_minutes", None)
+    if min_minutes is not None and "minutes" in df.columns:
+        df = df[df["minutes"] >= min_minutes]
+    return df
+
+
+def _columns(df, query, per90):
+    if not per90:
+        df = df[[c for c in df.columns if not c.endswith("_per90")]]
+    fields = _one(query, "fields")
+    if not fields:
+        return df
+    fields = [field for field in fields.split(",") if field]
+    unknown = [field for field in fields if field not in df.columns]
+    if unknown:
+        raise ApiError(400, f"unknown fields: {', '.join(unknown)}")
+    return df[fields]
+
+
+def _page(df, query):
+    limit = _int(query, "limit", DEFAULT_LIMIT, minimum=1, maximum=MAX_LIMIT)
+    offset = _int(query, "offset", 0)
+    page = df.iloc[offset:offset + limit]
+    return {
+        "data": json.loads(page.to_json(orient="records")),
+        "total": len(df),
+        "limit": limit,
+        "offset": offset,
+        "next_offset": offset + limit if offset + limit < len(df) else None,
+    }
+
+
+def _list(df, query, per90=False):
+    df = _filter(df, query)
+    return _page(_columns(df, query, per90), query)
+
+
+def standings(query):
+    return _list(load_standings(), query)
+
+
+def teams(query):
+    return _list(load_team_stats(), query)
+
+
+def team(query, name):
+    df = load_team_stats()
+    row = df[df["team"] == name.replace("_", " ")]
+    if row.empty:
+        raise ApiError(404, f"unknown team: {name}")
+    return {"data": json.loads(_columns(row, query, False).to_json(orient="records"))[0]}
+
+
+def players(query):
+    per90 = _one(query, "per90") == "1"
+    return _list(player_table(), query, per90)
+
+
+def leaderboard(query, metric):
+    per90 = _one(query, "per90") == "1"
+    df = player_table()
+    column = f"{metric}_per90" if per90 else metric
+    if column not in df.columns or df[column].dtype.kind not in "if":
+        raise ApiError(404, f"unknown metric: {metric}")
+    df = _filter(df, query).dropna(subset=[column])
+    return _page(_columns(df.sort_values(column, ascending=False, kind="stable"), query, per90), query)
+
+
+ROUTES = [
+    (("v1", "standings"), standings),
+    (("v1", "teams"), teams),
+    (("v1", "teams", None), team),
+    (("v1", "players"), players),
+    (("v1", "leaderboards", None), leaderboard),
+]
+
+
+def _route(path):
+    parts = tuple(urllib.parse.unquote(part) for part in path.strip("/").split("/"))
+    for pattern, handler in ROUTES:
+        if len(pattern) == len(parts) and all(p is None or p == part for p, part in zip(pattern, parts)):
+            return handler, [part for p, part in zip(pattern, parts) if p is None]
+    raise ApiError(404, "not found")
+
+
+def respond(target):
+    """(status, body, etag) for a request target."""
+    query = urllib.parse.parse_qs(urllib.parse.urlsplit(target).query)
+    partition = (_one(query, "league", DEFAULT_PARTITION[0]), _one(query, "season", DEFAULT_PARTITION[1]))
+    return _respond(target, dataset(partition))
+
+
+# Cached per target and dataset version, so a newly published snapshot is served at once
+@functools.lru_cache(maxsize=512)
+def _respond(target, key):
+    url = urllib.parse.urlsplit(target)
+    query = urllib.parse.parse_qs(url.query)
+    try:
+        handler, args = _route(url.path)
+        if key[:2] not in partitions():
+            raise ApiError(404, f"no data for league={key[0]} season={key[1]}")
+        with using(key):
+            status, payload = 200, handler(query, *args)
+    except ApiError as exc:
+        status, payload = exc.status, {"error": str(exc)}
+    body = json.dumps(payload, separators=(",", ":")).encode()
+    return status, body, f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+@functools.lru_cache(maxsize=512)
+def _gzipped(body):
+    return gzip.compress(body, compresslevel=6)
+
+
+# HTTP/1.1 over asyncio streams
+REASONS = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}
+
+
+async def _read_request(reader):
+    line = await reader.readline()
+    if not line:
+        return None
+    method, target, version = line.decode("latin-1").split(" ", 2)
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return method, target, version.strip(), headers
+
+
+async def handle(reader, writer):
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            request = await _read_request(reader)
+            if request is None:
+                break
+            method, target, version, headers = request
+            if method not in ("GET", "HEAD"):
+                status, body, etag = 405, b'{"error":"read-only API"}', None
+            else:
+                # Building a response may hit pandas; keep the loop responsive
+                status, body, etag = await loop.run_in_executor(None, respond, target)
+
+            response_headers = {"Content-Type": "application/json", "Vary": "Accept-Encoding"}
+            if etag:
+                response_headers["ETag"] = etag
+                response_headers["Cache-Control"] = "no-cache"
+                if headers.get("if-none-match") == etag:
+                    status, body = 304, b""
+            if len(body) >= GZIP_MIN_BYTES and "gzip" in headers.get("accept-encoding", ""):
+                body = _gzipped(body)
+                response_headers["Content-Encoding"] = "gzip"
+
+            keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+            response_headers["Content-Length"] = str(len(body))
+            response_headers["Connection"] = "keep-alive" if keep_alive else "close"
+            head = f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n" + "".join(
+                f"{name}: {value}\r\n" for name, value in response_headers.items()
+            )
+            writer.write(head.encode("latin-1") + b"\r\n" + (b"" if method == "HEAD" else body))
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(host, port):
+    server = await asyncio.start_server(handle, host, port)
+    logger.info("API listening on http://%s:%d/v1/", host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Read-only JSON API over the season data.")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PL_API_PORT", "8600")))
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s: %(message)s")
+    try:
+        asyncio.run(serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
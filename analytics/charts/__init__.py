@@ -0,0 +1,24 @@
+"""Figure builders for the dashboard pages, one module per page.
+
+Builders only depend on their arguments and the loaders in analytics.data,
+so the pages, the boot-time warm-up and the exporters all share the same
+cache entries. Figures are cached with st.cache_resource rather than
+st.cache_data: st.plotly_chart only reads them, and unpickling a fresh copy
+on every hit costs about as much as rebuilding the figure.
+"""
+
+# Marker colors shared by the player charts
+COLORS = [
+    "#ff2d96", "#faff00", "#00ffff", "#ff7300", "#00ff66",
+    "#4ac8ff", "#c77dff", "#ff4d4d", "#1abc9c", "#f1c40f",
+]
+
+POSITION_COLORS = {
+    "FW": "#ff2d96",
+    "MF": "#00ff66",
+    "DF": "#4ac8ff",
+    "FW,MF": "#faff00",
+    "MF,FW": "#ff7300",
+    "DF,MF": "#c77dff",
+    "MF,DF": "#ff4d4d",
+}
@@ -0,0 +1,156 @@
+"""Age Distribution: minutes played by birth year."""
+
+import plotly.express as px
+import streamlit as st
+
+from analytics.data import PARTITION_CACHE, partitioned
+from analytics.sql import query
+
+
+@partitioned
+@st.cache_resource(max_entries=PARTITION_CACHE)
+def build_figures(partition=None):
+    return {
+        "team heatmap": team_heatmap(),
+        "position heatmap": position_heatmap(),
+    }
+
+
+# Minutes by Birth Year and Team
+def team_heatmap():
+    # Group data by birth year and team
+    filt_team = query("""
+        SELECT born, team, SUM(minutes) AS minutes
+        FROM player_stats
+        WHERE born IS NOT NULL AND team IS NOT NULL
+        GROUP BY born, team
+        ORDER BY born, team
+    """)
+
+    fig1 = px.density_heatmap(
+        data_frame=filt_team,
+        x='born',
+        y='team',
+        z='minutes',
+        nbinsx=20,
+        color_continuous_scale=['#90EE90', '#006400'],
+        title='Minutes Played Distribution Across Teams and Birth Years'
+    )
+
+    fig1.update_layout(
+        plot_bgcolor='#0e1a26',
+        paper_bgcolor='#0e1a26',
+        font_color='white',
+        title={
+            'text': 'Minutes Played Distribution Across Teams and Birth Years',
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'color': 'white', 'size': 18}
+        },
+        xaxis=dict(
+            title='Birth Year',
+            gridcolor='rgba(255,255,255,0.3)',
+            gridwidth=1,
+            color='white',
+            showgrid=True,
+            zeroline=False
+        ),
+        yaxis=dict(
+            title='Team',
+            gridcolor='rgba(255,255,255,0.3)',
+            gridwidth=1,
+            color='white',
+            showgrid=True,
+            zeroline=False
+        ),
+        coloraxis_colorbar=dict(
+            title=dict(text="Minutes Played", font=dict(color='white')),
+            tickfont=dict(color='white'),
+            bgcolor='rgba(0,0,0,0.5)',
+            bordercolor='white',
+            borderwidth=1
+        ),
+        height=600
+    )
+
+    # Add hover template for better interactivity
+    fig1.update_traces(
+        hovertemplate="""
+        <b>Team:</b> %{y}<br>
+        <b>Birth Year:</b> %{x}<br>
+        <b>Total Minutes:</b> %{z:,.0f}<br>
+        <extra></extra>
+        """
+    )
+
+    return fig1
+
+
+# Minutes by Birth Year and Position
+def position_heatmap():
+    # Group data by birth year and position
+    filt_position = query("""
+        SELECT born, position, SUM(minutes) AS minutes
+        FROM player_stats
+        WHERE born IS NOT NULL AND position IS NOT NULL
+        GROUP BY born, position
+        ORDER BY born, position
+    """)
+
+    fig2 = px.density_heatmap(
+        data_frame=filt_position,
+        x='born',
+        y='position',
+        z='minutes',
+        nbinsx=20,
+        color_continuous_scale=['#90EE90', '#006400'],
+        title='Minutes Played Distribution Across Positions and Birth Years'
+    )
+
+    fig2.update_layout(
+        plot_bgcolor='#0e1a26',
+        paper_bgcolor='#0e1a26',
+        font_color='white',
+        title={
+            'text': 'Minutes Played Distribution Across Positions and Birth Years',
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'color': 'white', 'size': 18}
+        },
+        xaxis=dict(
+            title='Birth Year',
+            gridcolor='rgba(255,255,255,0.3)',
+            gridwidth=1,
+            color='white',
+            showgrid=True,
+            zeroline=False
+        ),
+        yaxis=dict(
+            title='Position',
+            gridcolor='rgba(255,255,255,0.3)',
+            gridwidth=1,
+            color='white',
+            showgrid=True,
+            zeroline=False
+        ),
+        coloraxis_colorbar=dict(
+            title=dict(text="Minutes Played", font=dict(color='white')),
+            tickfont=dict(color='white'),
+            bgcolor='rgba(0,0,0,0.5)',
+            bordercolor='white',
+            borderwidth=1
+        ),
+        height=600
+    )
+
+    # Add hover template for better interactivity
+    fig2.update_traces(
+        hovertemplate="""
+        <b>Position:</b> %{y}<br>
+        <b>Birth Year:</b> %{x}<br>
+        <b>Total Minutes:</b> %{z:,.0f}<br>
+        <extra></extra>
+        """
+    )
+
+    return fig2
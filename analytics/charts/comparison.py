@@ -0,0 +1,64 @@
+"""Team Comparison: radar of the scaled team feature matrix."""
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from analytics.charts import COLORS
+from analytics.data import PARTITION_CACHE, load_standings, partitioned
+from analytics.team_features import GROUPS, LABELS, matrix
+
+
+def default_teams(count=2):
+    """The top ``count`` teams of the table."""
+    return tuple(load_standings().sort_values("rank")["team"].head(count))
+
+
+def table(teams):
+    """Raw metric values, one row per metric and one column per team."""
+    features = matrix()
+    df = pd.DataFrame(features.values[features.rows(teams)].T, columns=list(teams))
+    df.insert(0, "Group", [GROUPS[metric] for metric in features.metrics])
+    df.index = [LABELS[metric] for metric in features.metrics]
+    return df
+
+
+@partitioned
+@st.cache_resource(max_entries=PARTITION_CACHE * 32)
+def build_figure(teams, partition=None):
+    features = matrix()
+    rows = features.rows(teams)
+    labels = [LABELS[metric] for metric in features.metrics]
+
+    fig = go.Figure()
+    for i, row in enumerate(rows):
+        # Close the polygon by repeating the first point
+        r = np.append(features.scaled[row], features.scaled[row, 0]) * 100
+        raw = np.append(features.values[row], features.values[row, 0])
+        fig.add_trace(go.Scatterpolar(
+            r=r, theta=labels + labels[:1], name=teams[i], customdata=raw,
+            fill='toself', opacity=0.6,
+            line=dict(color=COLORS[i % len(COLORS)], width=2),
+            hovertemplate=f"<b>{teams[i]}</b><br>%{{theta}}: %{{customdata:,.1f}}<br>Scaled: %{{r:.0f}}<extra></extra>"
+        ))
+
+    fig.update_layout(
+        plot_bgcolor='#0e1a26',
+        paper_bgcolor='#0e1a26',
+        font_color='white',
+        title={
+            'text': 'Team Profiles, Scaled to the League Range',
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'color': 'white', 'size': 18}
+        },
+        polar=dict(
+            bgcolor='#0e1a26',
+            radialaxis=dict(range=[0, 100], gridcolor='rgba(255,255,255,0.3)', color='white'),
+            angularaxis=dict(gridcolor='rgba(255,255,255,0.3)', color='white'),
+        ),
+        height=650
+    )
+
+    return fig
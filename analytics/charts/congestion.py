@@ -0,0 +1,93 @@
+"""Fixture Congestion: results by rest differential and by days of rest."""
+
+import plotly.graph_objects as go
+import streamlit as st
+
+from analytics.congestion import LONG_REST, MAX_DIFFERENTIAL, SHORT_REST, by_differential, by_rest
+from analytics.data import PARTITION_CACHE
+
+LAYOUT = dict(
+    plot_bgcolor='#0e1a26',
+    paper_bgcolor='#0e1a26',
+    font_color='white',
+)
+AXIS = dict(gridcolor='rgba(255,255,255,0.3)', gridwidth=1, color='white', showgrid=True, zeroline=False)
+
+
+def _title(text):
+    return {'text': text, 'x': 0.5, 'xanchor': 'center', 'font': {'color': 'white', 'size': 18}}
+
+
+def differential_label(days):
+    if days <= -MAX_DIFFERENTIAL:
+        return f"≤{-MAX_DIFFERENTIAL}"
+    if days >= MAX_DIFFERENTIAL:
+        return f"≥+{MAX_DIFFERENTIAL}"
+    return f"{days:+d}" if days else "0"
+
+
+def rest_label(days):
+    if days <= SHORT_REST:
+        return f"≤{SHORT_REST}"
+    if days >= LONG_REST:
+        return f"{LONG_REST}+"
+    return str(days)
+
+
+@st.cache_resource(max_entries=PARTITION_CACHE)
+def build_figures(datasets):
+    return {"differential": differential(datasets), "rest": rest(datasets)}
+
+
+# Home win / draw / away win shares, stacked, by rest differential
+def differential(datasets):
+    table = by_differential(datasets)
+    labels = [differential_label(days) for days in table.index]
+
+    fig = go.Figure()
+    for column, name, color in [
+        ("home_win", "Home win", "#00ff66"), ("draw", "Draw", "#faff00"), ("away_win", "Away win", "#ff2d96"),
+    ]:
+        fig.add_trace(go.Bar(
+            x=labels, y=table[column] * 100, name=name, marker_color=color,
+            customdata=table["matches"],
+            hovertemplate=f"Rest difference %{{x}} days<br>{name}: %{{y:.1f}}%<br>Matches: %{{customdata}}<extra></extra>"
+        ))
+
+    fig.update_layout(
+        **LAYOUT,
+        barmode='stack',
+        title=_title('Results by Rest Difference (home minus away, days)'),
+        xaxis=dict(title='Home rest minus away rest (days)', **AXIS),
+        yaxis=dict(title='Share of matches (%)', range=[0, 100], **AXIS),
+        height=500
+    )
+    return fig
+
+
+# Points and goals per game by a team's own days of rest
+def rest(datasets):
+    table = by_rest(datasets)
+    labels = [rest_label(days) for days in table.index]
+
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=labels, y=table["points"], name='Points per game', marker_color='#4ac8ff',
+        text=[f"n={n}" for n in table["matches"]], textposition='outside',
+        hovertemplate="%{x} days of rest<br>Points per game: %{y:.2f}<extra></extra>"
+    ))
+    for column, name, color in [("scored", "Goals scored", "#00ff66"), ("conceded", "Goals conceded", "#ff4d4d")]:
+        fig.add_trace(go.Scatter(
+            x=labels, y=table[column], name=name, mode='lines+markers',
+            line=dict(color=color, width=3), marker=dict(size=9),
+            hovertemplate=f"%{{x}} days of rest<br>{name} per game: %{{y:.2f}}<extra></extra>"
+        ))
+
+    fig.update_layout(
+        **LAYOUT,
+        title=_title('Points and Goals per Game by Days of Rest'),
+        xaxis=dict(title='Days since the previous league match', **AXIS),
+        yaxis=dict(title='Per game', **AXIS),
+        height=500
+    )
+    return fig
@@ -0,0 +1,278 @@
+"""Goalscoring Analysis: one figure per analysis type."""
+
+import plotly.graph_objects as go
+import streamlit as st
+
+from analytics.charts import COLORS
+from analytics.data import PARTITION_CACHE, load_player_stats, partitioned
+
+ANALYSES = ["Goals vs Expected Goals", "Goal Involvements per 90", "Progressive Pass Recipients"]
+TOP_CHOICES = [10, 20, 30, 40, 50, "All"]
+DEFAULT_ANALYSIS = ANALYSES[0]
+
+
+# Player stats with the calculated columns, derived once rather than on every rerun
+@partitioned
+@st.cache_data(max_entries=PARTITION_CACHE)
+def load_data(partition=None):
+    df = load_player_stats()
+
+    # Create calculated columns
+    df["Goal_Involvements"] = df['goals'] + df['assists']
+    df["Goal_Involvements_per"] = (df['goals'] + df['assists']) / (df['minutes'] / 90)
+    df["recv_per"] = df['received_progressive_passes'] / (df['minutes'] / 90)
+    return df
+
+
+@partitioned
+@st.cache_resource(max_entries=PARTITION_CACHE * len(ANALYSES) * len(TOP_CHOICES))
+def build_figure(analysis_type, top=TOP_CHOICES[0], partition=None):
+    """Figure for one analysis; ``top`` only applies to Goals vs Expected Goals."""
+    if analysis_type == "Goals vs Expected Goals":
+        return goals_vs_xg(top)
+    if analysis_type == "Goal Involvements per 90":
+        return goal_involvements()
+    return progressive_recipients()
+
+
+# Analysis 1: Goals vs Expected Goals (Scatter Plot)
+def goals_vs_xg(top):
+    df = load_data()
+    if top == "All":
+        top_scorers = df.sort_values(by='goals', ascending=False)
+    else:
+        top_scorers = df.sort_values(by='goals', ascending=False).head(top)
+    fig = go.Figure()
+
+    # Add scatter points
+    for i, idx in enumerate(top_scorers.index):
+        player_data = top_scorers.loc[idx]
+        player_name = player_data['name']
+        team = player_data['team'] if 'team' in player_data else "Unknown"
+        position = player_data['position'] if 'position' in player_data else "Unknown"
+        minutes = player_data['minutes']
+        goals = player_data['goals']
+        xg = player_data['expected_goals']
+
+        # Determine if overperforming or underperforming
+        performance = "Overperforming" if goals > xg else "Underperforming" if goals < xg else "On Target"
+
+        fig.add_trace(go.Scatter(
+            x=[xg],
+            y=[goals],
+            mode='markers+text',
+            marker=dict(
+                color=COLORS[i % len(COLORS)],
+                size=16,
+                line=dict(width=1, color='rgba(255,255,255,0.3)')
+            ),
+            text=player_name,
+            textposition="top center",
+            textfont=dict(size=16, color='silver'),
+            name=player_name,
+            hovertemplate=f"""
+            Player: {player_name}<br>
+            Team: {team}<br>
+            Position: {position}<br>
+            Minutes: {minutes}<br>
+            Goals: {goals}<br>
+            Expected Goals: {xg:.2f}<br>
+            Performance: {performance}<br>
+            <extra></extra>
+            """,
+            showlegend=False
+        ))
+
+    # Add diagonal line for expected = actual
+    min_val = min(df['expected_goals'].min(), df['goals'].min())
+    max_val = max(df['expected_goals'].max(), df['goals'].max())
+
+    fig.add_trace(go.Scatter(
+        x=[min_val, max_val],
+        y=[min_val, max_val],
+        mode='lines',
+        line=dict(color='#00ff00', width=2),
+        name='Expected = Actual',
+        showlegend=True
+    ))
+
+    # Add performance zone annotations
+    fig.add_annotation(
+        x=max_val * 0.5, y=max_val * 0.2,
+        text="Underperforming",
+        showarrow=False,
+        font=dict(size=24, color='#ff2d96'),
+        opacity=0.8
+    )
+
+    fig.add_annotation(
+        x=max_val * 0.1, y=max_val * 0.9,
+        text="Overperforming",
+        showarrow=False,
+        font=dict(size=24, color='#ff2d96'),
+        opacity=0.8
+    )
+
+    fig.update_layout(
+        plot_bgcolor='#0e1a26',
+        paper_bgcolor='#0e1a26',
+        font_color='white',
+        title={
+            'text': 'Goals vs Expected Goals Comparison',
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'color': 'white', 'size': 24}
+        },
+        xaxis=dict(
+            title='Expected Goals (xG)',
+            gridcolor='rgba(255,255,255,0.3)',
+            gridwidth=1,
+            color='white',
+            showgrid=True,
+            zeroline=False
+        ),
+        yaxis=dict(
+            title='Goals Scored',
+            gridcolor='rgba(255,255,255,0.3)',
+            gridwidth=1,
+            color='white',
+            showgrid=True,
+            zeroline=False
+        ),
+        hovermode='closest',
+        height=600
+    )
+
+    return fig
+
+
+# Analysis 2: Goal Involvements per 90 (Horizontal Bar Chart)
+def goal_involvements():
+    df = load_data()
+
+    # Filter top 20 by goal involvements
+    filt = df.sort_values(by='Goal_Involvements', ascending=False).head(20)
+
+    fig = go.Figure()
+
+    for i, idx in enumerate(filt.index):
+        player_data = filt.loc[idx]
+        player_name = player_data['name']
+        team = player_data['team'] if 'team' in player_data else "Unknown"
+        position = player_data['position'] if 'position' in player_data else "Unknown"
+        minutes = player_data['minutes']
+        goals = player_data['goals']
+        assists = player_data['assists']
+        goal_inv_per90 = player_data['Goal_Involvements_per']
+
+        fig.add_trace(go.Bar(
+            y=[player_name],
+            x=[goal_inv_per90],
+            orientation='h',
+            marker_color='#ff2d96',
+            name=player_name,
+            hovertemplate=f"""
+            Player: {player_name}<br>
+            Team: {team}<br>
+            Position: {position}<br>
+            Minutes: {minutes}<br>
+            Goals: {goals}<br>
+            Assists: {assists}<br>
+            Goal Involvements per 90: {goal_inv_per90:.2f}<br>
+            <extra></extra>
+            """,
+            showlegend=False
+        ))
+
+    fig.update_layout(
+        plot_bgcolor='#0e1a26',
+        paper_bgcolor='#0e1a26',
+        font_color='white',
+        title={
+            'text': 'Top 20 Players by Goal Involvement per 90 Minutes',
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'color': 'white', 'size': 18}
+        },
+        xaxis=dict(
+            title='Goal Involvement per 90',
+            gridcolor='rgba(255,255,255,0.3)',
+            gridwidth=1,
+            color='white',
+            showgrid=True,
+            zeroline=False
+        ),
+        yaxis=dict(
+            title='',
+            color='white',
+            autorange='reversed'  # This inverts the y-axis like plt.gca().invert_yaxis()
+        ),
+        height=800
+    )
+
+    return fig
+
+
+# Analysis 3: Progressive Pass Recipients (Horizontal Bar Chart)
+def progressive_recipients():
+    df = load_data()
+
+    # Filter top 20 by received progressive passes
+    filt = df.sort_values(by='received_progressive_passes', ascending=False).head(20)
+
+    fig = go.Figure()
+
+    for i, idx in enumerate(filt.index):
+        player_data = filt.loc[idx]
+        player_name = player_data['name']
+        team = player_data['team'] if 'team' in player_data else "Unknown"
+        position = player_data['position'] if 'position' in player_data else "Unknown"
+        minutes = player_data['minutes']
+        recv_prog_passes = player_data['received_progressive_passes']
+        recv_per90 = player_data['recv_per']
+
+        fig.add_trace(go.Bar(
+            y=[player_name],
+            x=[recv_per90],
+            orientation='h',
+            marker_color='#00ff66',
+            name=player_name,
+            hovertemplate=f"""
+            Player: {player_name}<br>
+            Team: {team}<br>
+            Position: {position}<br>
+            Minutes: {minutes}<br>
+            Progressive Passes Received: {recv_prog_passes}<br>
+            Received per 90: {recv_per90:.2f}<br>
+            <extra></extra>
+            """,
+            showlegend=False
+        ))
+
+    fig.update_layout(
+        plot_bgcolor='#0e1a26',
+        paper_bgcolor='#0e1a26',
+        font_color='white',
+        title={
+            'text': 'Top 20 Recipients of Progressive Passes per 90',
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'color': 'white', 'size': 18}
+        },
+        xaxis=dict(
+            title='Received Progressive Passes per 90',
+            gridcolor='rgba(255,255,255,0.3)',
+            gridwidth=1,
+            color='white',
+            showgrid=True,
+            zeroline=False
+        ),
+        yaxis=dict(
+            title='',
+            color='white',
+            autorange='reversed'  # This inverts the y-axis
+        ),
+        height=800
+    )
+
+    return fig
@@ -0,0 +1,50 @@
+"""Landing page: the league table."""
+
+import streamlit as st
+
+from analytics.data import PARTITION_CACHE, load_standings, partitioned
+from analytics.dixon_coles import expected_points, fit
+from analytics.rankings import ratings
+
+
+# Add qualification zone indicators
+def get_zone_indicator(position):
+    if position <= 4:
+        return "🟢"  # Champions League
+    elif position <= 7:
+        return "🟠"  # Europa League
+    elif position >= 18:
+        return "🔴"  # Relegation
+    else:
+        return "⚪"  # Mid-table
+
+
+@partitioned
+@st.cache_data(max_entries=PARTITION_CACHE)
+def standings_table(partition=None):
+    """Standings as displayed: zone marker, power-ranking positions, expected points and short column names."""
+    table_data = load_standings().iloc[:, :9].copy()  # Get first 9 columns as specified
+
+    # Prepare data for display
+    display_data = table_data.copy()
+    display_data['Zone'] = display_data['rank'].apply(get_zone_indicator)
+    # Expected points from the match model, and how far the actual points are
+    # above them; left out until the model has a few matches per team
+    expected = fit().reliable()
+    if expected:
+        display_data = display_data.merge(expected_points(), on='team', how='left')
+        display_data['xpts'] = display_data['xpts'].round(1)
+        display_data['xpts_diff'] = (display_data['points'] - display_data['xpts']).round(1)
+    # Positions in the results-graph rankings
+    display_data = display_data.merge(ratings(), on='team', how='left')
+    columns = {
+        'Zone': '', 'rank': 'Pos', 'colley_rank': 'Colley', 'massey_rank': 'Massey',
+        'pagerank_rank': 'PageRank', 'team': 'Team', 'win': 'W', 'loss': 'L', 'draw': 'D',
+        'goals': 'GF', 'conceded': 'GA', 'points': 'Pts', 'xpts': 'xPts', 'xpts_diff': 'Pts - xPts',
+        'last5': 'Last 5',
+    }
+    if not expected:
+        del columns['xpts'], columns['xpts_diff']
+
+    # Rename columns for better display
+    return display_data[list(columns)].rename(columns=columns)
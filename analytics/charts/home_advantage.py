@@ -0,0 +1,54 @@
+"""Team Analysis: home advantage of every team, the selected one highlighted."""
+
+import plotly.graph_objects as go
+import streamlit as st
+
+from analytics.data import PARTITION_CACHE, partitioned
+from analytics.home_advantage import METRICS, by_team
+from analytics.resample import CONFIDENCE
+
+
+@partitioned
+@st.cache_resource(max_entries=PARTITION_CACHE * 32)
+def build_figure(team, metric="points", partition=None):
+    table = by_team().sort_values(metric)
+    label = METRICS[metric]
+    colors = ['#ff2d96' if name == team else '#4ac8ff' for name in table["team"]]
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=table[metric], y=table["team"], mode='markers', name='Home minus away',
+        marker=dict(color=colors, size=10),
+        error_x=dict(
+            type='data', symmetric=False, color='rgba(255,255,255,0.5)', thickness=1.5,
+            array=table[f"{metric}_high"] - table[metric],
+            arrayminus=table[metric] - table[f"{metric}_low"],
+        ),
+        customdata=table[[f"{metric}_low", f"{metric}_high", f"{metric}_shrunk"]],
+        hovertemplate=f"<b>%{{y}}</b><br>{label}, home minus away: %{{x:+.2f}}"
+                      f"<br>{CONFIDENCE:.0%} interval: %{{customdata[0]:+.2f}} to %{{customdata[1]:+.2f}}"
+                      "<br>Shrunk estimate: %{customdata[2]:+.2f}<extra></extra>"
+    ))
+    fig.add_trace(go.Scatter(
+        x=table[f"{metric}_shrunk"], y=table["team"], mode='markers', name='Shrunk to league',
+        marker=dict(color='#faff00', size=8, symbol='diamond'), hoverinfo='skip'
+    ))
+    fig.add_vline(x=0, line=dict(color='white', width=1, dash='dash'))
+
+    fig.update_layout(
+        plot_bgcolor='#0e1a26',
+        paper_bgcolor='#0e1a26',
+        font_color='white',
+        title={
+            'text': f'Home Advantage: {label}, Home minus Away',
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'color': 'white', 'size': 16}
+        },
+        xaxis=dict(title=label, gridcolor='rgba(255,255,255,0.3)', color='white', zeroline=False),
+        yaxis=dict(color='white', showgrid=False),
+        legend=dict(orientation='h', y=-0.15),
+        height=600
+    )
+
+    return fig
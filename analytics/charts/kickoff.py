@@ -0,0 +1,54 @@
+"""Kickoff Times: one metric by weekday or kickoff slot, with intervals."""
+
+import plotly.graph_objects as go
+import streamlit as st
+
+from analytics.data import PARTITION_CACHE, partitioned
+from analytics.kickoff import GROUPINGS, METRICS, effects
+from analytics.resample import CONFIDENCE
+
+DEFAULT_GROUPING = "Day"
+DEFAULT_METRIC = "goals"
+
+
+@partitioned
+@st.cache_resource(max_entries=PARTITION_CACHE * len(GROUPINGS) * len(METRICS))
+def build_figure(by, metric, partition=None):
+    table = effects(by)
+    label = METRICS[metric]
+
+    fig = go.Figure(go.Bar(
+        x=table.index, y=table[metric], marker_color='#4ac8ff',
+        error_y=dict(
+            type='data', symmetric=False, color='white', thickness=2,
+            array=table[f"{metric}_high"] - table[metric],
+            arrayminus=table[metric] - table[f"{metric}_low"],
+        ),
+        customdata=table[["matches", f"{metric}_low", f"{metric}_high"]],
+        hovertemplate=f"%{{x}}<br>{label}: %{{y:,.2f}}<br>{CONFIDENCE:.0%} interval: "
+                      "%{customdata[1]:,.2f} to %{customdata[2]:,.2f}<br>Matches: %{customdata[0]}<extra></extra>"
+    ))
+
+    fig.update_layout(
+        plot_bgcolor='#0e1a26',
+        paper_bgcolor='#0e1a26',
+        font_color='white',
+        title={
+            'text': f'{label} by {GROUPINGS[by]}',
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'color': 'white', 'size': 18}
+        },
+        xaxis=dict(title=GROUPINGS[by], color='white', showgrid=False),
+        yaxis=dict(
+            title=label,
+            gridcolor='rgba(255,255,255,0.3)',
+            gridwidth=1,
+            color='white',
+            showgrid=True,
+            zeroline=False
+        ),
+        height=500
+    )
+
+    return fig
@@ -0,0 +1,205 @@
+"""Ball Possession: carry volume, progression and distance."""
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from analytics.charts import POSITION_COLORS
+from analytics.data import PARTITION_CACHE, load_player_possession, load_player_stats, partitioned
+
+
+# Possession stats, and the same merged with progressive_carries from player_stats.csv
+@partitioned
+@st.cache_data(max_entries=PARTITION_CACHE)
+def load_data(partition=None):
+    df = load_player_possession()
+    player_df = load_player_stats()
+    merged_df = df.merge(
+        player_df[['name', 'progressive_carries','minutes']], 
+        left_on='player', 
+        right_on='name', 
+        how='left'
+    )
+    return df, merged_df
+
+
+@partitioned
+@st.cache_resource(max_entries=PARTITION_CACHE)
+def build_figures(partition=None):
+    return {
+        "carries scatter": carries_scatter(),
+        "distance bars": distance_bars(),
+    }
+
+
+# Carries Volume + Progressiveness
+def carries_scatter():
+    _, merged_df = load_data()
+
+    # Filter players with meaningful carry data (at least 50 carries) and valid progressive carries data
+    filt_carries = merged_df[(merged_df['carries'] >= 50) & (merged_df['progressive_carries']>10)&(merged_df['minutes']>1000)]
+
+    fig1 = go.Figure()
+
+    # Add scatter points by position
+    for position in filt_carries['position'].unique():
+        if pd.isna(position):
+            continue
+
+        pos_data = filt_carries[filt_carries['position'] == position]
+
+        fig1.add_trace(go.Scatter(
+            x=pos_data['carries'],
+            y=pos_data['progressive_carries'],
+            mode='markers+text',
+            marker=dict(
+                size=12,
+                color=POSITION_COLORS.get(position, '#ffffff'),
+                opacity=0.7,
+                line=dict(width=2, color='white')
+            ),
+            text=pos_data['player'],
+            textposition="top center",
+            textfont=dict(size=8, color='white'),
+            name=position,
+            customdata=np.column_stack((
+                pos_data['team'].values if 'team' in pos_data.columns else ['Unknown'] * len(pos_data),
+                pos_data['minutes'].values if 'minutes' in pos_data.columns else [0] * len(pos_data),
+                (pos_data['progressive_carries'] / pos_data['carries'] * 100).round(1).values
+            )),
+            hovertemplate="""
+            <b>%{text}</b><br>
+            Team: %{customdata[0]}<br>
+            Position: """ + position + """<br>
+            Total Carries: %{x}<br>
+            Progressive Carries: %{y}<br>
+            Progressive Rate: %{customdata[2]}%<br>
+            Minutes Played: %{customdata[1]}<br>
+            <extra></extra>
+            """
+        ))
+
+    # Add trend line
+    if len(filt_carries) > 10:  # Only if we have enough data points
+        z = np.polyfit(filt_carries['carries'], filt_carries['progressive_carries'], 1)
+        p = np.poly1d(z)
+
+        fig1.add_trace(go.Scatter(
+            x=sorted(filt_carries['carries']),
+            y=p(sorted(filt_carries['carries'])),
+            mode='lines',
+            name='Trend Line',
+            line=dict(color='white', width=2, dash='dash'),
+            showlegend=True
+        ))
+
+    fig1.update_layout(
+        plot_bgcolor='#0e1a26',
+        paper_bgcolor='#0e1a26',
+        font_color='white',
+        title={
+            'text': 'Ball Carries: Volume vs Progressive Impact',
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'color': 'white', 'size': 18}
+        },
+        xaxis=dict(
+            title='Total Carries (Volume)',
+            gridcolor='rgba(255,255,255,0.3)',
+            gridwidth=1,
+            color='white',
+            showgrid=True,
+            zeroline=False
+        ),
+        yaxis=dict(
+            title='Progressive Carries (Effectiveness)',
+            gridcolor='rgba(255,255,255,0.3)',
+            gridwidth=1,
+            color='white',
+            showgrid=True,
+            zeroline=False
+        ),
+        legend=dict(
+            bgcolor='rgba(255,255,255,0.2)',
+            bordercolor='white',
+            borderwidth=2,
+            font=dict(
+                color='white',
+                size=14,
+                family='Arial Black'
+            ),
+            itemsizing='constant'
+        ),
+        height=600
+    )
+
+    return fig1
+
+
+# Top Ball Carriers by Total Distance
+def distance_bars():
+    df, _ = load_data()
+
+    # Filter players with meaningful distance data and get top 25
+    filt_distance = df[df['total_distance_carried'] > 0].nlargest(25, 'total_distance_carried')
+
+    fig2 = go.Figure()
+
+    for i, idx in enumerate(filt_distance.index):
+        player_data = filt_distance.loc[idx]
+        player_name = player_data['player']
+        team = player_data['team'] if 'team' in player_data else "Unknown"
+        position = player_data['position'] if 'position' in player_data else "Unknown"
+        total_distance = player_data['total_distance_carried']
+        carries = player_data['carries']
+        minutes = player_data['minutes'] if 'minutes' in player_data else 0
+        avg_distance_per_carry = total_distance / carries if carries > 0 else 0
+
+        fig2.add_trace(go.Bar(
+            y=[player_name],
+            x=[total_distance],
+            orientation='h',
+            marker_color='#00ff66',
+            name=player_name,
+            customdata=np.column_stack([[carries], [minutes], [avg_distance_per_carry]]),
+            hovertemplate=f"""
+            Player: {player_name}<br>
+            Team: {team}<br>
+            Position: {position}<br>
+            Total Distance: {total_distance:,.0f}m<br>
+            Total Carries: {carries}<br>
+            Minutes: {minutes}<br>
+            Avg Distance/Carry: {avg_distance_per_carry:.1f}m<br>
+            <extra></extra>
+            """,
+            showlegend=False
+        ))
+
+    fig2.update_layout(
+        plot_bgcolor='#0e1a26',
+        paper_bgcolor='#0e1a26',
+        font_color='white',
+        title={
+            'text': 'Top 25 Ball Carriers by Total Distance Covered',
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'color': 'white', 'size': 18}
+        },
+        xaxis=dict(
+            title='Total Distance Carried (meters)',
+            gridcolor='rgba(255,255,255,0.3)',
+            gridwidth=1,
+            color='white',
+            showgrid=True,
+            zeroline=False
+        ),
+        yaxis=dict(
+            title='',
+            color='white',
+            autorange='reversed'
+        ),
+        height=800
+    )
+
+    return fig2
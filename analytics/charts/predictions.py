@@ -0,0 +1,69 @@
+"""Match Predictions: Dixon-Coles outcome probabilities and scoreline grids."""
+
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+
+from analytics import dixon_coles
+from analytics.data import PARTITION_CACHE, load_fixtures, partitioned
+
+# Scorelines shown on the heatmap (0..SHOWN_GOALS goals a side)
+SHOWN_GOALS = 6
+
+
+def default_matchup():
+    """The two highest-rated teams, the better one at home."""
+    ratings = dixon_coles.fit().ratings()
+    return ratings["team"].iloc[0], ratings["team"].iloc[1]
+
+
+@partitioned
+@st.cache_data(max_entries=PARTITION_CACHE)
+def next_fixtures(partition=None):
+    """The next gameweek's unplayed fixtures with their predictions.
+
+    Empty once every fixture of the season has a result.
+    """
+    fixtures = load_fixtures()
+    upcoming = fixtures[fixtures["HomeScore"].isna() | fixtures["AwayScore"].isna()]
+    if upcoming.empty:
+        return upcoming.iloc[:0, :0]
+    upcoming = upcoming[upcoming["week"] == upcoming["week"].min()]
+    # Every pairing is already predicted; the gameweek is a lookup
+    table = upcoming[["Date", "Time", "Home", "Away"]].merge(
+        dixon_coles.all_pairings(), on=["Home", "Away"], how="left",
+    )
+    return table.sort_values(["Date", "Time"], ignore_index=True)
+
+
+@partitioned
+@st.cache_resource(max_entries=PARTITION_CACHE * 32)
+def build_figure(home, away, partition=None):
+    """Heatmap of the home-away scoreline probabilities."""
+    grid = dixon_coles.predict(dixon_coles.fit(), [home], [away])[0]
+    shown = grid[:SHOWN_GOALS + 1, :SHOWN_GOALS + 1] * 100
+    goals = np.arange(SHOWN_GOALS + 1)
+
+    fig = go.Figure(go.Heatmap(
+        z=shown, x=goals, y=goals, colorscale='Viridis',
+        text=np.round(shown, 1), texttemplate="%{text}%",
+        colorbar=dict(title='%', tickfont=dict(color='white')),
+        hovertemplate=f"{home} %{{y}} - %{{x}} {away}<br>Probability: %{{z:.1f}}%<extra></extra>"
+    ))
+
+    fig.update_layout(
+        plot_bgcolor='#0e1a26',
+        paper_bgcolor='#0e1a26',
+        font_color='white',
+        title={
+            'text': f'Scoreline Probabilities: {home} vs {away}',
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'color': 'white', 'size': 18}
+        },
+        xaxis=dict(title=f'{away} goals', color='white', dtick=1),
+        yaxis=dict(title=f'{home} goals', color='white', dtick=1),
+        height=550
+    )
+
+    return fig
@@ -0,0 +1,186 @@
+"""Ball Progression: progressive passes vs carries per player."""
+
+import plotly.graph_objects as go
+import streamlit as st
+
+from analytics.charts import COLORS
+from analytics.data import PARTITION_CACHE, load_player_stats, partitioned
+
+
+# Create initial blank graph
+def create_blank_graph(view_type="Season Total"):
+    fig = go.Figure()
+    
+    x_title = f'Progression via Pass ({view_type})'
+    y_title = f'Progression via Carry ({view_type})'
+    title_text = f'Ball Progression {view_type} - Pass + Carry'
+    
+    fig.update_layout(
+        plot_bgcolor='#0e1a26',
+        paper_bgcolor='#0e1a26',
+        font_color='white',
+        title={
+            'text': title_text,
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'color': 'white', 'size': 16}
+        },
+        xaxis=dict(
+            title=x_title,
+            gridcolor='rgba(255,255,255,0.3)',
+            gridwidth=1,
+            color='white',
+            showgrid=True,
+            zeroline=False
+        ),
+        yaxis=dict(
+            title=y_title,
+            gridcolor='rgba(255,255,255,0.3)',
+            gridwidth=1,
+            color='white',
+            showgrid=True,
+            zeroline=False
+        ),
+        showlegend=False,
+        width=800,
+        height=500
+    )
+    
+    return fig
+
+# Position lists
+defenders = ["DF", "DF,MF", "MF,DF", "DF,FW"]
+midfielders = ["MF", "FW,MF", "DF,MF", "MF,DF", "MF,FW"]
+forwards = ["FW,MF", "FW", "FW,DF", "MF,FW", "DF,FW"]
+
+# Defaults of the page's controls: defenders only, season totals
+DEFAULT_POSITIONS = tuple(defenders)
+DEFAULT_SLIDERS = (500, 30, 20)
+
+
+# Build the scatter for one combination of filters. Cached so that moving a
+# slider back to a previous value doesn't rebuild the figure.
+@partitioned
+@st.cache_resource(max_entries=PARTITION_CACHE * 64)
+def build_progression_graph(selected_positions, per_90_mode, mins, min_prog_pass, min_prog_carry, partition=None):
+    df = load_player_stats()
+
+    # Assigning the Filter with all parameters including position selection
+    filt = df.loc[
+        df["position"].isin(selected_positions)
+        & (df["minutes"] >= mins)
+        & (df["progressive_passes"] >= min_prog_pass)
+        & (df["progressive_carries"] >= min_prog_carry)
+    ]
+
+    # No players match the selected criteria
+    if filt.empty:
+        return None
+
+    # Determine x and y values based on checkbox state
+    if per_90_mode:
+        # Calculate per 90 values
+        filt = filt.copy()  # Avoid SettingWithCopyWarning
+        filt["progressive_passes_per90"] = (
+            (filt["progressive_passes"] / filt["minutes"]) * 90
+        ).round(2)
+        filt["progressive_carries_per90"] = (
+            (filt["progressive_carries"] / filt["minutes"]) * 90
+        ).round(2)
+        
+        x = filt["progressive_passes_per90"]
+        y = filt["progressive_carries_per90"]
+        x_title = "Progression via Pass (Per 90)"
+        y_title = "Progression via Carry (Per 90)"
+        title_text = "Ball Progression Per 90 - Pass + Carry"
+        value_suffix = " (Per 90)"
+    else:
+        x = filt["progressive_passes"]
+        y = filt["progressive_carries"]
+        x_title = "Progression via Pass (Season Total)"
+        y_title = "Progression via Carry (Season Total)"
+        title_text = "Ball Progression - Pass + Carry"
+        value_suffix = ""
+
+    # Creating & Designing the Interactive Scatter Plot with Plotly
+    # Create the plotly figure
+    fig = go.Figure()
+    
+    # Add scatter points with hover information
+    for i, idx in enumerate(filt.index):
+        player_name = filt.loc[idx, "name"]
+        team = filt.loc[idx, "team"] if "team" in filt.columns else "Unknown"
+        position = filt.loc[idx, "position"]
+        minutes = filt.loc[idx, "minutes"]
+        
+        fig.add_trace(go.Scatter(
+            x=[x.iloc[i]],
+            y=[y.iloc[i]],
+            mode='markers+text',
+            marker=dict(
+                color=COLORS[i % len(COLORS)],
+                size=8,
+                line=dict(width=1, color='rgba(255,255,255,0.3)')
+            ),
+            text=player_name,
+            textposition="top center",
+            textfont=dict(
+                size=16,
+                color='white'
+            ),
+            name=player_name,
+            hovertemplate=f"""
+            Player Name: {player_name}<br>
+            Team: {team}<br>
+            Position: {position}<br>
+            Minutes: {minutes}<br>
+            Progressive Passes{value_suffix}: {x.iloc[i]}<br>
+            Progressive Carries{value_suffix}: {y.iloc[i]}<br>
+            <extra></extra>
+            """,
+            showlegend=False
+        ))
+    
+    # Update layout to match matplotlib styling
+    fig.update_layout(
+        plot_bgcolor='#0e1a26',
+        paper_bgcolor='#0e1a26',
+        font_color='white',
+        title={
+            'text': title_text,
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'color': 'white', 'size': 18}
+        },
+        xaxis=dict(
+            title=x_title,
+            gridcolor='rgba(255,255,255,0.3)',
+            gridwidth=1,
+            color='white',
+            showgrid=True,
+            zeroline=False
+        ),
+        yaxis=dict(
+            title=y_title,
+            gridcolor='rgba(255,255,255,0.3)',
+            gridwidth=1,
+            color='white',
+            showgrid=True,
+            zeroline=False
+        ),
+        hovermode='closest',
+        width=800,
+        height=500
+    )
+    
+    # Add hover effects for text enlargement
+    fig.update_traces(
+        hoverlabel=dict(
+            bgcolor="rgba(0,0,0,0.8)",
+            bordercolor="white",
+            font_size=12,
+            font_color="white"
+        )
+    )
+
+    return fig
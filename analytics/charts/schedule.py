@@ -0,0 +1,71 @@
+"""Fixture Difficulty: team x gameweek heatmap and strength of schedule."""
+
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+
+from analytics.data import PARTITION_CACHE, load_standings, partitioned
+from analytics.schedule import difficulty, fixture_grid, played_grid
+
+
+def short_name(team):
+    """Three-letter code: 'Arsenal' -> 'ARS', 'Aston Villa' -> 'AVI'."""
+    words = team.replace("'", "").split()
+    code = words[0][:3] if len(words) == 1 else words[0][0] + words[1][:2]
+    return code.upper()
+
+
+def team_order(teams):
+    """Rows in table order; teams missing from the standings go last."""
+    ranks = load_standings().set_index("team")["rank"]
+    return sorted(range(len(teams)), key=lambda i: (ranks.get(teams[i], len(teams) + 1), teams[i]))
+
+
+@partitioned
+@st.cache_resource(max_entries=PARTITION_CACHE)
+def build_figure(partition=None):
+    grid = fixture_grid()
+    order = team_order(grid.teams)
+    cells = difficulty()[order]
+    opponent = grid.opponent[order]
+    home = grid.home[order]
+    played = played_grid()[order]
+    teams = [grid.teams[i] for i in order]
+
+    # Opponent code, upper case at home and lower case away
+    codes = np.array([short_name(team) for team in grid.teams] + [""])
+    text = np.where(home, codes[opponent], np.char.lower(codes[opponent]))
+    names = np.array(grid.teams + [""])[opponent]
+    venue = np.where(home, "home", "away")
+    status = np.where(played, "played", "upcoming")
+
+    fig = go.Figure(go.Heatmap(
+        z=cells, x=grid.weeks, y=teams, text=text, texttemplate="%{text}",
+        customdata=np.dstack([names, venue, status]),
+        colorscale=[[0, '#00ff66'], [0.5, '#faff00'], [1, '#ff4d4d']], zmin=0, zmax=3,
+        colorbar=dict(title="Difficulty", tickfont=dict(color='white')),
+        hovertemplate="%{y}, GW %{x}: %{customdata[0]} (%{customdata[1]}, %{customdata[2]})"
+                      "<br>Difficulty: %{z:.2f}<extra></extra>"
+    ))
+
+    # Mark the first gameweek with unplayed fixtures
+    upcoming = np.flatnonzero(((opponent >= 0) & ~played).any(axis=0))
+    if len(upcoming):
+        fig.add_vline(x=grid.weeks[upcoming[0]] - 0.5, line=dict(color='white', width=2, dash='dash'))
+
+    fig.update_layout(
+        plot_bgcolor='#0e1a26',
+        paper_bgcolor='#0e1a26',
+        font_color='white',
+        title={
+            'text': 'Fixture Difficulty by Gameweek',
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'color': 'white', 'size': 18}
+        },
+        xaxis=dict(title='Gameweek', color='white', dtick=1, showgrid=False),
+        yaxis=dict(color='white', autorange='reversed', showgrid=False),
+        height=max(500, 28 * len(teams))
+    )
+
+    return fig
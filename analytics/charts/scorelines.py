@@ -0,0 +1,74 @@
+"""Scorelines: heatmaps sliced from the scoreline cube."""
+
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+
+from analytics.data import PARTITION_CACHE, partitioned
+from analytics.scorelines import MAX_GOALS, SIDES, cube
+
+LAYOUT = dict(
+    plot_bgcolor='#0e1a26',
+    paper_bgcolor='#0e1a26',
+    font_color='white',
+)
+
+
+def _title(text):
+    return {'text': text, 'x': 0.5, 'xanchor': 'center', 'font': {'color': 'white', 'size': 18}}
+
+
+def goal_labels(count):
+    return [str(goals) for goals in range(count - 1)] + [f"{count - 1}+"]
+
+
+@partitioned
+@st.cache_resource(max_entries=PARTITION_CACHE * 64)
+def build_figure(team=None, side=None, weeks=None, partition=None):
+    """Home x away scoreline frequencies of one slice of the cube."""
+    grid = cube().scorelines(team, side, weeks)
+    total = grid.sum()
+    share = grid / total * 100 if total else grid.astype(float)
+    labels = goal_labels(MAX_GOALS + 1)
+    subject = team or "All matches"
+    if team and side is not None:
+        subject += f", {SIDES[side].lower()}"
+
+    fig = go.Figure(go.Heatmap(
+        z=share, x=labels, y=labels, colorscale='Viridis', customdata=grid,
+        text=np.where(grid > 0, grid.astype(str), ""), texttemplate="%{text}",
+        colorbar=dict(title='% of matches', tickfont=dict(color='white')),
+        hovertemplate="Home %{y} - %{x} Away<br>Matches: %{customdata}<br>Share: %{z:.1f}%<extra></extra>"
+    ))
+    fig.update_layout(
+        **LAYOUT,
+        title=_title(f'Scorelines: {subject} ({total} matches)'),
+        xaxis=dict(title='Away goals', color='white', showgrid=False),
+        yaxis=dict(title='Home goals', color='white', showgrid=False),
+        height=550
+    )
+    return fig
+
+
+@partitioned
+@st.cache_resource(max_entries=PARTITION_CACHE)
+def build_total_goals_figure(partition=None):
+    """Gameweek x total goals match counts."""
+    scorelines = cube()
+    counts = scorelines.total_goals()
+    # Drop the empty high-scoring columns
+    last = max(int(np.flatnonzero(counts.sum(axis=0)).max(initial=0)) + 1, 1)
+
+    fig = go.Figure(go.Heatmap(
+        z=counts[:, :last].T, x=scorelines.weeks, y=[str(goals) for goals in range(last)],
+        colorscale='Viridis', colorbar=dict(title='Matches', tickfont=dict(color='white')),
+        hovertemplate="GW %{x}: %{z} match(es) with %{y} goals<extra></extra>"
+    ))
+    fig.update_layout(
+        **LAYOUT,
+        title=_title('Total Goals per Match by Gameweek'),
+        xaxis=dict(title='Gameweek', color='white', dtick=1, showgrid=False),
+        yaxis=dict(title='Total goals', color='white', showgrid=False),
+        height=450
+    )
+    return fig
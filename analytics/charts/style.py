@@ -0,0 +1,111 @@
+"""Team Style: dendrogram and similarity heatmap of team fingerprints."""
+
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+
+from analytics.data import PARTITION_CACHE, season_label
+from analytics.style import fingerprints, leaf_order, linkage, similarity, versioned
+
+# The league scope covers the latest seasons only, to keep the charts legible
+MAX_SEASONS = 10
+SCOPES = {"season": "This season", "league": f"This league, last {MAX_SEASONS} seasons"}
+
+LAYOUT = dict(
+    plot_bgcolor='#0e1a26',
+    paper_bgcolor='#0e1a26',
+    font_color='white',
+)
+
+
+def rows(scope, selected):
+    """Positions of the team-seasons in ``scope`` around the (league, season) ``selected``."""
+    teams, _ = fingerprints()
+    mask = teams["league"] == selected[0]
+    if scope == "season":
+        mask &= teams["season"] == selected[1]
+    else:
+        latest = sorted(teams.loc[mask, "season"].unique())[-MAX_SEASONS:]
+        mask &= teams["season"].isin(latest)
+    return np.flatnonzero(mask.to_numpy())
+
+
+def row_labels(scope, positions):
+    teams, _ = fingerprints()
+    picked = teams.iloc[positions]
+    if scope == "season":
+        return picked["team"].tolist()
+    return [f"{team} {season_label(season)}" for team, season in zip(picked["team"], picked["season"])]
+
+
+@versioned
+@st.cache_resource(max_entries=PARTITION_CACHE * 4)
+def build_figures(scope, selected, datasets=None):
+    positions = rows(scope, selected)
+    labels = row_labels(scope, positions)
+    S = similarity()[np.ix_(positions, positions)]
+    Z = linkage(np.clip(1 - S, 0, None))
+    order = leaf_order(Z)
+    return {
+        "dendrogram": dendrogram(Z, order, labels),
+        "similarity": heatmap(S, order, labels),
+    }
+
+
+def dendrogram(Z, order, labels):
+    """Horizontal dendrogram drawn as one line trace."""
+    n = len(order)
+    y = np.empty(2 * n - 1)
+    y[order] = np.arange(n)
+    x = np.zeros(2 * n - 1)
+    xs, ys = [], []
+    for k, (left, right, height, _) in enumerate(Z):
+        left, right = int(left), int(right)
+        y[n + k] = (y[left] + y[right]) / 2
+        x[n + k] = height
+        xs += [x[left], height, height, x[right], None]
+        ys += [y[left], y[left], y[right], y[right], None]
+
+    fig = go.Figure(go.Scatter(
+        x=xs, y=ys, mode='lines', line=dict(color='#90EE90', width=2), hoverinfo='skip',
+    ))
+    fig.update_layout(
+        **LAYOUT,
+        title={
+            'text': 'Style Clusters (average linkage, cosine distance)',
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'color': 'white', 'size': 18}
+        },
+        xaxis=dict(title='Distance (1 - similarity)', gridcolor='rgba(255,255,255,0.3)', color='white', zeroline=False),
+        yaxis=dict(
+            tickmode='array', tickvals=list(range(n)), ticktext=[labels[i] for i in order],
+            color='white', showgrid=False, zeroline=False,
+        ),
+        height=max(500, 22 * n),
+        showlegend=False
+    )
+    return fig
+
+
+def heatmap(S, order, labels):
+    """Similarity matrix in dendrogram order, as one heatmap trace."""
+    names = [labels[i] for i in order]
+    fig = go.Figure(go.Heatmap(
+        z=S[np.ix_(order, order)], x=names, y=names, colorscale='RdBu', zmid=0, zmin=-1, zmax=1,
+        colorbar=dict(title='Similarity', tickfont=dict(color='white')),
+        hovertemplate="%{y} vs %{x}<br>Similarity: %{z:.2f}<extra></extra>"
+    ))
+    fig.update_layout(
+        **LAYOUT,
+        title={
+            'text': 'Style Similarity',
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'color': 'white', 'size': 18}
+        },
+        xaxis=dict(color='white', showgrid=False, tickangle=-45),
+        yaxis=dict(color='white', showgrid=False, autorange='reversed'),
+        height=max(550, 22 * len(names))
+    )
+    return fig
@@ -0,0 +1,419 @@
+"""Team Analysis: every chart for one team, built together and cached per team."""
+
+import plotly.graph_objects as go
+import streamlit as st
+
+from analytics.data import (
+    PARTITION_CACHE,
+    load_player_possession,
+    load_player_stats,
+    load_team_possession,
+    load_team_stats,
+    partitioned,
+)
+
+DEFAULT_TEAM = "Liverpool"
+
+# Position groups of the ternary plots
+defenders = ["DF","DF,MF","MF,DF","DF,FW"]
+midfielders = ["MF","FW,MF","DF,MF","MF,DF","MF,FW"]
+forwards = ["FW", "FW,MF", "MF,FW","FW,DF","DF,FW"]
+
+TERNARY_GROUPS = [
+    ("defenders", defenders, "Defenders", "#4ac8ff"),
+    ("midfielders", midfielders, "Midfielders", "#00ff66"),
+    ("forwards", forwards, "Forwards", "#ff2d96"),
+]
+
+
+@partitioned
+@st.cache_resource(max_entries=PARTITION_CACHE * 32)
+def build_figures(team, partition=None):
+    """Map of chart name -> figure (None when the data for it is missing)."""
+    df = load_player_stats()
+    team_data = df[df["team"] == team].copy()
+    team_stats = load_team_stats()
+    team_stats = team_stats[team_stats["team"] == team].copy()
+    pl = load_player_possession()
+    possession_data = pl[pl["team"] == team].copy()
+
+    figures = {
+        "goals vs xG": goals_vs_xg(team_stats),
+        "possession": possession(team_stats),
+        "squad composition": squad_composition(team, team_data),
+        "dribblers": dribblers(possession_data),
+        "carriers": carriers(team_data),
+        "receivers": receivers(team_data),
+    }
+
+    team_possession_df = load_team_possession()
+    team_possession_data = team_possession_df[team_possession_df["team"] == team]
+    for key, group, name, color in TERNARY_GROUPS:
+        figures[f"ternary: {key}"] = (
+            ternary_plot(possession_data, team_possession_data, group, name, color)
+            if not team_possession_data.empty else None
+        )
+
+    figures["carries contribution"] = carries_contribution(team_data, team_stats)
+    figures["passes contribution"] = passes_contribution(team_data, team_stats)
+    return figures
+
+
+def goals_vs_xg(team_stats):
+    if "goals" not in team_stats.columns or team_stats.empty:
+        return None
+    goals = int(team_stats["goals"].iloc[0])
+    xg = float(team_stats["expected_goals"].iloc[0])
+
+    fig = go.Figure(
+        data=[
+            go.Bar(
+                x=["Goals"],
+                y=[int(goals)],
+                marker_color="blue",
+                text=[goals],
+                textposition="outside",
+                name="Goals",
+            ),
+            go.Bar(
+                x=["Expected Goals"],
+                y=[int(xg)],
+                marker_color="orange",
+                text=xg,
+                textposition="outside",
+                name="xG",
+            ),
+        ]
+    )
+    # Layout settings
+    fig.update_layout(
+        barmode="group",  # side-by-side bars
+        showlegend=False,
+        yaxis=dict(showticklabels=False, visible=False),
+        xaxis=dict(showticklabels=True, tickfont=dict(size=14)),
+        margin=dict(l=10, r=10, t=30, b=30),
+        height=400,
+        width=300,
+    )
+    return fig
+
+
+def possession(team_stats):
+    if "possession" not in team_stats.columns or team_stats.empty:
+        return None
+    possession_per = float(team_stats["possession"].iloc[0])
+    fig = go.Figure(
+        data=[
+            go.Pie(
+                values=[possession_per, 100 - possession_per],
+                labels=["Possession", "Non-possession"],
+                marker=dict(colors=["#57D457", "gray"]),
+                hole=0.4,
+                textinfo="none",
+                hoverinfo="label+value",
+                sort=False,
+                direction="clockwise",
+            )
+        ]
+    )
+    fig.update_layout(
+        showlegend=False,
+        margin=dict(t=0, b=0, l=0, r=0),
+        height=250,
+        width=250,
+    )
+    return fig
+
+
+def squad_composition(team, team_data):
+    if "position" not in team_data.columns:
+        return None
+
+    # Position distribution
+    position_counts = team_data["position"].value_counts()
+
+    fig = go.Figure(
+        data=[
+            go.Bar(
+                x=position_counts.index,
+                y=position_counts.values,
+                marker_color="#37003c",
+                text=position_counts.values,
+                textposition="auto",
+            )
+        ]
+    )
+
+    fig.update_layout(
+        title=f"{team} - Players by Position",
+        xaxis_title="Position",
+        yaxis_title="Number of Players",
+        plot_bgcolor="white",
+        height=400,
+    )
+    return fig
+
+
+# Top 5 Dribblers (Take-on Success Rate)
+def dribblers(possession_data):
+    if "take_on_success_rate" in possession_data.columns:
+        return None
+    possession_data = possession_data.copy()
+    possession_data["take_on_success_rate"] = (
+        possession_data["successful_take_ons"]
+        / possession_data["attempted_take_ons"]
+    )
+    top_dribblers = possession_data.nlargest(5, "successful_take_ons")[
+        ["player", "take_on_success_rate", "attempted_take_ons"]
+    ]
+    if top_dribblers.empty:
+        return None
+
+    fig_dribblers = go.Figure()
+    fig_dribblers.add_trace(
+        go.Bar(
+            y=top_dribblers["player"],
+            x=top_dribblers["take_on_success_rate"],
+            orientation="h",
+            marker_color="#ff2d96",
+            text=[
+                f"{rate:.1%}"
+                for rate in top_dribblers["take_on_success_rate"]
+            ],
+            textposition="auto",
+            customdata=top_dribblers["attempted_take_ons"],
+            hovertemplate="<b>%{y}</b><br>Success Rate: %{x:.1%}<br>Attempts: %{customdata}<extra></extra>",
+        )
+    )
+
+    fig_dribblers.update_layout(
+        title="Top 5 Dribblers",
+        xaxis_title="Success Rate",
+        height=300,
+        plot_bgcolor="white",
+        showlegend=False,
+    )
+    return fig_dribblers
+
+
+# Top 5 Progressive Carriers
+def carriers(team_data):
+    if "progressive_carries" not in team_data.columns:
+        return None
+    top_carriers = team_data.nlargest(5, "progressive_carries")[
+        ["name", "progressive_carries", "position"]
+    ]
+    if top_carriers.empty:
+        return None
+
+    fig_carriers = go.Figure()
+    fig_carriers.add_trace(
+        go.Bar(
+            y=top_carriers["name"],
+            x=top_carriers["progressive_carries"],
+            orientation="h",
+            marker_color="#00ff66",
+            text=top_carriers["progressive_carries"],
+            textposition="auto",
+            customdata=top_carriers["position"],
+            hovertemplate="<b>%{y}</b><br>Progressive Carries: %{x}<br>Position: %{customdata}<extra></extra>",
+        )
+    )
+
+    fig_carriers.update_layout(
+        title="Top 5 Progressive Carriers",
+        xaxis_title="Progressive Carries",
+        height=300,
+        plot_bgcolor="white",
+        showlegend=False,
+    )
+    return fig_carriers
+
+
+# Top 5 Progressive Pass Recipients
+def receivers(team_data):
+    if "received_progressive_passes" not in team_data.columns:
+        return None
+    top_receivers = team_data.nlargest(5, "received_progressive_passes")[
+        ["name", "received_progressive_passes", "position"]
+    ]
+    if top_receivers.empty:
+        return None
+
+    fig_receivers = go.Figure()
+    fig_receivers.add_trace(
+        go.Bar(
+            y=top_receivers["name"],
+            x=top_receivers["received_progressive_passes"],
+            orientation="h",
+            marker_color="#4ac8ff",
+            text=top_receivers["received_progressive_passes"],
+            textposition="auto",
+            customdata=top_receivers["position"],
+            hovertemplate="<b>%{y}</b><br>Received: %{x}<br>Position: %{customdata}<extra></extra>",
+        )
+    )
+
+    fig_receivers.update_layout(
+        title="Top 5 Progressive Pass Recipients",
+        xaxis_title="Progressive Passes Received",
+        height=300,
+        plot_bgcolor="white",
+        showlegend=False,
+    )
+    return fig_receivers
+
+
+# Ternary plot of where one position group takes its touches
+def ternary_plot(possession_data, team_possession_data, position_group, group_name, color_palette):
+    # plotly.express is slow to import and only needed here
+    import plotly.express as px
+
+    # Get team totals
+    team_totals = team_possession_data.iloc[0]
+    team_def = team_totals["deffensive_touches"]
+    team_mid = team_totals["middle_touches"]
+    team_att = team_totals["attacking_touches"]
+    team_total_touches = team_totals["touches"]
+
+    filtered = possession_data[possession_data["position"].isin(position_group)].copy()
+    filtered = filtered[filtered["touches"] > 0]  # Avoid div-by-zero
+
+    if filtered.empty:
+        return None
+
+    # Normalize for ternary plot
+    filtered["def_pct"] = filtered["deffensive_touches"] / filtered["touches"]
+    filtered["mid_pct"] = filtered["middle_touches"] / filtered["touches"]
+    filtered["att_pct"] = filtered["attacking_touches"] / filtered["touches"]
+
+    # Compute % contribution to team by each player
+    filtered["def_contrib_pct"] = (filtered["deffensive_touches"] / team_def * 100).round(2)
+    filtered["mid_contrib_pct"] = (filtered["middle_touches"] / team_mid * 100).round(2)
+    filtered["att_contrib_pct"] = (filtered["attacking_touches"] / team_att * 100).round(2)
+    filtered["touch_contrib_pct"] = (filtered["touches"] / team_total_touches * 100).round(2)
+
+    # Custom hover text
+    filtered["hover_text"] = (
+        filtered["player"] + "<br><br>" +
+        "Defensive Touches: " + filtered["deffensive_touches"].astype(str) + "<br>" +
+        "→ " + filtered["def_contrib_pct"].astype(str) + "% of team total<br>" +
+        "Middle Touches: " + filtered["middle_touches"].astype(str) + "<br>" +
+        "→ " + filtered["mid_contrib_pct"].astype(str) + "% of team total<br>" +
+        "Attacking Touches: " + filtered["attacking_touches"].astype(str) + "<br>" +
+        "→ " + filtered["att_contrib_pct"].astype(str) + "% of team total<br><br>" +
+        "Total Touches: " + filtered["touches"].astype(str) + "<br>" +
+        "→ " + filtered["touch_contrib_pct"].astype(str) + "% of team total"
+    )
+
+    # Create ternary plot
+    fig = px.scatter_ternary(
+        filtered,
+        a="def_pct",
+        b="mid_pct",
+        c="att_pct",
+        size="touches",
+        color_discrete_sequence=[color_palette],
+        hover_name="player",
+        custom_data=["hover_text"]
+    )
+
+    fig.update_traces(
+        hovertemplate="%{customdata[0]}<extra></extra>"
+    )
+
+    fig.update_layout(
+        title=f"{group_name}",
+        ternary=dict(
+            sum=1,
+            aaxis_title="Defensive %",
+            baxis_title="Middle %",
+            caxis_title="Attacking %"
+        ),
+        height=400,
+        plot_bgcolor='#0e1a26',
+        paper_bgcolor='#0e1a26',
+        font_color='white'
+    )
+
+    return fig
+
+
+# Progressive Carries Contribution
+def carries_contribution(team_data, team_stats):
+    if team_stats.empty or not (
+        "progressive_carries" in team_data.columns
+        and "progressive_carries" in team_stats.columns
+    ):
+        return None
+    team_total_prog_carries = team_stats["progressive_carries"].iloc[0]
+    team_data = team_data.copy()
+    team_data["prog_carries_pct"] = (
+        team_data["progressive_carries"] / team_total_prog_carries * 100
+    ).round(1)
+
+    # Get top 10 contributors
+    top_prog_carries = team_data.nlargest(10, "prog_carries_pct")[
+        ["name", "prog_carries_pct", "progressive_carries"]
+    ]
+
+    fig_prog_carries = go.Figure()
+    fig_prog_carries.add_trace(
+        go.Bar(
+            y=top_prog_carries["name"],
+            x=top_prog_carries["prog_carries_pct"],
+            orientation="h",
+            marker_color="#ff7300",
+            customdata=top_prog_carries["progressive_carries"],
+            hovertemplate="<b>%{y}</b><br>Contribution: %{x}%<br>Actual Carries: %{customdata}<extra></extra>",
+        )
+    )
+
+    fig_prog_carries.update_layout(
+        title="Progressive Carries Contribution (%)",
+        xaxis_title="Percentage of Team Total",
+        height=500,
+        plot_bgcolor="white",
+        showlegend=False,
+    )
+    return fig_prog_carries
+
+
+# Progressive Passes Contribution
+def passes_contribution(team_data, team_stats):
+    if team_stats.empty or not (
+        "progressive_passes" in team_data.columns
+        and "progressive_passes" in team_stats.columns
+    ):
+        return None
+    team_total_prog_passes = team_stats["progressive_passes"].iloc[0]
+    team_data = team_data.copy()
+    team_data["prog_passes_pct"] = (
+        team_data["progressive_passes"] / team_total_prog_passes * 100
+    ).round(1)
+
+    # Get top 10 contributors
+    top_prog_passes = team_data.nlargest(10, "prog_passes_pct")[
+        ["name", "prog_passes_pct", "progressive_passes"]
+    ]
+
+    fig_prog_passes = go.Figure()
+    fig_prog_passes.add_trace(
+        go.Bar(
+            y=top_prog_passes["name"],
+            x=top_prog_passes["prog_passes_pct"],
+            orientation="h",
+            marker_color="#c77dff",
+            customdata=top_prog_passes["progressive_passes"],
+            hovertemplate="<b>%{y}</b><br>Contribution: %{x}%<br>Actual Passes: %{customdata}<extra></extra>",
+        )
+    )
+
+    fig_prog_passes.update_layout(
+        title="Progressive Passes Contribution (%)",
+        xaxis_title="Percentage of Team Total",
+        height=500,
+        plot_bgcolor="white",
+        showlegend=False,
+    )
+    return fig_prog_passes
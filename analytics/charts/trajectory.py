@@ -0,0 +1,89 @@
+"""Player Trajectories: career lines over the league's age-curve percentiles."""
+
+import plotly.graph_objects as go
+import streamlit as st
+
+from analytics.charts import COLORS
+from analytics.data import PARTITION_CACHE
+from analytics.trajectories import METRIC_LABELS, age_percentiles, build, career, versioned
+
+DEFAULT_METRIC = "goals"
+DEFAULT_MIN_MINUTES = 450
+
+# (low, high, opacity) of the shaded percentile bands
+BANDS = [(0.1, 0.9, 0.15), (0.25, 0.75, 0.3)]
+
+
+def default_players(league, count=3):
+    """The top scorers of the league's latest season."""
+    players, careers = build(league)
+    goals = careers[(careers["metric"] == "goals") & (careers["season"] == careers["season"].max())]
+    return tuple(int(player_id) for player_id in goals.nlargest(count, "value")["player_id"])
+
+
+@versioned
+@st.cache_resource(max_entries=PARTITION_CACHE * 64)
+def build_figure(league, metric, per_90, min_minutes, player_ids, seasons=None):
+    bands = age_percentiles(league, metric, per_90, min_minutes)
+    players, _ = build(league)
+    unit = " per 90" if per_90 else ""
+    label = METRIC_LABELS[metric] + unit
+
+    fig = go.Figure()
+    for low, high, opacity in BANDS:
+        fig.add_trace(go.Scatter(
+            x=bands.index, y=bands[high], mode='lines', line=dict(width=0),
+            hoverinfo='skip', showlegend=False
+        ))
+        fig.add_trace(go.Scatter(
+            x=bands.index, y=bands[low], mode='lines', line=dict(width=0),
+            fill='tonexty', fillcolor=f'rgba(144,238,144,{opacity})',
+            name=f'P{int(low * 100)}-P{int(high * 100)}', hoverinfo='skip'
+        ))
+    fig.add_trace(go.Scatter(
+        x=bands.index, y=bands[0.5], mode='lines', name='Median',
+        line=dict(color='#90EE90', width=2, dash='dash'),
+        hovertemplate="Age %{x}<br>Median: %{y:.2f}<extra></extra>"
+    ))
+
+    rows = career(league, player_ids, metric, per_90)
+    for i, player_id in enumerate(player_ids):
+        player_rows = rows[rows["player_id"] == player_id]
+        name = players.loc[player_id, "name"]
+        fig.add_trace(go.Scatter(
+            x=player_rows["age"], y=player_rows["value"], mode='lines+markers', name=name,
+            line=dict(color=COLORS[i % len(COLORS)], width=3), marker=dict(size=9),
+            customdata=player_rows["season"],
+            hovertemplate=f"<b>{name}</b><br>Season: %{{customdata}}<br>Age: %{{x}}<br>{label}: %{{y:.2f}}<extra></extra>"
+        ))
+
+    fig.update_layout(
+        plot_bgcolor='#0e1a26',
+        paper_bgcolor='#0e1a26',
+        font_color='white',
+        title={
+            'text': f'{label} by Age: Careers vs League Percentiles',
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'color': 'white', 'size': 18}
+        },
+        xaxis=dict(
+            title='Age',
+            gridcolor='rgba(255,255,255,0.3)',
+            gridwidth=1,
+            color='white',
+            showgrid=True,
+            zeroline=False
+        ),
+        yaxis=dict(
+            title=label,
+            gridcolor='rgba(255,255,255,0.3)',
+            gridwidth=1,
+            color='white',
+            showgrid=True,
+            zeroline=False
+        ),
+        height=600
+    )
+
+    return fig
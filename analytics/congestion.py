@@ -0,0 +1,119 @@
+"""Fixture congestion: days of rest before each match.
+
+Each fixture is split into its two team-matches, sorted by (season, team,
+kickoff) with one ``np.lexsort``, and a team's rest is the kickoff gap to
+the previous row where the team and season are unchanged, so there is no
+per-team loop however many seasons are loaded. Only league fixtures are
+in the data, so cup and European matches don't count as a previous match.
+
+Everything is keyed on a tuple of (league, season, version) datasets: the
+current season alone, or every season of its league (``scoped()``).
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from analytics.data import PARTITION_CACHE, current, data_path, dataset
+from analytics.trajectories import datasets as league_datasets
+
+SCOPES = {"season": "This season", "league": "Every season of this league"}
+
+# Rest differentials beyond this many days are grouped together
+MAX_DIFFERENTIAL = 3
+# Rest days are binned from SHORT_REST to LONG_REST
+SHORT_REST, LONG_REST = 3, 8
+
+
+def scoped(scope):
+    """The datasets covered by ``scope`` around the current season."""
+    if scope == "season":
+        return (dataset(),)
+    return league_datasets(current()[0])
+
+
+def _season(partition):
+    df = pd.read_csv(
+        data_path("fixtures.csv", partition),
+        usecols=["Date", "Time", "Home", "HomeScore", "Away", "AwayScore"],
+    )
+    df["season"] = partition[1]
+    return df.dropna(subset=["HomeScore", "AwayScore"])
+
+
+@st.cache_data(max_entries=PARTITION_CACHE)
+def matches(datasets):
+    """Played fixtures with kickoff and both sides' rest days."""
+    df = pd.concat([_season(partition) for partition in datasets], ignore_index=True)
+    df["kickoff"] = pd.to_datetime(df["Date"] + " " + df["Time"].fillna("15:00"))
+    n = len(df)
+
+    # Both team-matches of every fixture: home sides first, then away sides
+    team = pd.Categorical(pd.concat([df["Home"], df["Away"]])).codes
+    season = np.tile(pd.Categorical(df["season"]).codes, 2)
+    kickoff = np.tile(df["kickoff"].to_numpy("datetime64[m]").astype(np.int64), 2)
+
+    order = np.lexsort((kickoff, team, season))
+    gap = np.diff(kickoff[order]) / (24 * 60)
+    same = (np.diff(team[order]) == 0) & (np.diff(season[order]) == 0)
+    rest = np.empty(2 * n)
+    rest[order] = np.concatenate([[np.nan], np.where(same, gap, np.nan)])
+
+    df["home_rest"], df["away_rest"] = rest[:n], rest[n:]
+    df["rest_diff"] = df["home_rest"] - df["away_rest"]
+    return df
+
+
+def team_matches(df):
+    """One row per team per match, from that team's side."""
+    home = pd.DataFrame({
+        "team": df["Home"], "rest": df["home_rest"], "scored": df["HomeScore"], "conceded": df["AwayScore"],
+    })
+    away = pd.DataFrame({
+        "team": df["Away"], "rest": df["away_rest"], "scored": df["AwayScore"], "conceded": df["HomeScore"],
+    })
+    long = pd.concat([home, away], ignore_index=True)
+    long["points"] = np.select([long["scored"] > long["conceded"], long["scored"] == long["conceded"]], [3, 1], 0)
+    return long
+
+
+@st.cache_data(max_entries=PARTITION_CACHE)
+def by_differential(datasets):
+    """Results and goals by home-minus-away rest, in whole days."""
+    df = matches(datasets).dropna(subset=["rest_diff"])
+    bins = np.clip(np.round(df["rest_diff"]), -MAX_DIFFERENTIAL, MAX_DIFFERENTIAL).astype(int)
+    goal_diff = df["HomeScore"] - df["AwayScore"]
+    grouped = pd.DataFrame({
+        "bin": bins,
+        "home_win": goal_diff > 0,
+        "draw": goal_diff == 0,
+        "away_win": goal_diff < 0,
+        "home_goals": df["HomeScore"],
+        "away_goals": df["AwayScore"],
+    }).groupby("bin")
+    table = grouped.mean()
+    table.insert(0, "matches", grouped.size())
+    return table
+
+
+@st.cache_data(max_entries=PARTITION_CACHE)
+def by_rest(datasets):
+    """Points and goals per game by a team's own days of rest."""
+    long = team_matches(matches(datasets)).dropna(subset=["rest"])
+    long["bin"] = np.clip(np.floor(long["rest"]), SHORT_REST, LONG_REST).astype(int)
+    grouped = long.groupby("bin")[["points", "scored", "conceded"]]
+    table = grouped.mean()
+    table.insert(0, "matches", grouped.size())
+    return table
+
+
+@st.cache_data(max_entries=PARTITION_CACHE)
+def by_team(datasets):
+    """Per team: mean rest, matches on short rest, and points per game on short and normal rest."""
+    long = team_matches(matches(datasets)).dropna(subset=["rest"])
+    long["short"] = long["rest"] < SHORT_REST + 1
+    table = long.groupby("team").agg(mean_rest=("rest", "mean"), short_rest=("short", "sum"))
+    ppg = long.pivot_table(index="team", columns="short", values="points", aggfunc="mean")
+    table["ppg_short"] = ppg.get(True)
+    table["ppg_normal"] = ppg.get(False)
+    return table.sort_values("short_rest", ascending=False).reset_index()
@@ -0,0 +1,234 @@
+"""Location of the season CSVs and the loaders shared between scripts.
+
+Data is partitioned by league and season: ``data/<league>/<season>/``
+(e.g. ``data/premier-league/2023-24/``) holds the six CSVs of one
+league-season. The 2024/25 Premier League files in the repository root (or
+PL_DATA_DIR) are the default partition; PL_PARTITIONS_DIR moves the
+``data/`` tree.
+
+A partition is either a directory of CSVs or, once written by
+``python -m analytics.ingest``, a set of immutable content-hashed snapshots
+under ``snapshots/<version>/`` plus a ``CURRENT`` file naming the published
+version. Caches are keyed on (league, season, version), so publishing a new
+version invalidates exactly the entries built from the old one.
+
+The selector in app.py stores the chosen (league, season) in the session,
+and every loader and cached builder reads that partition. Only the selected
+partition is read, and each cache keeps the PL_PARTITION_CACHE most
+recently used partitions (default 4), so hosting many seasons doesn't
+multiply memory.
+
+Loaders defined here (rather than inside a page script) share one
+st.cache_data entry across pages, the figure builders in analytics.charts
+and the boot-time warm-up in analytics.serve.
+"""
+
+import base64
+import contextlib
+import contextvars
+import functools
+import glob
+import os
+
+import pandas as pd
+import streamlit as st
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.environ.get("PL_DATA_DIR", ROOT)
+PARTITIONS_DIR = os.environ.get("PL_PARTITIONS_DIR", os.path.join(ROOT, "data"))
+
+DEFAULT_PARTITION = ("premier-league", "2024-25")
+PARTITION_CACHE = int(os.environ.get("PL_PARTITION_CACHE", "4"))
+
+SNAPSHOTS = "snapshots"
+POINTER = "CURRENT"
+
+_active = contextvars.ContextVar("partition", default=None)
+# (league, season) -> version pinned by analytics.reload
+_served = {}
+
+
+def partitions():
+    """Every (league, season) with data, by league then newest season first."""
+    found = set()
+    paths = glob.glob(os.path.join(PARTITIONS_DIR, "*", "*", "player_stats.csv"))
+    paths += glob.glob(os.path.join(PARTITIONS_DIR, "*", "*", POINTER))
+    for path in paths:
+        season_dir = os.path.dirname(path)
+        found.add((os.path.basename(os.path.dirname(season_dir)), os.path.basename(season_dir)))
+    if os.path.exists(os.path.join(DATA_DIR, "player_stats.csv")):
+        found.add(DEFAULT_PARTITION)
+    by_season = sorted(found, key=lambda partition: partition[1], reverse=True)
+    return sorted(by_season, key=lambda partition: partition[0])
+
+
+def league_label(league):
+    return league.replace("-", " ").title()
+
+
+def season_label(season):
+    return season.replace("-", "/")
+
+
+def label(partition=None):
+    league, season = (partition or current())[:2]
+    return f"{league_label(league)} {season_label(season)}"
+
+
+def season_start(partition=None):
+    """First calendar year of the season, e.g. 2024 for 2024-25."""
+    return int((partition or current())[1][:4])
+
+
+def current():
+    """The (league, season) of this run: set by ``using()``, else the session's, else the default."""
+    active = _active.get()
+    if active is not None:
+        return active[:2]
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    if get_script_run_ctx(suppress_warning=True) is None:
+        return DEFAULT_PARTITION
+    selected = st.session_state.get("partition")
+    return tuple(selected) if selected else DEFAULT_PARTITION
+
+
+def version(partition=None):
+    """Snapshot version served for a partition, None if it isn't versioned.
+
+    That is the published one, unless analytics.reload has pinned the
+    previous version while it warms the caches for a new one.
+    """
+    partition = tuple((partition or current())[:2])
+    if partition in _served:
+        return _served[partition]
+    return published(partition)
+
+
+def serve_version(partition, version):
+    """Pin the version served for ``partition`` (see analytics.reload)."""
+    _served[tuple(partition[:2])] = version
+
+
+def pinned():
+    """Partitions whose served version is pinned."""
+    return set(_served)
+
+
+def published(partition=None):
+    """Version named by the partition's CURRENT file."""
+    league, season = (partition or current())[:2]
+    try:
+        with open(os.path.join(PARTITIONS_DIR, league, season, POINTER)) as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def dataset(partition=None):
+    """(league, season, version) of ``partition``, default the current one."""
+    if partition is None:
+        active = _active.get()
+        if active is not None:
+            return active
+        partition = current()
+    partition = tuple(partition)
+    return partition if len(partition) == 3 else partition + (version(partition),)
+
+
+@contextlib.contextmanager
+def using(partition):
+    """Make ``partition`` (at its published version) current in this block."""
+    token = _active.set(dataset(partition))
+    try:
+        yield
+    finally:
+        _active.reset(token)
+
+
+def partitioned(func):
+    """Key a cached function on the current dataset.
+
+    The (league, season, version) is resolved before the cache lookup and
+    passed on as the ``partition`` argument, so each league-season and
+    version gets its own entries, and made current while ``func`` runs, so
+    the loaders it calls read the same snapshot.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, partition=None, **kwargs):
+        key = dataset(partition)
+        with using(key):
+            return func(*args, partition=key, **kwargs)
+
+    wrapper.clear = func.clear
+    return wrapper
+
+
+def partition_dir(partition=None):
+    league, season, snapshot = dataset(partition)
+    directory = os.path.join(PARTITIONS_DIR, league, season)
+    if snapshot:
+        return os.path.join(directory, SNAPSHOTS, snapshot)
+    if os.path.isdir(directory):
+        return directory
+    if (league, season) == DEFAULT_PARTITION:
+        return DATA_DIR
+    raise FileNotFoundError(f"No data for {label((league, season))} in {PARTITIONS_DIR}")
+
+
+def data_path(name, partition=None):
+    return os.path.join(partition_dir(partition), name)
+
+
+# One loader per season CSV; ``partition`` defaults to the current one
+@partitioned
+@st.cache_data(max_entries=PARTITION_CACHE)
+def load_standings(partition=None):
+    return pd.read_csv(data_path("standings.csv", partition))
+
+
+@partitioned
+@st.cache_data(max_entries=PARTITION_CACHE)
+def load_player_stats(partition=None):
+    return pd.read_csv(data_path("player_stats.csv", partition))
+
+
+@partitioned
+@st.cache_data(max_entries=PARTITION_CACHE)
+def load_player_possession(partition=None):
+    return pd.read_csv(data_path("player_possession_stats.csv", partition))
+
+
+@partitioned
+@st.cache_data(max_entries=PARTITION_CACHE)
+def load_team_stats(partition=None):
+    return pd.read_csv(data_path("team_stats.csv", partition))
+
+
+@partitioned
+@st.cache_data(max_entries=PARTITION_CACHE)
+def load_team_possession(partition=None):
+    return pd.read_csv(data_path("team_possession_stats.csv", partition))
+
+
+@partitioned
+@st.cache_data(max_entries=PARTITION_CACHE)
+def load_fixtures(partition=None):
+    return pd.read_csv(data_path("fixtures.csv", partition))
+
+
+LOADERS = [
+    load_standings,
+    load_player_stats,
+    load_player_possession,
+    load_team_stats,
+    load_team_possession,
+    load_fixtures,
+]
+
+
+# Landing page card images, encoded once per process instead of every rerun
+@st.cache_data
+def card_image(img_path):
+    with open(os.path.join(ROOT, img_path), "rb") as f:
+        return base64.b64encode(f.read()).decode()
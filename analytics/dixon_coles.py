@@ -0,0 +1,339 @@
+"""Dixon-Coles match outcome model fitted to fixtures.csv.
+
+Home goals ~ Poisson(lambda), away goals ~ Poisson(mu) with
+
+    log lambda = home + attack[home team] + defence[away team]
+    log mu     =        attack[away team] + defence[home team]
+
+and the Dixon-Coles correction tau(x, y) on the 0-0, 1-0, 0-1 and 1-1
+scorelines, governed by rho. Matches are weighted by exp(-decay * age in
+days), so recent form counts more (Dixon & Coles, 1997). Attack strengths
+sum to zero.
+
+The likelihood and its gradient are evaluated over all matches at once
+(``np.bincount`` scatters the per-match terms onto the teams), and the fit
+runs a small L-BFGS loop in NumPy. ``fit()`` is cached per dataset version;
+when a new version of the same season adds a round, the fit starts from the
+previous version's parameters (if that fit converged) and takes a few
+iterations instead of a cold start; both stop at the same convergence
+tolerance, so a warm fit matches a cold one to within it. Starting points
+are kept for the PL_PARTITION_CACHE most recently fitted partitions only.
+``predict()`` returns scoreline probability matrices for any number
+of pairings in one array operation.
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from analytics.data import PARTITION_CACHE, load_fixtures, partitioned
+
+# Time decay per day; 0.0019 halves a match's weight in about a year
+DECAY = 0.0019
+# Scorelines up to MAX_GOALS-MAX_GOALS are modelled
+MAX_GOALS = 10
+# Weight of a Gaussian prior at zero on every parameter. It is negligible
+# over a season, but keeps the fit finite after a round or two, when a team
+# that has not scored yet would otherwise have an attack of minus infinity
+PRIOR = 0.1
+# Expected points are shown once every team has played this many matches
+MIN_MATCHES = 3
+
+_LOG_FACTORIAL = np.concatenate([[0.0], np.cumsum(np.log(np.arange(1, MAX_GOALS + 1)))])
+
+# Latest (teams, parameters) per (league, season) and decay, the starting
+# point of the next fit when a new round is published; in fit order, capped
+# like the caches
+_previous_fits = {}
+
+
+class Model:
+    """Fitted parameters; ``teams[i]`` has ``attack[i]`` and ``defence[i]``."""
+
+    def __init__(self, teams, attack, defence, home, rho, log_likelihood, iterations,
+                 converged=False, min_matches=0):
+        self.teams = list(teams)
+        self.index = {team: i for i, team in enumerate(self.teams)}
+        self.attack = attack
+        self.defence = defence
+        self.home = home
+        self.rho = rho
+        self.log_likelihood = log_likelihood
+        self.iterations = iterations
+        self.converged = converged
+        # Fewest matches played by any team
+        self.min_matches = min_matches
+
+    def reliable(self):
+        """Whether the fit converged to finite parameters on enough matches per team."""
+        params = np.concatenate([self.attack, self.defence, [self.home, self.rho]])
+        return (
+            bool(self.teams) and self.converged and self.min_matches >= MIN_MATCHES
+            and bool(np.isfinite(params).all())
+        )
+
+    def ratings(self):
+        """Attack/defence strengths per team, best overall first."""
+        df = pd.DataFrame({"team": self.teams, "attack": self.attack, "defence": self.defence})
+        df["rating"] = df["attack"] - df["defence"]
+        return df.sort_values("rating", ascending=False, ignore_index=True)
+
+
+def played(fixtures):
+    """Fixtures with a result."""
+    return fixtures.dropna(subset=["HomeScore", "AwayScore"])
+
+
+def _matches(fixtures, teams, decay):
+    index = {team: i for i, team in enumerate(teams)}
+    dates = pd.to_datetime(fixtures["Date"])
+    age = (dates.max() - dates).dt.days.to_numpy(float)
+    return (
+        fixtures["Home"].map(index).to_numpy(np.intp),
+        fixtures["Away"].map(index).to_numpy(np.intp),
+        fixtures["HomeScore"].to_numpy(float),
+        fixtures["AwayScore"].to_numpy(float),
+        np.exp(-decay * age),
+    )
+
+
+def _unpack(params, n):
+    return params[:n], params[n:2 * n], params[2 * n], params[2 * n + 1]
+
+
+def _tau_terms(x, y, lam, mu, rho):
+    """tau and the derivatives of log tau by log lambda, log mu and rho."""
+    tau = np.ones_like(lam)
+    d_lam = np.zeros_like(lam)
+    d_mu = np.zeros_like(lam)
+    d_rho = np.zeros_like(lam)
+
+    m = (x == 0) & (y == 0)
+    tau[m] = 1 - lam[m] * mu[m] * rho
+    d_lam[m] = d_mu[m] = -lam[m] * mu[m] * rho / tau[m]
+    d_rho[m] = -lam[m] * mu[m] / tau[m]
+
+    m = (x == 0) & (y == 1)
+    tau[m] = 1 + lam[m] * rho
+    d_lam[m] = lam[m] * rho / tau[m]
+    d_rho[m] = lam[m] / tau[m]
+
+    m = (x == 1) & (y == 0)
+    tau[m] = 1 + mu[m] * rho
+    d_mu[m] = mu[m] * rho / tau[m]
+    d_rho[m] = mu[m] / tau[m]
+
+    m = (x == 1) & (y == 1)
+    tau[m] = 1 - rho
+    d_rho[m] = -1 / tau[m]
+    return tau, d_lam, d_mu, d_rho
+
+
+def negative_log_likelihood(params, matches, n):
+    """Weighted negative log-likelihood and its gradient."""
+    h, a, x, y, w = matches
+    attack, defence, home, rho = _unpack(params, n)
+    log_lam = home + attack[h] + defence[a]
+    log_mu = attack[a] + defence[h]
+    lam, mu = np.exp(log_lam), np.exp(log_mu)
+
+    tau, d_lam, d_mu, d_rho = _tau_terms(x, y, lam, mu, rho)
+    if np.any(tau <= 0):
+        return np.inf, None
+    ll = w * (np.log(tau) + x * log_lam - lam + y * log_mu - mu)
+
+    g_lam = w * (x - lam + d_lam)
+    g_mu = w * (y - mu + d_mu)
+    grad = np.concatenate([
+        np.bincount(h, g_lam, n) + np.bincount(a, g_mu, n),
+        np.bincount(a, g_lam, n) + np.bincount(h, g_mu, n),
+        [g_lam.sum(), (w * d_rho).sum()],
+    ])
+    # Keep the attack strengths summing to zero
+    grad[:n] -= grad[:n].mean()
+    return -ll.sum(), -grad
+
+
+def _objective(params, matches, n):
+    """Negative log-posterior: the likelihood plus the prior on ``params``."""
+    value, grad = negative_log_likelihood(params, matches, n)
+    if grad is None:
+        return value, grad
+    return value + PRIOR / 2 * params.dot(params), grad + PRIOR * params
+
+
+def _minimize(f, x0, iterations=200, memory=10, tol=1e-9):
+    """L-BFGS with backtracking; returns (x, value, iterations, converged)."""
+    x = x0.copy()
+    value, grad = f(x)
+    history = []
+    converged = False
+    for iteration in range(1, iterations + 1):
+        # Two-loop recursion for the search direction
+        q = grad.copy()
+        alphas = []
+        for s, yv, r in reversed(history):
+            alpha = r * s.dot(q)
+            q -= alpha * yv
+            alphas.append(alpha)
+        if history:
+            s, yv, _ = history[-1]
+            q *= s.dot(yv) / yv.dot(yv)
+        for (s, yv, r), alpha in zip(history, reversed(alphas)):
+            q += s * (alpha - r * yv.dot(q))
+        direction = -q
+        if direction.dot(grad) >= 0:
+            direction, history = -grad, []
+
+        step = 1.0
+        while step > 1e-10:
+            candidate = x + step * direction
+            new_value, new_grad = f(candidate)
+            if new_value <= value + 1e-4 * step * direction.dot(grad):
+                break
+            step /= 2
+        else:
+            break
+
+        s, yv = candidate - x, new_grad - grad
+        if s.dot(yv) > 1e-12:
+            history.append((s, yv, 1 / s.dot(yv)))
+            history = history[-memory:]
+        converged = abs(value - new_value) < tol * max(1.0, abs(value))
+        x, value, grad = candidate, new_value, new_grad
+        if converged or np.abs(grad).max() < tol:
+            converged = True
+            break
+    return x, value, iteration, converged
+
+
+@partitioned
+@st.cache_data(max_entries=PARTITION_CACHE)
+def fit(decay=DECAY, partition=None):
+    """Fit the model to the played fixtures of the current dataset.
+
+    Before the first result (a pre-season partition) the model has no teams.
+    """
+    fixtures = played(load_fixtures())
+    teams = sorted(set(fixtures["Home"]) | set(fixtures["Away"]))
+    n = len(teams)
+    if not n:
+        return Model([], np.zeros(0), np.zeros(0), 0.0, 0.0, 0.0, 0)
+    matches = _matches(fixtures, teams, decay)
+
+    # A new round of the same season starts from the previous version's fit
+    key = (partition[:2], decay)
+    previous = _previous_fits.get(key)
+    if previous is not None and previous[0] == teams and np.isfinite(previous[1]).all():
+        params = previous[1]
+        # The new round's scorelines can rule out the previous rho (tau <= 0)
+        if not np.isfinite(_objective(params, matches, n)[0]):
+            params = _initial(matches, n)
+    else:
+        params = _initial(matches, n)
+
+    params, _, iterations, converged = _minimize(lambda p: _objective(p, matches, n), params)
+    value, _ = negative_log_likelihood(params, matches, n)
+    # Only a good fit is worth starting the next round from
+    if converged and np.isfinite(params).all():
+        _previous_fits.pop(key, None)
+        _previous_fits[key] = (teams, params)
+        while len(_previous_fits) > PARTITION_CACHE:
+            del _previous_fits[next(iter(_previous_fits))]
+    games = np.bincount(matches[0], minlength=n) + np.bincount(matches[1], minlength=n)
+    attack, defence, home, rho = _unpack(params, n)
+    return Model(
+        teams, attack, defence, float(home), float(rho), -value, iterations,
+        converged, int(games.min()),
+    )
+
+
+def _initial(matches, n):
+    # Log goals scored/conceded per game relative to the league, smoothed by
+    # half a goal over one extra game so a team yet to score (or concede)
+    # early in the season starts finite
+    h, a, x, y, _ = matches
+    games = np.bincount(h, minlength=n) + np.bincount(a, minlength=n) + 1
+    scored = (np.bincount(h, x, n) + np.bincount(a, y, n) + 0.5) / games
+    conceded = (np.bincount(h, y, n) + np.bincount(a, x, n) + 0.5) / games
+    mean = (x.sum() + y.sum() + 1) / (2 * len(x) + 2)
+    attack = np.log(scored / mean)
+    return np.concatenate([
+        attack - attack.mean(), np.log(conceded / mean) + np.log(mean),
+        [np.log((x.sum() + 0.5) / (y.sum() + 0.5)), 0.0],
+    ])
+
+
+def _pmf(rate):
+    """Poisson pmf for 0..MAX_GOALS goals; ``rate`` of any shape."""
+    goals = np.arange(MAX_GOALS + 1)
+    rate = np.asarray(rate, float)[..., None]
+    return np.exp(goals * np.log(rate) - rate - _LOG_FACTORIAL)
+
+
+def predict(model, homes, aways):
+    """Scoreline probabilities, shape (n, MAX_GOALS+1, MAX_GOALS+1).
+
+    ``[k, i, j]`` is the probability that pairing k ends i-j (home-away).
+    """
+    h = np.array([model.index[team] for team in homes], dtype=int)
+    a = np.array([model.index[team] for team in aways], dtype=int)
+    lam = np.exp(model.home + model.attack[h] + model.defence[a])
+    mu = np.exp(model.attack[a] + model.defence[h])
+
+    grid = _pmf(lam)[:, :, None] * _pmf(mu)[:, None, :]
+    rho = model.rho
+    grid[:, 0, 0] *= 1 - lam * mu * rho
+    grid[:, 0, 1] *= 1 + lam * rho
+    grid[:, 1, 0] *= 1 + mu * rho
+    grid[:, 1, 1] *= 1 - rho
+    return grid
+
+
+def outcomes(grid):
+    """(home win, draw, away win) probabilities of each scoreline matrix."""
+    home = np.tril(grid, -1).sum(axis=(-2, -1))
+    draw = np.trace(grid, axis1=-2, axis2=-1)
+    away = np.triu(grid, 1).sum(axis=(-2, -1))
+    return home, draw, away
+
+
+@partitioned
+@st.cache_data(max_entries=PARTITION_CACHE)
+def all_pairings(decay=DECAY, partition=None):
+    """Outcome probabilities and expected goals for every home/away pairing."""
+    model = fit(decay)
+    homes, aways = (np.array(side).ravel() for side in np.meshgrid(model.teams, model.teams, indexing="ij"))
+    keep = homes != aways
+    homes, aways = homes[keep], aways[keep]
+    grid = predict(model, homes, aways)
+    home, draw, away = outcomes(grid)
+    goals = np.arange(MAX_GOALS + 1)
+    return pd.DataFrame({
+        "Home": homes,
+        "Away": aways,
+        "home_win": home,
+        "draw": draw,
+        "away_win": away,
+        "home_xg": grid.sum(axis=2) @ goals,
+        "away_xg": grid.sum(axis=1) @ goals,
+    })
+
+
+@partitioned
+@st.cache_data(max_entries=PARTITION_CACHE)
+def expected_points(decay=DECAY, partition=None):
+    """Expected points per team over its played fixtures, highest first.
+
+    Win/draw/loss probabilities of every played fixture come from one
+    batched ``predict()``; xPts is 3 x P(win) + P(draw).
+    """
+    model = fit(decay)
+    fixtures = played(load_fixtures())
+    home, draw, away = outcomes(predict(model, fixtures["Home"], fixtures["Away"]))
+    h = fixtures["Home"].map(model.index).to_numpy(np.intp)
+    a = fixtures["Away"].map(model.index).to_numpy(np.intp)
+    n = len(model.teams)
+    xpts = np.bincount(h, 3 * home + draw, n) + np.bincount(a, 3 * away + draw, n)
+    table = pd.DataFrame({"team": model.teams, "xpts": xpts})
+    return table.sort_values("xpts", ascending=False, ignore_index=True)
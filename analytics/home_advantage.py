@@ -0,0 +1,75 @@
+"""Home advantage per team and per venue.
+
+A team's home advantage is its points (and goal difference) per game at
+home minus the same away. Every played fixture is split once into a home
+and an away team-match. Both sides of every team are then bootstrapped
+together (analytics.resample), which gives an interval per team. The raw
+estimates are also shrunk towards the league mean by empirical Bayes, so
+teams with few matches or noisy results don't stand out by chance.
+
+Per venue, the home side's record at that ground is compared with the
+same team's away record. Teams that moved ground during the season get
+one row per venue.
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from analytics.data import PARTITION_CACHE, load_fixtures, partitioned
+from analytics.resample import bootstrap_means, interval, shrink
+
+METRICS = {"points": "Points per game", "goals": "Goal difference per game"}
+
+
+def _sides(fixtures):
+    goal_diff = (fixtures["HomeScore"] - fixtures["AwayScore"]).to_numpy(float)
+    points = np.select([goal_diff > 0, goal_diff == 0], [3.0, 1.0], 0.0)
+    away_points = np.select([goal_diff < 0, goal_diff == 0], [3.0, 1.0], 0.0)
+    return {"points": (points, away_points), "goals": (goal_diff, -goal_diff)}
+
+
+def _advantage(home_groups, away_groups, away_of_home, sides, rows):
+    """Advantage, interval, shrunk estimate and home/away means per home group."""
+    table = pd.DataFrame(index=rows)
+    table["home_matches"] = np.bincount(home_groups)
+    table["away_matches"] = np.bincount(away_groups)[away_of_home]
+    for metric, (home_values, away_values) in sides.items():
+        home_mean, home_resampled = bootstrap_means(home_values, home_groups, seed=1)
+        away_mean, away_resampled = bootstrap_means(away_values, away_groups, seed=2)
+        resampled = home_resampled - away_resampled[:, away_of_home]
+        estimate = home_mean - away_mean[away_of_home]
+        table[f"home_{metric}"], table[f"away_{metric}"] = home_mean, away_mean[away_of_home]
+        table[metric] = estimate
+        table[f"{metric}_low"], table[f"{metric}_high"] = interval(resampled)
+        table[f"{metric}_shrunk"] = shrink(estimate, resampled.var(axis=0))
+    return table
+
+
+@partitioned
+@st.cache_data(max_entries=PARTITION_CACHE)
+def by_team(partition=None):
+    """Home advantage of every team, largest first."""
+    fixtures = load_fixtures().dropna(subset=["HomeScore", "AwayScore"])
+    teams = sorted(set(fixtures["Home"]) & set(fixtures["Away"]))
+    fixtures = fixtures[fixtures["Home"].isin(teams) & fixtures["Away"].isin(teams)]
+    home = pd.Categorical(fixtures["Home"], categories=teams).codes
+    away = pd.Categorical(fixtures["Away"], categories=teams).codes
+    table = _advantage(home, away, np.arange(len(teams)), _sides(fixtures), teams)
+    return table.rename_axis("team").sort_values("points", ascending=False).reset_index()
+
+
+@partitioned
+@st.cache_data(max_entries=PARTITION_CACHE)
+def by_venue(partition=None):
+    """Home advantage of every (venue, home team), largest first."""
+    fixtures = load_fixtures().dropna(subset=["HomeScore", "AwayScore", "Venue"])
+    teams = sorted(set(fixtures["Home"]) & set(fixtures["Away"]))
+    fixtures = fixtures[fixtures["Home"].isin(teams) & fixtures["Away"].isin(teams)]
+    pairs = pd.MultiIndex.from_frame(fixtures[["Venue", "Home"]]).unique().sort_values()
+    home = pairs.get_indexer(pd.MultiIndex.from_frame(fixtures[["Venue", "Home"]]))
+    away = pd.Categorical(fixtures["Away"], categories=teams).codes
+    away_of_home = pd.Categorical(pairs.get_level_values("Home"), categories=teams).codes
+    table = _advantage(home, away, away_of_home, _sides(fixtures), pairs)
+    table = table.rename_axis(["venue", "team"]).reset_index()
+    return table.sort_values("points", ascending=False, ignore_index=True)
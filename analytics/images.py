@@ -0,0 +1,176 @@
+"""Batch PNG/SVG export of every dashboard chart.
+
+    python -m analytics.images --out exports/ --format png svg
+    python -m analytics.images --thumbnails     # regenerate images/*.png
+
+Needs kaleido (``pip install kaleido``, which uses a local Chrome). Charts
+are the same ones the static site shows (analytics.site.figures) and are
+written to ``<out>/<page>/<chart>.<format>``. Pages are rendered in a
+process pool, each worker exporting its page's charts in one kaleido batch.
+
+A manifest next to the images records a content hash per file (figure
+JSON, format and size); charts whose hash is unchanged and whose file still
+exists are skipped, so re-running after a data refresh only renders what
+changed. ``--force`` ignores the manifest. The thumbnails' manifest,
+images/.manifest.json, is git-ignored.
+"""
+
+import argparse
+import concurrent.futures
+import hashlib
+import json
+import os
+import sys
+import time
+
+from analytics import site
+
+ROOT = site.ROOT
+MANIFEST = ".manifest.json"
+
+# Default image size for charts that don't set their own
+WIDTH, HEIGHT = 1200, 600
+
+# Landing page card -> (page kind, page argument, chart heading, width, height)
+THUMBNAILS = {
+    "images/ball_prog.png": ("progression", None, "Season totals", 894, 547),
+    "images/goalscoring.png": ("goalscoring", None, "Goals vs Expected Goals", 1550, 600),
+    "images/team_analysis.png": ("team", "Liverpool", "Touch Distribution: Midfielders", 1749, 941),
+    "images/attacking_efficiency.png": ("attacking", None, "Take-On Efficiency Bubble Chart", 1550, 600),
+    "images/age_distribution.png": ("age", None, "Minutes Played by Birth Year and Team", 1904, 943),
+    "images/ball_possession.png": ("possession", None, "Carries Volume vs Progressiveness", 1550, 800),
+}
+
+
+def content_hash(fig, fmt, width, height, scale):
+    digest = hashlib.sha256(fig.to_json().encode())
+    digest.update(f"{fmt}:{width}x{height}@{scale}".encode())
+    return digest.hexdigest()
+
+
+def _size(fig):
+    return fig.layout.width or WIDTH, fig.layout.height or HEIGHT
+
+
+def _write(figs, paths, formats, widths, heights, scale):
+    import plotly.io as pio
+
+    if hasattr(pio, "write_images"):
+        # plotly >= 6.1 renders a whole batch in one browser session
+        pio.write_images(figs, paths, format=formats, width=widths, height=heights, scale=scale)
+        return
+    for fig, path, fmt, width, height in zip(figs, paths, formats, widths, heights):
+        pio.write_image(fig, path, format=fmt, width=width, height=height, scale=scale)
+
+
+def _targets(job):
+    """(relative path, figure, format, width, height) for one page job."""
+    kind, arg, directory, formats, thumbnail = job
+    charts = site.figures(kind, arg)
+    if thumbnail is not None:
+        heading, name, width, height = thumbnail
+        return [(name, dict(charts)[heading], "png", width, height)]
+    return [
+        (f"{directory}/{site.slug(heading)}.{fmt}", fig, fmt, *_size(fig))
+        for heading, fig in charts
+        for fmt in formats
+    ]
+
+
+def render(out_dir, job, manifest, scale, force):
+    """Export the charts of one page job.
+
+    Returns {relative path: hash} of the files written and the number of
+    files skipped because their hash is unchanged.
+    """
+    batch = []
+    skipped = 0
+    for rel, fig, fmt, width, height in _targets(job):
+        digest = content_hash(fig, fmt, width, height, scale)
+        path = os.path.join(out_dir, rel)
+        if not force and manifest.get(rel) == digest and os.path.exists(path):
+            skipped += 1
+            continue
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        batch.append((rel, digest, fig, path, fmt, width, height))
+
+    if batch:
+        _, _, figs, paths, formats, widths, heights = (list(column) for column in zip(*batch))
+        _write(figs, paths, formats, widths, heights, scale)
+    return {rel: digest for rel, digest, *_ in batch}, skipped
+
+
+def chart_jobs(teams, formats):
+    """One job per page: (kind, arg, directory, formats, None)."""
+    jobs = [(kind, None, site.slug(title), formats, None) for _, title, kind in site.PAGES if kind in site.FIGURES]
+    jobs += [("team", team, f"teams/{site.slug(team)}", formats, None) for team in teams]
+    return jobs
+
+
+def thumbnail_jobs():
+    """One job per card: (kind, arg, None, None, (heading, file, width, height))."""
+    return [
+        (kind, arg, None, None, (heading, os.path.basename(path), width, height))
+        for path, (kind, arg, heading, width, height) in THUMBNAILS.items()
+    ]
+
+
+def export(out_dir, jobs, workers=None, scale=1, force=False):
+    manifest_path = os.path.join(out_dir, MANIFEST)
+    manifest = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+
+    started = time.perf_counter()
+    written = skipped = 0
+    failures = []
+    with concurrent.futures.ProcessPoolExecutor(workers, initializer=site._init_worker) as pool:
+        futures = [pool.submit(render, out_dir, job, manifest, scale, force) for job in jobs]
+        for future, job in zip(futures, jobs):
+            try:
+                hashes, page_skipped = future.result()
+            except Exception as exc:
+                failures.append(f"{job[0]} {job[1] or ''}: {exc!r}")
+                continue
+            manifest.update(hashes)
+            written += len(hashes)
+            skipped += page_skipped
+
+    os.makedirs(out_dir, exist_ok=True)
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    print(f"{written} images written, {skipped} unchanged, to {out_dir} in {time.perf_counter() - started:.1f} s")
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export every dashboard chart as PNG/SVG.")
+    parser.add_argument("--out", default=os.path.join(ROOT, "exports"), help="output directory")
+    parser.add_argument("--format", nargs="+", default=["png"], choices=["png", "svg", "jpg", "webp", "pdf"])
+    parser.add_argument("--scale", type=float, default=1, help="pixel ratio of raster images")
+    parser.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument("--thumbnails", action="store_true", help="regenerate the landing page cards in images/")
+    parser.add_argument("--force", action="store_true", help="re-render charts whose hash is unchanged")
+    args = parser.parse_args(argv)
+
+    try:
+        import kaleido  # noqa: F401
+    except ImportError:
+        print("Image export needs kaleido: pip install kaleido")
+        return 2
+
+    site._init_worker()
+    if args.thumbnails:
+        return export(os.path.join(ROOT, "images"), thumbnail_jobs(), args.workers, args.scale, args.force)
+
+    from analytics.data import load_player_stats
+
+    teams = sorted(load_player_stats()["team"].unique())
+    return export(args.out, chart_jobs(teams, args.format), args.workers, args.scale, args.force)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,334 @@
+"""Validate a season's CSVs and publish them as a versioned snapshot.
+
+    python -m analytics.ingest incoming/ --league premier-league --season 2025-26
+    python -m analytics.ingest incoming/ --check          # validate only
+
+Checks every file's columns, types, null counts and value ranges, then
+cross-file consistency: every team in the player, team and fixture files
+exists in ``standings.csv``, team files cover exactly the standings' teams,
+standings points and ranks add up. Any error aborts the ingest; warnings
+(e.g. unexpected extra columns) are printed and let it through. A
+pre-season set, whose fixtures have no results yet, is valid; the pages
+show a note until the first result.
+
+A valid set is copied into ``data/<league>/<season>/snapshots/<version>/``,
+where the version is a hash of the six files' contents, and made read-only.
+Publishing then atomically rewrites the partition's ``CURRENT`` file, so
+readers switch from one complete version to the next; the caches are keyed
+on the version (see analytics.data). Re-ingesting identical files publishes
+the existing snapshot.
+"""
+
+import argparse
+import datetime
+import hashlib
+import json
+import logging
+import os
+import shutil
+import stat
+import sys
+import tempfile
+
+# The CLI imports analytics.data without a Streamlit runtime; drop the
+# bare-mode warnings its cached loaders would log on import
+logging.getLogger("streamlit.runtime.caching.cache_data_api").addFilter(lambda record: False)
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from analytics.data import DEFAULT_PARTITION, PARTITIONS_DIR, POINTER, SNAPSHOTS  # noqa: E402
+
+# file -> column -> (type, nullable, min, max); None bounds are open
+SCHEMAS = {
+    "standings.csv": {
+        "rank": ("int", False, 1, None),
+        "team": ("str", False, None, None),
+        "win": ("int", False, 0, None),
+        "loss": ("int", False, 0, None),
+        "draw": ("int", False, 0, None),
+        "goals": ("int", False, 0, None),
+        "conceded": ("int", False, 0, None),
+        "points": ("int", False, 0, None),
+        "last5": ("str", True, None, None),
+        "top_scorer": ("str", True, None, None),
+        "keeper": ("str", True, None, None),
+    },
+    "player_stats.csv": {
+        "name": ("str", False, None, None),
+        "nation": ("str", True, None, None),
+        "position": ("str", False, None, None),
+        "team": ("str", False, None, None),
+        "age": ("float", True, 14, 50),
+        "born": ("int", True, 1950, None),
+        "played": ("int", False, 0, 60),
+        "starts": ("int", False, 0, 60),
+        "minutes": ("int", False, 0, 60 * 95),
+        "goals": ("int", False, 0, None),
+        "assists": ("int", False, 0, None),
+        "penalty_kicks": ("int", False, 0, None),
+        "penalty_kick_attempts": ("int", False, 0, None),
+        "yellow": ("int", False, 0, None),
+        "red": ("int", False, 0, None),
+        "expected_goals": ("float", False, 0, None),
+        "progressive_carries": ("int", False, 0, None),
+        "progressive_passes": ("int", False, 0, None),
+        "received_progressive_passes": ("int", False, 0, None),
+    },
+    "player_possession_stats.csv": {
+        "player": ("str", False, None, None),
+        "nation": ("str", True, None, None),
+        "position": ("str", False, None, None),
+        "team": ("str", False, None, None),
+        "age": ("float", True, 14, 50),
+        "90s": ("float", False, 0, 60),
+        "touches": ("int", False, 0, None),
+        "deffensive_touches": ("int", False, 0, None),
+        "middle_touches": ("int", False, 0, None),
+        "attacking_touches": ("int", False, 0, None),
+        "attempted_take_ons": ("int", False, 0, None),
+        "successful_take_ons": ("int", False, 0, None),
+        "takeons_tackled": ("int", False, 0, None),
+        "carries": ("int", False, 0, None),
+        "total_distance_carried": ("int", False, 0, None),
+        "received": ("str", True, None, None),
+    },
+    "team_stats.csv": {
+        "team": ("str", False, None, None),
+        "players": ("int", False, 1, None),
+        "age": ("float", False, 14, 50),
+        "possession": ("float", False, 0, 100),
+        "goals": ("int", False, 0, None),
+        "assists": ("int", False, 0, None),
+        "penalty_kicks": ("int", False, 0, None),
+        "penalty_kick_attempts": ("int", False, 0, None),
+        "yellows": ("int", False, 0, None),
+        "reds": ("int", False, 0, None),
+        "expected_goals": ("float", False, 0, None),
+        "expected_assists": ("float", False, 0, None),
+        "progressive_carries": ("int", False, 0, None),
+        "progressive_passes": ("int", False, 0, None),
+    },
+    "team_possession_stats.csv": {
+        "team": ("str", False, None, None),
+        "possession": ("float", False, 0, 100),
+        "touches": ("int", False, 0, None),
+        "deffensive_touches": ("int", False, 0, None),
+        "middle_touches": ("int", False, 0, None),
+        "attacking_touches": ("int", False, 0, None),
+        "attempted_take_ons": ("int", False, 0, None),
+        "successful_take_ons": ("int", False, 0, None),
+        "carries": ("int", False, 0, None),
+        "total_distance_carried": ("int", False, 0, None),
+    },
+    "fixtures.csv": {
+        "week": ("int", False, 1, None),
+        "Day": ("str", False, None, None),
+        "Date": ("date", False, None, None),
+        "Time": ("time", True, None, None),
+        "Home": ("str", False, None, None),
+        "HomeScore": ("int", True, 0, None),
+        "Away": ("str", False, None, None),
+        "AwayScore": ("int", True, 0, None),
+        "Attendance": ("int", True, 0, None),
+        "Venue": ("str", True, None, None),
+        "Referee": ("str", True, None, None),
+    },
+}
+FILES = list(SCHEMAS)
+
+
+class Report:
+    def __init__(self):
+        self.errors = []
+        self.warnings = []
+
+    def error(self, name, message):
+        self.errors.append(f"{name}: {message}")
+
+    def warn(self, name, message):
+        self.warnings.append(f"{name}: {message}")
+
+
+def _check_column(report, name, column, values, kind, nullable, low, high):
+    missing = values.isna()
+    if not nullable and missing.any():
+        report.error(name, f"{column} has {int(missing.sum())} empty values")
+
+    present = values[~missing]
+    if kind == "str" or present.empty:
+        return
+    if kind == "date":
+        bad = pd.to_datetime(present, format="%Y-%m-%d", errors="coerce").isna()
+        if bad.any():
+            report.error(name, f"{column} has {int(bad.sum())} values that are not YYYY-MM-DD dates")
+        return
+    if kind == "time":
+        bad = ~present.astype(str).str.fullmatch(r"\d{1,2}:\d{2}")
+        if bad.any():
+            report.error(name, f"{column} has {int(bad.sum())} values that are not HH:MM times")
+        return
+
+    numbers = pd.to_numeric(present, errors="coerce")
+    if numbers.isna().any():
+        report.error(name, f"{column} has {int(numbers.isna().sum())} non-numeric values")
+        return
+    if kind == "int" and (numbers != np.floor(numbers)).any():
+        report.error(name, f"{column} has non-integer values")
+    if low is not None and (numbers < low).any():
+        report.error(name, f"{column} has {int((numbers < low).sum())} values below {low} (min {numbers.min()})")
+    if high is not None and (numbers > high).any():
+        report.error(name, f"{column} has {int((numbers > high).sum())} values above {high} (max {numbers.max()})")
+
+
+def _check_schema(report, name, df):
+    schema = SCHEMAS[name]
+    missing = [column for column in schema if column not in df.columns]
+    if missing:
+        report.error(name, f"missing columns: {', '.join(missing)}")
+    extra = [column for column in df.columns if column not in schema]
+    if extra:
+        report.warn(name, f"unexpected columns: {', '.join(extra)}")
+    if df.empty:
+        report.error(name, "no rows")
+    for column, (kind, nullable, low, high) in schema.items():
+        if column in df.columns:
+            _check_column(report, name, column, df[column], kind, nullable, low, high)
+    return not missing
+
+
+def _check_references(report, frames):
+    standings = frames["standings.csv"]
+    teams = set(standings["team"])
+    if standings["team"].duplicated().any():
+        report.error("standings.csv", f"duplicate teams: {', '.join(standings['team'][standings['team'].duplicated()])}")
+    numbers = standings[["rank", "win", "draw", "points"]].apply(pd.to_numeric, errors="coerce")
+    if sorted(numbers["rank"].fillna(0)) != list(range(1, len(standings) + 1)):
+        report.error("standings.csv", "ranks are not 1..n")
+    wrong_points = standings[numbers["points"] != 3 * numbers["win"] + numbers["draw"]]
+    if not wrong_points.empty:
+        report.error("standings.csv", f"points != 3*win + draw for {', '.join(wrong_points['team'])}")
+
+    for name in ("player_stats.csv", "player_possession_stats.csv"):
+        unknown = set(frames[name]["team"].dropna()) - teams
+        if unknown:
+            report.error(name, f"teams not in standings.csv: {', '.join(sorted(unknown))}")
+    for name in ("team_stats.csv", "team_possession_stats.csv"):
+        if set(frames[name]["team"]) != teams:
+            diff = set(frames[name]["team"]) ^ teams
+            report.error(name, f"teams differ from standings.csv: {', '.join(sorted(diff))}")
+
+    fixtures = frames["fixtures.csv"]
+    for column in ("Home", "Away"):
+        unknown = set(fixtures[column].dropna()) - teams
+        if unknown:
+            report.error("fixtures.csv", f"{column} teams not in standings.csv: {', '.join(sorted(unknown))}")
+    if (fixtures["Home"] == fixtures["Away"]).any():
+        report.error("fixtures.csv", "a team plays itself")
+
+
+def validate(source_dir):
+    """Check the six CSVs in ``source_dir``; returns a Report."""
+    report = Report()
+    frames = {}
+    complete = True
+    for name in FILES:
+        path = os.path.join(source_dir, name)
+        if not os.path.exists(path):
+            report.error(name, "file not found")
+            complete = False
+            continue
+        try:
+            frames[name] = pd.read_csv(path)
+        except (pd.errors.ParserError, pd.errors.EmptyDataError, UnicodeDecodeError) as exc:
+            report.error(name, f"unreadable: {exc}")
+            complete = False
+            continue
+        complete &= _check_schema(report, name, frames[name])
+
+    # Cross-file checks need every file with all its columns
+    if complete:
+        _check_references(report, frames)
+    return report
+
+
+def content_version(source_dir):
+    """Short hash of the six files' names and bytes."""
+    digest = hashlib.sha256()
+    for name in FILES:
+        digest.update(name.encode())
+        with open(os.path.join(source_dir, name), "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()[:16]
+
+
+def snapshot(source_dir, league, season):
+    """Copy the CSVs into an immutable snapshot; returns (version, created)."""
+    version = content_version(source_dir)
+    partition = os.path.join(PARTITIONS_DIR, league, season)
+    target = os.path.join(partition, SNAPSHOTS, version)
+    if os.path.isdir(target):
+        return version, False
+
+    os.makedirs(os.path.join(partition, SNAPSHOTS), exist_ok=True)
+    # Build in a temporary directory and rename, so a snapshot is never half-written
+    staging = tempfile.mkdtemp(prefix=f".{version}-", dir=os.path.join(partition, SNAPSHOTS))
+    rows = {}
+    for name in FILES:
+        shutil.copyfile(os.path.join(source_dir, name), os.path.join(staging, name))
+        rows[name] = len(pd.read_csv(os.path.join(staging, name)))
+    manifest = {
+        "version": version,
+        "league": league,
+        "season": season,
+        "source": os.path.abspath(source_dir),
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "rows": rows,
+    }
+    with open(os.path.join(staging, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+    for name in os.listdir(staging):
+        os.chmod(os.path.join(staging, name), stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+    os.chmod(staging, 0o755)
+    os.rename(staging, target)
+    return version, True
+
+
+def publish(league, season, version):
+    """Atomically point the partition's CURRENT file at ``version``."""
+    partition = os.path.join(PARTITIONS_DIR, league, season)
+    fd, tmp = tempfile.mkstemp(prefix=f".{POINTER}-", dir=partition)
+    with os.fdopen(fd, "w") as f:
+        f.write(version + "\n")
+    os.chmod(tmp, 0o644)
+    os.replace(tmp, os.path.join(partition, POINTER))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate season CSVs and publish a versioned snapshot.")
+    parser.add_argument("source", help="directory with the six CSVs")
+    parser.add_argument("--league", default=DEFAULT_PARTITION[0], help="league slug, e.g. premier-league")
+    parser.add_argument("--season", default=DEFAULT_PARTITION[1], help="season, e.g. 2024-25")
+    parser.add_argument("--check", action="store_true", help="validate only")
+    args = parser.parse_args(argv)
+
+    report = validate(args.source)
+    for warning in report.warnings:
+        print(f"WARN  {warning}")
+    for error in report.errors:
+        print(f"ERROR {error}")
+    if report.errors:
+        print(f"{len(report.errors)} errors; nothing published")
+        return 1
+    if args.check:
+        print("valid")
+        return 0
+
+    version, created = snapshot(args.source, args.league, args.season)
+    publish(args.league, args.season, version)
+    print(f"{'created' if created else 'reused'} snapshot {version}; published {args.league}/{args.season}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
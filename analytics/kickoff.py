@@ -0,0 +1,65 @@
+"""Kickoff day and time effects, with bootstrap intervals.
+
+Played fixtures are grouped by weekday or by kickoff slot, and each
+group's goals per game, home/away win and draw rates and attendance come
+with a percentile bootstrap interval. Matches are resampled within their
+group, every group at once (see analytics.resample).
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from analytics.data import PARTITION_CACHE, load_fixtures, partitioned
+from analytics.resample import bootstrap_means, interval
+
+DAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+# (label, first hour) of each kickoff slot
+SLOTS = [("Lunchtime", 0), ("Afternoon", 14), ("Late afternoon", 16), ("Evening", 19)]
+GROUPINGS = {"Day": "Weekday", "slot": "Kickoff time"}
+
+METRICS = {
+    "goals": "Goals per game",
+    "home_win": "Home win %",
+    "draw": "Draw %",
+    "away_win": "Away win %",
+    "Attendance": "Attendance",
+}
+
+
+def slot(times):
+    """Kickoff slot label of each "H:MM"/"HH:MM" time (NaN if missing or unparseable)."""
+    hours = pd.to_numeric(times.str.split(":").str[0], errors="coerce")
+    starts = [start for _, start in SLOTS]
+    labels = np.array([name for name, _ in SLOTS])
+    slots = pd.Series(labels[np.searchsorted(starts, hours.fillna(0), side="right") - 1], index=times.index)
+    return slots.where(hours.notna())
+
+
+@partitioned
+@st.cache_data(max_entries=PARTITION_CACHE * len(GROUPINGS))
+def effects(by, partition=None):
+    """Per group of ``by`` ("Day" or "slot"): matches and each metric with its interval."""
+    fixtures = load_fixtures().dropna(subset=["HomeScore", "AwayScore"])
+    keys = fixtures["Day"] if by == "Day" else slot(fixtures["Time"].fillna(""))
+    order = DAYS if by == "Day" else [name for name, _ in SLOTS]
+    present = [name for name in order if name in set(keys)]
+    groups = pd.Categorical(keys, categories=present).codes
+    # Matches without a day or kickoff time are left out
+    known = groups >= 0
+    fixtures, groups = fixtures[known], groups[known]
+
+    goal_diff = fixtures["HomeScore"] - fixtures["AwayScore"]
+    columns = {
+        "goals": fixtures["HomeScore"] + fixtures["AwayScore"],
+        "home_win": (goal_diff > 0) * 100,
+        "draw": (goal_diff == 0) * 100,
+        "away_win": (goal_diff < 0) * 100,
+        "Attendance": fixtures["Attendance"],
+    }
+    table = pd.DataFrame({"matches": np.bincount(groups, minlength=len(present))}, index=present)
+    for metric, values in columns.items():
+        means, resampled = bootstrap_means(values.to_numpy(float), groups)
+        table[metric] = means
+        table[f"{metric}_low"], table[f"{metric}_high"] = interval(resampled)
+    return table
@@ -0,0 +1,276 @@
+"""Opt-in per-rerun timing and memory instrumentation for the pages.
+
+Enable with ``PL_PERF=1`` in the environment, or with ``?perf=1`` in the page
+URL when the operator has also set ``PL_PERF_ALLOW_QUERY=1`` (the query
+parameter would otherwise let any visitor start process-wide tracing).
+Pages mark the end of each phase; time and tracemalloc usage since the
+previous mark are attributed to that phase::
+
+    perf.start("Team Analysis")
+    df = load_data()
+    perf.lap("data load")
+    ...
+    perf.plotly_chart(fig, use_container_width=True)  # "figure build" + "chart serialization"
+    ...
+    perf.finish()  # remaining time is "render"; shows the debug panel
+
+Each finished run is
+
+- shown in a collapsible "Performance" panel at the bottom of the page,
+- logged as one JSON line on the ``analytics.perf`` logger,
+- aggregated into Prometheus text format, served at ``/metrics`` on
+  PL_STATUS_PORT (see analytics.status) and written to PL_PERF_PROM_FILE
+  when set (node-exporter textfile collector).
+
+When disabled every call is a no-op apart from ``plotly_chart``, which
+passes straight through to ``st.plotly_chart``. ``start``/``finish`` also
+bracket the optional call profile (see analytics.profiling).
+
+tracemalloc is process-wide: once instrumentation is enabled it keeps
+tracing, and concurrent sessions show up in each other's memory numbers.
+"""
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+
+import streamlit as st
+
+from analytics import profiling, status
+
+logger = logging.getLogger("analytics.perf")
+if not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+_local = threading.local()
+
+
+def _flag(name):
+    return os.environ.get(name, "").lower() in ("1", "true", "yes")
+
+
+def enabled():
+    if _flag("PL_PERF"):
+        return True
+    if not _flag("PL_PERF_ALLOW_QUERY"):
+        return False
+    try:
+        return st.query_params.get("perf") == "1"
+    except Exception:
+        return False
+
+
+class Run:
+    """Phase timings and allocations for one script (or fragment) run."""
+
+    def __init__(self, page):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self.page = page
+        self.events = []
+        self.phases = {}
+        self.started = self.last = time.perf_counter()
+        self.last_memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    def lap(self, phase, detail=None):
+        now = time.perf_counter()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        event = {
+            "phase": phase,
+            "detail": detail,
+            "ms": (now - self.last) * 1000,
+            "alloc_kb": (current - self.last_memory) / 1024,
+            "peak_kb": max(peak - self.last_memory, 0) / 1024,
+        }
+        self.last, self.last_memory = now, current
+        self.events.append(event)
+
+        totals = self.phases.setdefault(phase, {"ms": 0.0, "calls": 0, "alloc_kb": 0.0, "peak_kb": 0.0})
+        totals["ms"] += event["ms"]
+        totals["calls"] += 1
+        totals["alloc_kb"] += event["alloc_kb"]
+        totals["peak_kb"] = max(totals["peak_kb"], event["peak_kb"])
+
+    @property
+    def total_ms(self):
+        return (self.last - self.started) * 1000
+
+    def as_dict(self):
+        return {
+            "event": "page_run",
+            "page": self.page,
+            "ts": time.time(),
+            "total_ms": round(self.total_ms, 2),
+            "phases": {
+                phase: {key: round(value, 2) for key, value in totals.items()}
+                for phase, totals in self.phases.items()
+            },
+        }
+
+
+# Prometheus-style aggregates across all runs in this process
+_metrics_lock = threading.Lock()
+_runs = {}          # page -> [count, seconds]
+_phase_totals = {}  # (page, phase) -> [count, seconds, last peak bytes]
+
+
+def _record(run):
+    with _metrics_lock:
+        runs = _runs.setdefault(run.page, [0, 0.0])
+        runs[0] += 1
+        runs[1] += run.total_ms / 1000
+        for phase, totals in run.phases.items():
+            entry = _phase_totals.setdefault((run.page, phase), [0, 0.0, 0.0])
+            entry[0] += totals["calls"]
+            entry[1] += totals["ms"] / 1000
+            entry[2] = totals["peak_kb"] * 1024
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"')
+
+
+def render_prometheus():
+    """All aggregates in the Prometheus text exposition format."""
+    lines = [
+        "# HELP pl_page_run_seconds Wall time of instrumented page runs.",
+        "# TYPE pl_page_run_seconds summary",
+    ]
+    with _metrics_lock:
+        for page, (count, seconds) in sorted(_runs.items()):
+            lines.append(f'pl_page_run_seconds_count{{page="{_label(page)}"}} {count}')
+            lines.append(f'pl_page_run_seconds_sum{{page="{_label(page)}"}} {seconds:.6f}')
+        lines += [
+            "# HELP pl_page_phase_seconds Wall time spent per page phase.",
+            "# TYPE pl_page_phase_seconds summary",
+        ]
+        for (page, phase), (count, seconds, _) in sorted(_phase_totals.items()):
+            labels = f'page="{_label(page)}",phase="{_label(phase)}"'
+            lines.append(f"pl_page_phase_seconds_count{{{labels}}} {count}")
+            lines.append(f"pl_page_phase_seconds_sum{{{labels}}} {seconds:.6f}")
+        lines += [
+            "# HELP pl_page_phase_peak_bytes Transient allocation peak of the last run of a phase.",
+            "# TYPE pl_page_phase_peak_bytes gauge",
+        ]
+        for (page, phase), (_, _, peak) in sorted(_phase_totals.items()):
+            labels = f'page="{_label(page)}",phase="{_label(phase)}"'
+            lines.append(f"pl_page_phase_peak_bytes{{{labels}}} {peak:.0f}")
+    return "\n".join(lines) + "\n"
+
+
+def _write_prometheus_file():
+    path = os.environ.get("PL_PERF_PROM_FILE")
+    if not path:
+        return
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        f.write(render_prometheus())
+    os.replace(tmp, path)
+
+
+status.route("/metrics", lambda: (200, "text/plain; version=0.0.4", render_prometheus()))
+
+
+# Page API
+def _stack():
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
+
+
+def _fragment_only_run():
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    return bool(ctx and getattr(ctx, "fragment_ids_this_run", None))
+
+
+def start(page):
+    """Begin instrumenting a full page run (discards any unfinished run)."""
+    stack = _stack()
+    stack.clear()
+    if enabled():
+        status.start()
+        stack.append(Run(page))
+    profiling.begin(page)
+
+
+def lap(phase, detail=None):
+    """Attribute the time since the previous mark to ``phase``."""
+    stack = _stack()
+    if stack:
+        stack[-1].lap(phase, detail)
+
+
+def plotly_chart(fig, *args, name=None, **kwargs):
+    """``st.plotly_chart`` with figure build and serialization timed separately."""
+    lap("figure build", name)
+    result = st.plotly_chart(fig, *args, **kwargs)
+    lap("chart serialization", name)
+    return result
+
+
+def finish():
+    """Close the run: show the debug panel, log it and update the metrics."""
+    profiling.end()
+    stack = _stack()
+    if not stack:
+        return
+    run = stack[-1]
+    run.lap("render")
+    stack.pop()
+
+    _record(run)
+    logger.info(json.dumps(run.as_dict()))
+    _write_prometheus_file()
+    _panel(run)
+
+
+def fragment(name):
+    """Decorator for ``st.fragment`` bodies.
+
+    During a full page run the fragment's phases belong to the page run;
+    when the fragment re-runs on its own it is reported as a separate run.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _stack() and not _fragment_only_run():
+                return func(*args, **kwargs)
+            start(name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                finish()
+        return wrapper
+    return decorator
+
+
+def _panel(run):
+    import pandas as pd
+
+    with st.expander(f"⏱️ Performance: {run.total_ms:,.0f} ms"):
+        phases = pd.DataFrame([
+            {"Phase": phase, "ms": t["ms"], "Calls": t["calls"],
+             "Net alloc (KiB)": t["alloc_kb"], "Peak (KiB)": t["peak_kb"]}
+            for phase, t in run.phases.items()
+        ]).sort_values("ms", ascending=False)
+        st.dataframe(phases.round(1), hide_index=True, use_container_width=True)
+
+        timeline = pd.DataFrame([
+            {"Phase": e["phase"], "Detail": e["detail"] or "", "ms": e["ms"],
+             "Net alloc (KiB)": e["alloc_kb"], "Peak (KiB)": e["peak_kb"]}
+            for e in run.events
+        ])
+        st.markdown("**Timeline**")
+        st.dataframe(timeline.round(1), hide_index=True, use_container_width=True)
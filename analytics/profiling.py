@@ -0,0 +1,197 @@
+"""Per-page-run call profiles, captured on demand under real traffic.
+
+Activation:
+
+- ``PL_PROFILE=1`` profiles every page run with cProfile (``.pstats``),
+  ``PL_PROFILE=html`` uses pyinstrument instead when it is installed;
+- ``PL_PROFILE_SAMPLE=0.05`` limits env-activated profiling to a random 5%
+  of runs;
+- ``?profile=1`` / ``?profile=html`` on a page URL profiles that run only,
+  when the operator has also set ``PL_PROFILE_ALLOW_QUERY=1`` (the query
+  parameter would otherwise let any visitor slow runs and fill the disk).
+
+Profiles are hooked into ``perf.start()`` / ``perf.finish()``, so every
+page and fragment run is covered. They are written to PL_PROFILE_DIR
+(default ``.profiles/``), which is rotated down to the newest
+PL_PROFILE_KEEP files (default 200).
+
+Aggregate the hotspots of many captured runs with::
+
+    python -m analytics.profiling top --limit 25
+    python -m analytics.profiling top --page Attacking_Efficiency --sort tottime
+"""
+
+import argparse
+import cProfile
+import glob
+import logging
+import os
+import pstats
+import random
+import re
+import threading
+import time
+
+from analytics.data import ROOT
+
+logger = logging.getLogger("analytics.profiling")
+
+PROFILE_DIR = os.environ.get("PL_PROFILE_DIR", os.path.join(ROOT, ".profiles"))
+KEEP = int(os.environ.get("PL_PROFILE_KEEP", "200"))
+
+_local = threading.local()
+
+
+def requested_mode():
+    """``"pstats"``, ``"html"`` or None for the current run."""
+    import streamlit as st
+
+    param = None
+    if os.environ.get("PL_PROFILE_ALLOW_QUERY", "").lower() in ("1", "true", "yes"):
+        try:
+            param = st.query_params.get("profile")
+        except Exception:
+            pass
+    if param:
+        return "html" if param == "html" else "pstats"
+
+    env = os.environ.get("PL_PROFILE", "").lower()
+    if env in ("", "0", "false", "no"):
+        return None
+    if random.random() >= float(os.environ.get("PL_PROFILE_SAMPLE", "1")):
+        return None
+    return "html" if env == "html" else "pstats"
+
+
+def _slug(page):
+    return re.sub(r"[^A-Za-z0-9]+", "_", page).strip("_")
+
+
+def begin(page):
+    """Start profiling this thread's run if requested (stops a stale profile)."""
+    stale = getattr(_local, "active", None)
+    if stale is not None:
+        _stop(stale[1])
+        _local.active = None
+
+    mode = requested_mode()
+    if mode is None:
+        return
+
+    profiler = None
+    if mode == "html":
+        try:
+            from pyinstrument import Profiler
+
+            profiler = Profiler()
+        except ImportError:
+            logger.warning("pyinstrument is not installed; falling back to cProfile")
+            mode = "pstats"
+    if profiler is None:
+        profiler = cProfile.Profile()
+
+    try:
+        profiler.start() if mode == "html" else profiler.enable()
+    except (RuntimeError, ValueError) as exc:
+        # Only one profiler can be active per process on Python 3.12+
+        logger.warning("Skipping profile of %s: %s", page, exc)
+        return
+    _local.active = (page, profiler, mode)
+
+
+def _stop(profiler):
+    if isinstance(profiler, cProfile.Profile):
+        profiler.disable()
+    else:
+        profiler.stop()
+
+
+def end():
+    """Stop the active profile and write it; returns the file path or None."""
+    active = getattr(_local, "active", None)
+    if active is None:
+        return None
+    _local.active = None
+    page, profiler, mode = active
+    _stop(profiler)
+
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    now = time.time()
+    stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(now)) + f".{int(now * 1000) % 1000:03d}"
+    base = os.path.join(PROFILE_DIR, f"{stamp}-{_slug(page)}-{os.getpid()}-{threading.get_ident()}")
+    if mode == "html":
+        path = base + ".html"
+        with open(path, "w") as f:
+            f.write(profiler.output_html())
+    else:
+        path = base + ".pstats"
+        profiler.dump_stats(path)
+    _rotate()
+    return path
+
+
+def _rotate():
+    files = sorted(
+        glob.glob(os.path.join(PROFILE_DIR, "*.pstats")) + glob.glob(os.path.join(PROFILE_DIR, "*.html")),
+        key=os.path.getmtime,
+    )
+    for path in files[:-KEEP] if KEEP else []:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+# CLI
+def _profiles(directory, page=None):
+    pattern = f"*-{_slug(page)}-*.pstats" if page else "*.pstats"
+    return sorted(glob.glob(os.path.join(directory, pattern)))
+
+
+def top(directory=PROFILE_DIR, page=None, limit=30, sort="cumulative"):
+    """Print the hottest functions summed across all captured runs."""
+    files = _profiles(directory, page)
+    if not files:
+        print(f"No .pstats profiles in {directory}")
+        return 1
+    stats = pstats.Stats(files[0])
+    for path in files[1:]:
+        stats.add(path)
+    print(f"{len(files)} profiled runs from {directory}")
+    stats.strip_dirs().sort_stats(sort).print_stats(limit)
+    return 0
+
+
+def list_profiles(directory=PROFILE_DIR, page=None):
+    files = _profiles(directory, page)
+    counts = {}
+    for path in files:
+        name = os.path.basename(path).split("-")[2]
+        counts[name] = counts.get(name, 0) + 1
+    for name, count in sorted(counts.items()):
+        print(f"{name:<30} {count:>5} runs")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Aggregate captured page profiles.")
+    parser.add_argument("--dir", default=PROFILE_DIR, help="profile directory")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    top_parser = sub.add_parser("top", help="hotspots across all captured runs")
+    top_parser.add_argument("--page", help="only runs of this page, e.g. Attacking_Efficiency")
+    top_parser.add_argument("--limit", type=int, default=30)
+    top_parser.add_argument(
+        "--sort", default="cumulative", choices=["cumulative", "tottime", "ncalls"],
+    )
+    list_parser = sub.add_parser("list", help="captured runs per page")
+    list_parser.add_argument("--page")
+
+    args = parser.parse_args(argv)
+    if args.command == "top":
+        return top(args.dir, args.page, args.limit, args.sort)
+    return list_profiles(args.dir, args.page)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
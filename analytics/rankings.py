@@ -0,0 +1,113 @@
+"""Power rankings from the results graph: Colley, Massey and PageRank.
+
+Played fixtures are kept as edge lists (home, away, goal margin), and every
+operator is applied through ``np.bincount`` scatters over those edges, the
+coordinate (COO) form of a sparse matrix, so memory and time grow with the
+number of matches rather than teams squared. The Colley and Massey systems
+are symmetric positive definite and are solved by conjugate gradients;
+PageRank is a power iteration.
+
+- Colley: (2I + D - N) r = 1 + (wins - losses) / 2, draws counting half;
+- Massey: (D - N + 11') r = goal difference, which pins mean(r) at zero;
+- PageRank: each loss is a link from the loser to the winner, weighted by
+  the margin (draws link both ways with weight 1/2), damped at 0.85.
+
+D is the diagonal of matches played and N[i, j] the matches between i and j.
+With several leagues that never meet, Massey ratings are only comparable
+within a league (conjugate gradients still converge, to zero mean overall).
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from analytics.data import PARTITION_CACHE, load_fixtures, partitioned
+
+DAMPING = 0.85
+METHODS = {"colley": "Colley", "massey": "Massey", "pagerank": "PageRank"}
+
+
+def edges(fixtures, teams):
+    """(home rows, away rows, home goal margin) of the played fixtures."""
+    index = {team: i for i, team in enumerate(teams)}
+    return (
+        fixtures["Home"].map(index).to_numpy(np.intp),
+        fixtures["Away"].map(index).to_numpy(np.intp),
+        (fixtures["HomeScore"] - fixtures["AwayScore"]).to_numpy(float),
+    )
+
+
+def _opponents(h, a, x, n):
+    """N @ x: each team's sum of ``x`` over its opponents, one term per match."""
+    return np.bincount(h, x[a], n) + np.bincount(a, x[h], n)
+
+
+def conjugate_gradient(matvec, b, tol=1e-10, iterations=1000):
+    """Solve A x = b for symmetric positive definite A given as ``matvec``."""
+    x = np.zeros_like(b)
+    r = b - matvec(x)
+    p = r.copy()
+    rr = r.dot(r)
+    for _ in range(iterations):
+        if np.sqrt(rr) <= tol * max(1.0, np.linalg.norm(b)):
+            break
+        Ap = matvec(p)
+        alpha = rr / p.dot(Ap)
+        x += alpha * p
+        r -= alpha * Ap
+        rr, previous = r.dot(r), rr
+        p = r + rr / previous * p
+    return x
+
+
+def colley(h, a, margin, n):
+    games = np.bincount(h, minlength=n) + np.bincount(a, minlength=n)
+    result = np.sign(margin)
+    wins_minus_losses = np.bincount(h, result, n) - np.bincount(a, result, n)
+    return conjugate_gradient(
+        lambda x: (2 + games) * x - _opponents(h, a, x, n), 1 + wins_minus_losses / 2,
+    )
+
+
+def massey(h, a, margin, n):
+    games = np.bincount(h, minlength=n) + np.bincount(a, minlength=n)
+    goal_difference = np.bincount(h, margin, n) - np.bincount(a, margin, n)
+    return conjugate_gradient(
+        lambda x: games * x - _opponents(h, a, x, n) + x.sum(), goal_difference,
+    )
+
+
+def pagerank(h, a, margin, n, damping=DAMPING, tol=1e-12, iterations=1000):
+    if not n:
+        return np.zeros(0)
+    # Links loser -> winner; a draw links both ways
+    draw = margin == 0
+    source = np.concatenate([np.where(margin > 0, a, h), a[draw]])
+    target = np.concatenate([np.where(margin > 0, h, a), h[draw]])
+    weight = np.concatenate([np.where(draw, 0.5, np.abs(margin)), np.full(draw.sum(), 0.5)])
+    out = np.bincount(source, weight, n)
+    share = weight / out[source]
+
+    rank = np.full(n, 1 / n)
+    for _ in range(iterations):
+        # Unbeaten teams have no out-links; spread their rank evenly
+        dangling = rank[out == 0].sum()
+        new = (1 - damping) / n + damping * (np.bincount(target, rank[source] * share, n) + dangling / n)
+        if np.abs(new - rank).sum() < tol:
+            return new
+        rank = new
+    return rank
+
+
+@partitioned
+@st.cache_data(max_entries=PARTITION_CACHE)
+def ratings(partition=None):
+    """Colley, Massey and PageRank rating and rank of every team (none before the first result)."""
+    fixtures = load_fixtures().dropna(subset=["HomeScore", "AwayScore"])
+    teams = sorted(set(fixtures["Home"]) | set(fixtures["Away"]))
+    h, a, margin = edges(fixtures, teams)
+    table = pd.DataFrame({"team": teams})
+    for method, solve in [("colley", colley), ("massey", massey), ("pagerank", pagerank)]:
+        table[method] = solve(h, a, margin, len(teams))
+        table[f"{method}_rank"] = table[method].rank(ascending=False, method="min").astype(int)
+    return table
@@ -0,0 +1,138 @@
+"""Hot reload of published data snapshots.
+
+When ``python -m analytics.ingest`` publishes a new version of a partition,
+the server keeps serving the previous version while a background thread
+loads the new one and builds each page's default figures for it (the same
+tasks as analytics.warmup). Only then is the partition switched over, in a
+single dict assignment, so no visitor runs against cold caches. Entries
+keyed on the old version are not cleared; they age out of the bounded
+caches (PL_PARTITION_CACHE) as new-version entries replace them.
+
+The watcher polls the partitions' ``CURRENT`` files every
+PL_RELOAD_INTERVAL seconds (default 5; 0 disables polling). On
+PL_STATUS_PORT, ``GET /reload`` reports the served and pending versions
+and ``POST /reload`` (which needs PL_STATUS_TOKEN, see analytics.status)
+checks for new versions immediately, returning once they are warm and live.
+"""
+
+import concurrent.futures
+import json
+import logging
+import os
+import threading
+import time
+
+from analytics import data, status, warmup
+
+logger = logging.getLogger("analytics.reload")
+
+INTERVAL = float(os.environ.get("PL_RELOAD_INTERVAL", "5"))
+
+_lock = threading.Lock()
+_swaps = []
+_thread = None
+
+
+def pending():
+    """{partition: (served version, published version)} awaiting a switch."""
+    changes = {}
+    for partition in data.partitions():
+        served, latest = data.version(partition), data.published(partition)
+        if served != latest:
+            changes[partition] = (served, latest)
+    return changes
+
+
+def _in_dataset(key, func):
+    # Context variables don't follow tasks into pool threads; set it in there
+    def task(*args):
+        with data.using(key):
+            return func(*args)
+    return task
+
+
+def prepare(partition, version, workers=warmup.WORKERS):
+    """Warm every loader and default figure for ``version`` of ``partition``."""
+    key = tuple(partition) + (version,)
+    tasks = [(loader.__name__, loader, ()) for loader in data.LOADERS] + warmup.FIGURES
+    with concurrent.futures.ThreadPoolExecutor(workers, thread_name_prefix=warmup.THREAD_PREFIX) as pool:
+        # Datasets first, so the figure builders don't all miss on the same CSV
+        for stage in (tasks[:len(data.LOADERS)], tasks[len(data.LOADERS):]):
+            futures = {pool.submit(_in_dataset(key, func), *args): name for name, func, args in stage}
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    future.result()
+                except Exception:
+                    logger.exception("Warming %s of %s/%s@%s failed", futures[future], *key)
+
+
+def _pin_new():
+    # Partitions that appeared since the last check start at their published version
+    pinned = data.pinned()
+    for partition in data.partitions():
+        if partition not in pinned:
+            data.serve_version(partition, data.published(partition))
+
+
+def check():
+    """Warm and switch to every newly published version; returns the switches."""
+    with _lock:
+        _pin_new()
+        switched = []
+        for partition, (served, latest) in pending().items():
+            started = time.perf_counter()
+            if latest is not None:
+                prepare(partition, latest)
+            data.serve_version(partition, latest)
+            swap = {
+                "partition": "/".join(partition), "from": served, "to": latest,
+                "warm_seconds": round(time.perf_counter() - started, 3), "at": time.time(),
+            }
+            logger.info("Now serving %s version %s (was %s), warmed in %.2f s",
+                        swap["partition"], latest, served, swap["warm_seconds"])
+            switched.append(swap)
+        _swaps.extend(switched)
+        del _swaps[:-20]
+        return switched
+
+
+def snapshot():
+    served = {"/".join(partition): data.version(partition) for partition in data.partitions()}
+    pending_versions = {"/".join(partition): latest for partition, (_, latest) in pending().items()}
+    return {"served": served, "pending": pending_versions, "recent": list(_swaps)}
+
+
+def _get():
+    return 200, "application/json", json.dumps(snapshot()) + "\n"
+
+
+def _post():
+    return 200, "application/json", json.dumps({"switched": check()}) + "\n"
+
+
+status.route("/reload", _get)
+status.route("/reload", _post, method="POST")
+
+
+def _watch(interval):
+    while True:
+        time.sleep(interval)
+        try:
+            check()
+        except Exception:
+            logger.exception("Reload check failed")
+
+
+def start(interval=INTERVAL):
+    """Pin the versions published now and watch for new ones (once)."""
+    global _thread
+    with _lock:
+        if _thread is not None:
+            return _thread
+        _pin_new()
+        if interval > 0:
+            _thread = threading.Thread(
+                target=_watch, args=(interval,), name=f"{warmup.THREAD_PREFIX}-reload", daemon=True,
+            )
+            _thread.start()
+    return _thread
@@ -0,0 +1,71 @@
+"""Batched bootstrap and shrinkage helpers shared by the analytics modules.
+
+``bootstrap_means`` resamples every group at once: with the values sorted
+by group, one (resamples x values) uniform matrix becomes indices into
+each value's own group, and ``np.add.reduceat`` sums every group of every
+resample in one call, with no loop over groups.
+"""
+
+import warnings
+
+import numpy as np
+
+RESAMPLES = 2000
+CONFIDENCE = 0.95
+
+
+def bootstrap_means(values, groups, resamples=RESAMPLES, seed=0):
+    """(means, resampled means) per group, NaN values ignored.
+
+    ``groups`` are integer codes 0..k-1, each occurring at least once; the
+    result arrays are (k,) and (resamples, k), with k = 0 for no values.
+    """
+    if not len(values):
+        return np.zeros(0), np.zeros((resamples, 0))
+    order = np.argsort(groups, kind="stable")
+    values, groups = values[order], groups[order]
+    sizes = np.bincount(groups)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+
+    # One index matrix: each column draws from its own match's group
+    draws = np.random.default_rng(seed).random((resamples, len(values)))
+    index = starts[groups] + (draws * sizes[groups]).astype(int)
+    sample = values[index]
+    present = ~np.isnan(sample)
+    sums = np.add.reduceat(np.where(present, sample, 0), starts, axis=1)
+    counts = np.add.reduceat(present, starts, axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        resampled = sums / counts
+        means = np.bincount(groups, np.nan_to_num(values), len(sizes)) / np.bincount(
+            groups, ~np.isnan(values), len(sizes)
+        )
+    return means, resampled
+
+
+def interval(resampled, confidence=CONFIDENCE):
+    """(low, high) percentile interval of each column."""
+    low, high = (1 - confidence) / 2, (1 + confidence) / 2
+    if not resampled.shape[1]:
+        # np.nanquantile drops the quantile axis when there are no columns
+        return np.empty((2, 0))
+    with warnings.catch_warnings():
+        # A group with no values has no interval
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return np.nanquantile(resampled, [low, high], axis=0)
+
+
+def shrink(estimates, variances):
+    """Empirical-Bayes shrinkage of noisy estimates towards their mean.
+
+    Each estimate moves towards the precision-weighted mean by its share of
+    the total variance, tau^2 / (tau^2 + variance), where tau^2 is the
+    between-group variance left after the sampling noise (method of
+    moments).
+    """
+    if not len(estimates):
+        return np.zeros(0)
+    variances = np.maximum(variances, 1e-12)
+    mean = np.average(estimates, weights=1 / variances)
+    tau2 = max(np.var(estimates) - np.mean(variances), 0.0)
+    return mean + tau2 / (tau2 + variances) * (estimates - mean)
+
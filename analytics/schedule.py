@@ -0,0 +1,111 @@
+"""Strength of schedule and fixture difficulty.
+
+The season's fixtures become a team x gameweek grid of opponent and venue.
+The grid depends only on the schedule (week, home, away), and is cached on
+that, so a new round of results reuses it; the difficulty of every cell is
+then one gather from the current opponent ratings.
+
+An opponent's rating is its mean expected points (0-3) against every other
+team under the Dixon-Coles model, separately at home and away, so a
+fixture's difficulty reflects the venue as well as the opponent.
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from analytics.data import PARTITION_CACHE, load_fixtures, partitioned
+from analytics.dixon_coles import DECAY, all_pairings
+
+SCHEDULE = ["week", "Home", "Away"]
+
+
+class FixtureGrid:
+    """``opponent[i, w]`` is the row of team i's opponent in ``weeks[w]`` (-1 if none)."""
+
+    def __init__(self, teams, weeks, opponent, home):
+        self.teams = list(teams)
+        self.weeks = list(weeks)
+        self.opponent = opponent
+        self.home = home
+
+
+@st.cache_data(max_entries=PARTITION_CACHE * 4)
+def _grid(schedule):
+    teams = sorted(set(schedule["Home"]) | set(schedule["Away"]))
+    weeks = sorted(schedule["week"].astype(int).unique())
+    h = pd.Categorical(schedule["Home"], categories=teams).codes
+    a = pd.Categorical(schedule["Away"], categories=teams).codes
+    w = np.searchsorted(weeks, schedule["week"].astype(int))
+
+    opponent = np.full((len(teams), len(weeks)), -1)
+    home = np.zeros(opponent.shape, dtype=bool)
+    opponent[h, w], opponent[a, w] = a, h
+    home[h, w] = True
+    return FixtureGrid(teams, weeks, opponent, home)
+
+
+def fixture_grid():
+    """The FixtureGrid of the current season's schedule."""
+    return _grid(load_fixtures()[SCHEDULE].dropna())
+
+
+@partitioned
+@st.cache_data(max_entries=PARTITION_CACHE)
+def played_grid(partition=None):
+    """Team x gameweek mask of the fixtures that have a result."""
+    grid = fixture_grid()
+    fixtures = load_fixtures().dropna(subset=["week", "HomeScore", "AwayScore"])
+    index = {team: i for i, team in enumerate(grid.teams)}
+    w = np.searchsorted(grid.weeks, fixtures["week"].astype(int))
+    played = np.zeros(grid.opponent.shape, dtype=bool)
+    played[fixtures["Home"].map(index).to_numpy(np.intp), w] = True
+    played[fixtures["Away"].map(index).to_numpy(np.intp), w] = True
+    return played
+
+
+@partitioned
+@st.cache_data(max_entries=PARTITION_CACHE)
+def opponent_ratings(decay=DECAY, partition=None):
+    """(at home, away): each team's mean expected points against the rest of the league."""
+    teams = fixture_grid().teams
+    pairings = all_pairings(decay)
+    index = {team: i for i, team in enumerate(teams)}
+    n = len(teams)
+    h = pairings["Home"].map(index).to_numpy(np.intp)
+    a = pairings["Away"].map(index).to_numpy(np.intp)
+    # Teams yet to play a match have no rating (NaN)
+    with np.errstate(invalid="ignore"):
+        at_home = np.bincount(h, 3 * pairings["home_win"] + pairings["draw"], n) / np.bincount(h, minlength=n)
+        away = np.bincount(a, 3 * pairings["away_win"] + pairings["draw"], n) / np.bincount(a, minlength=n)
+    return at_home, away
+
+
+@partitioned
+@st.cache_data(max_entries=PARTITION_CACHE)
+def difficulty(decay=DECAY, partition=None):
+    """Team x gameweek difficulty: the opponent's rating at its venue (NaN if no fixture)."""
+    grid = fixture_grid()
+    at_home, away = opponent_ratings(decay)
+    opponent = np.maximum(grid.opponent, 0)
+    # A home fixture faces the opponent away, and vice versa
+    cells = np.where(grid.home, away[opponent], at_home[opponent])
+    return np.where(grid.opponent >= 0, cells, np.nan)
+
+
+@partitioned
+@st.cache_data(max_entries=PARTITION_CACHE)
+def strength_of_schedule(decay=DECAY, partition=None):
+    """Mean fixture difficulty per team, played and remaining."""
+    grid = fixture_grid()
+    cells = difficulty(decay)
+    played = played_grid()
+    scheduled = grid.opponent >= 0
+    remaining = scheduled & ~played
+    with np.errstate(invalid="ignore"):
+        return pd.DataFrame({
+            "team": grid.teams,
+            "played": np.where(played, cells, 0).sum(axis=1) / played.sum(axis=1),
+            "remaining": np.where(remaining, cells, 0).sum(axis=1) / remaining.sum(axis=1),
+            "fixtures_left": remaining.sum(axis=1),
+        })
@@ -0,0 +1,85 @@
+"""Scoreline frequency cube.
+
+``cube()`` counts every played fixture into a dense array indexed
+[team, side, week, home goals, away goals], with one ``np.bincount`` over
+flat indices. Each match is counted twice, once for the home team (side
+HOME) and once for the away team (side AWAY), always oriented home-away.
+Questions are then slices and sums rather than row filters:
+
+- how often Arsenal win 1-0 away: ``counts[arsenal, AWAY, :, 0, 1].sum()``
+- total goals by gameweek: ``total_goals(counts[:, HOME].sum(axis=0))``
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from analytics.data import PARTITION_CACHE, load_fixtures, partitioned
+
+HOME, AWAY = 0, 1
+SIDES = {HOME: "Home", AWAY: "Away"}
+# Goals above this are counted in the last row/column ("9+")
+MAX_GOALS = 9
+
+
+class ScorelineCube:
+    """``counts[t, s, w, h, a]``: matches of ``teams[t]`` on side s in ``weeks[w]`` ending h-a."""
+
+    def __init__(self, teams, weeks, counts):
+        self.teams = list(teams)
+        self.index = {team: i for i, team in enumerate(self.teams)}
+        self.weeks = list(weeks)
+        self.counts = counts
+
+    def scorelines(self, team=None, side=None, weeks=None):
+        """Home x away goal counts; ``weeks`` is an inclusive (first, last) range."""
+        counts = self.counts
+        if weeks is not None:
+            first, last = np.searchsorted(self.weeks, weeks[0]), np.searchsorted(self.weeks, weeks[1], "right")
+            counts = counts[:, :, first:last]
+        if team is None:
+            # Every match once, through its home team
+            return counts[:, HOME if side is None else side].sum(axis=(0, 1))
+        sides = counts[self.index[team]]
+        return sides.sum(axis=(0, 1)) if side is None else sides[side].sum(axis=0)
+
+    def record(self, team, side=None, weeks=None):
+        """(won, drawn, lost) of ``team``, on one side or both."""
+        sides = list(SIDES) if side is None else [side]
+        return tuple(np.sum([outcomes(self.scorelines(team, s, weeks), s) for s in sides], axis=0))
+
+    def total_goals(self):
+        """Week x total goals match counts (the last column is 2 * MAX_GOALS or more)."""
+        by_week = self.counts[:, HOME].sum(axis=0).reshape(len(self.weeks), -1)
+        goals = np.add.outer(np.arange(MAX_GOALS + 1), np.arange(MAX_GOALS + 1)).ravel()
+        return by_week @ np.eye(2 * MAX_GOALS + 1, dtype=by_week.dtype)[goals]
+
+
+def outcomes(grid, side=None):
+    """(wins, draws, losses) of a home x away grid, from ``side``'s point of view (home by default)."""
+    home, draw, away = np.tril(grid, -1).sum(), np.trace(grid), np.triu(grid, 1).sum()
+    return (away, draw, home) if side == AWAY else (home, draw, away)
+
+
+@partitioned
+@st.cache_data(max_entries=PARTITION_CACHE)
+def cube(partition=None):
+    """The ScorelineCube of the current season's played fixtures."""
+    fixtures = load_fixtures().dropna(subset=["week", "HomeScore", "AwayScore"])
+    teams = sorted(set(fixtures["Home"]) | set(fixtures["Away"]))
+    weeks = sorted(fixtures["week"].astype(int).unique())
+    goals = MAX_GOALS + 1
+    shape = (len(teams), 2, len(weeks), goals, goals)
+
+    team = np.concatenate([
+        pd.Categorical(fixtures["Home"], categories=teams).codes,
+        pd.Categorical(fixtures["Away"], categories=teams).codes,
+    ])
+    side = np.repeat([HOME, AWAY], len(fixtures))
+    week = np.tile(np.searchsorted(weeks, fixtures["week"].astype(int)), 2)
+    home_goals = np.tile(np.minimum(fixtures["HomeScore"].to_numpy(int), MAX_GOALS), 2)
+    away_goals = np.tile(np.minimum(fixtures["AwayScore"].to_numpy(int), MAX_GOALS), 2)
+
+    flat = np.ravel_multi_index((team, side, week, home_goals, away_goals), shape)
+    counts = np.bincount(flat, minlength=np.prod(shape)).reshape(shape).astype(np.int32)
+    return ScorelineCube(teams, weeks, counts)
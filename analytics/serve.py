@@ -0,0 +1,97 @@
+"""Production entry point: warm the process up, then start Streamlit.
+
+    python -m analytics.serve --server.port $PORT --server.address 0.0.0.0
+
+Arguments are passed through to ``streamlit run app.py``. Before the server
+opens its port this process imports the heavy modules the pages need and
+pre-builds the landing page's cached data, so the first visitor after a
+cold start doesn't pay for them. The remaining datasets and each page's
+default figures are then warmed in the background (see analytics.warmup),
+with readiness reported at ``/healthz`` on PL_STATUS_PORT, and newly
+published data snapshots are warmed before they go live (see
+analytics.reload). Set PL_WARMUP=0 to skip all of this.
+"""
+
+import logging
+import os
+import sys
+import time
+
+logger = logging.getLogger("analytics.serve")
+
+# Not imported from analytics.data: that would create its caches before the
+# warm-up has silenced Streamlit's bare-mode warnings
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LANDING_IMAGES = [
+    "images/ball_prog.png",
+    "images/goalscoring.png",
+    "images/team_analysis.png",
+    "images/attacking_efficiency.png",
+    "images/age_distribution.png",
+    "images/ball_possession.png",
+]
+
+
+def preimport():
+    """Import what the pages import lazily or on first use."""
+    import numpy  # noqa: F401
+    import pandas  # noqa: F401
+    import plotly.express  # noqa: F401
+    import plotly.graph_objects as go
+    import plotly.io as pio
+
+    # graph_objects loads its trace classes lazily; build and serialize the
+    # kinds the pages use once so their validators are imported too
+    fig = go.Figure([go.Scatter(), go.Bar(), go.Pie(), go.Heatmap(), go.Scatterternary()])
+    pio.to_json(fig, validate=False)
+
+
+def build_landing_page():
+    from analytics.charts.home import standings_table
+    from analytics.data import card_image
+
+    standings_table()
+    for path in LANDING_IMAGES:
+        card_image(path)
+
+
+def warm_up():
+    started = time.perf_counter()
+    # Streamlit warns about the missing runtime for every cached function
+    logging.disable(logging.WARNING)
+    try:
+        preimport()
+        imported = time.perf_counter()
+        build_landing_page()
+        # Creates the page caches, which warns once per function too
+        from analytics import reload, warmup  # noqa: F401
+    finally:
+        logging.disable(logging.NOTSET)
+    logger.info(
+        "Warm-up done: imports %.0f ms, landing page %.0f ms",
+        (imported - started) * 1000,
+        (time.perf_counter() - imported) * 1000,
+    )
+
+
+def main(argv=None):
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s: %(message)s")
+    argv = sys.argv[1:] if argv is None else argv
+    if os.environ.get("PL_WARMUP", "1") != "0":
+        warm_up()
+
+        from analytics import reload, status, warmup
+
+        status.start()
+        warmup.start()
+        reload.start()
+
+    from streamlit.web import cli
+
+    sys.argv = ["streamlit", "run", os.path.join(ROOT, "app.py"), *argv]
+    return cli.main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
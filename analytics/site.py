@@ -0,0 +1,283 @@
+"""Render every dashboard into a static HTML site.
+
+    python -m analytics.site --out site/
+    python -m analytics.site --out site/ --workers 8
+    python -m analytics.site --out site/ --league premier-league --season 2023-24
+
+The site has the standings (``index.html``), one page per dashboard and one
+Team Analysis page per team under ``teams/``. Pages are rendered in a
+process pool straight from the figure builders in analytics.charts; they
+all load a single shared ``plotly.min.js`` instead of inlining it, so the
+output can be served from any static host or CDN. ``--league``/``--season``
+pick the partition (default the app's), whose published version is pinned
+for the whole export; set PL_DATA_DIR to export another dataset.
+"""
+
+import argparse
+import concurrent.futures
+import html
+import logging
+import os
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (file, nav title, kind) of the dashboard pages; Team Analysis pages are
+# added per team
+PAGES = [
+    ("index.html", "Standings", "home"),
+    ("ball-progression.html", "Ball Progression", "progression"),
+    ("goalscoring-analysis.html", "Goalscoring Analysis", "goalscoring"),
+    ("age-distribution.html", "Age Distribution", "age"),
+    ("attacking-efficiency.html", "Attacking Efficiency", "attacking"),
+    ("ball-possession.html", "Ball Possession", "possession"),
+]
+
+TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title} - {label}</title>
+<script src="{root}plotly.min.js"></script>
+<style>
+body {{ font-family: sans-serif; margin: 0 auto; max-width: 1200px; padding: 0 16px 40px; }}
+nav {{ display: flex; flex-wrap: wrap; gap: 16px; padding: 16px 0; border-bottom: 1px solid #ddd; }}
+nav a {{ color: #37003c; text-decoration: none; font-weight: bold; }}
+h1 {{ text-align: center; }}
+table {{ border-collapse: collapse; width: 100%; }}
+th {{ background: #37003c; color: white; padding: 8px; }}
+td {{ text-align: center; padding: 6px; border-bottom: 1px solid #eee; }}
+.teams {{ columns: 4; }}
+</style>
+</head>
+<body>
+<nav>{nav}</nav>
+<h1>{title}</h1>
+{body}
+</body>
+</html>
+"""
+
+
+def slug(name):
+    return re.sub(r"[^A-Za-z0-9]+", "-", name).strip("-").lower()
+
+
+def team_file(team):
+    return f"teams/{slug(team)}.html"
+
+
+# Page bodies, run inside the worker processes
+def _figure(fig):
+    return fig.to_html(
+        full_html=False, include_plotlyjs=False, default_width="100%", config={"responsive": True},
+    )
+
+
+def _sections(sections):
+    return "\n".join(f"<h2>{html.escape(heading)}</h2>\n{_figure(fig)}" for heading, fig in sections)
+
+
+def _table(df):
+    return df.to_html(index=False, border=0, escape=True)
+
+
+def home_body(teams):
+    from analytics.charts.home import standings_table
+    from analytics.data import current, league_label, season_label
+
+    league, season = current()
+    heading = html.escape(f"{league_label(league)} Table {season_label(season)}")
+    links = "".join(f'<li><a href="{team_file(team)}">{html.escape(team)}</a></li>' for team in teams)
+    return (
+        f"<h2>{heading}</h2>\n" + _table(standings_table())
+        + f'\n<h2>Team Analysis</h2>\n<ul class="teams">{links}</ul>'
+    )
+
+
+def progression_figures():
+    from analytics.charts import progression
+
+    positions, sliders = progression.DEFAULT_POSITIONS, progression.DEFAULT_SLIDERS
+    return [
+        ("Season totals", progression.build_progression_graph(positions, False, *sliders)),
+        ("Per 90", progression.build_progression_graph(positions, True, *sliders)),
+    ]
+
+
+def goalscoring_figures():
+    from analytics.charts import goalscoring
+
+    return [
+        (analysis, goalscoring.build_figure(analysis, goalscoring.TOP_CHOICES[0]))
+        for analysis in goalscoring.ANALYSES
+    ]
+
+
+def team_figures(team):
+    from analytics.charts.team import build_figures
+
+    figures = build_figures(team)
+    return [
+        ("Goals Scored v/s Expected Goals", figures["goals vs xG"]),
+        ("Avg. Possession %", figures["possession"]),
+        ("Squad Composition", figures["squad composition"]),
+        ("Top 5 Dribblers", figures["dribblers"]),
+        ("Top 5 Progressive Carriers", figures["carriers"]),
+        ("Top 5 Progressive Pass Recipients", figures["receivers"]),
+        ("Touch Distribution: Defenders", figures["ternary: defenders"]),
+        ("Touch Distribution: Midfielders", figures["ternary: midfielders"]),
+        ("Touch Distribution: Forwards", figures["ternary: forwards"]),
+        ("Progressive Carries Contribution", figures["carries contribution"]),
+        ("Progressive Passes Contribution", figures["passes contribution"]),
+    ]
+
+
+def age_figures():
+    from analytics.charts.age import build_figures
+
+    figures = build_figures()
+    return [
+        ("Minutes Played by Birth Year and Team", figures["team heatmap"]),
+        ("Minutes Played by Birth Year and Position", figures["position heatmap"]),
+    ]
+
+
+def attacking_figures():
+    from analytics.charts.attacking import build_figures
+
+    figures = build_figures()
+    return [
+        ("Top 20 Players by Take-On Success Rate", figures["success rate"]),
+        ("Take-On Efficiency Bubble Chart", figures["bubble"]),
+        ("Efficiency vs Risk Balance", figures["mirror"]),
+        ("Dribbling vs Progression Efficiency", figures["quadrant"]),
+    ]
+
+
+def possession_figures():
+    from analytics.charts.possession import build_figures
+
+    figures = build_figures()
+    return [
+        ("Carries Volume vs Progressiveness", figures["carries scatter"]),
+        ("Top Ball Carriers by Total Distance", figures["distance bars"]),
+    ]
+
+
+# kind -> (heading, figure) for every chart of that page, in page order.
+# The image exporter (analytics.images) renders the same charts.
+FIGURES = {
+    "progression": progression_figures,
+    "goalscoring": goalscoring_figures,
+    "team": team_figures,
+    "age": age_figures,
+    "attacking": attacking_figures,
+    "possession": possession_figures,
+}
+
+
+def figures(kind, arg=None):
+    """Charts of one page, skipping those without data."""
+    if kind not in FIGURES:
+        return []
+    sections = FIGURES[kind](*([] if arg is None else [arg]))
+    return [(heading, fig) for heading, fig in sections if fig is not None]
+
+
+def page_body(kind, arg=None):
+    if kind == "home":
+        return home_body(arg)
+    body = _sections(figures(kind, arg))
+    if kind == "team":
+        from analytics.data import load_player_stats
+
+        df = load_player_stats()
+        squad = df[df["team"] == arg][["name", "position", "goals", "assists", "minutes"]]
+        body += "\n<h2>Full Squad</h2>\n" + _table(squad.sort_values("minutes", ascending=False))
+    return body
+
+
+def _init_worker():
+    # The builders run without a Streamlit runtime, which it warns about
+    logging.disable(logging.WARNING)
+
+
+def render(out_dir, key, path, title, kind, arg=None):
+    """Write one page of the dataset ``key``; returns (path, bytes, ms)."""
+    from analytics.data import label, using
+
+    started = time.perf_counter()
+    with using(key):
+        body = page_body(kind, arg)
+    root = "../" * path.count("/")
+    nav = " ".join(f'<a href="{root}{file}">{html.escape(name)}</a>' for file, name, _ in PAGES)
+    page = TEMPLATE.format(
+        title=html.escape(title), label=html.escape(label(key)), root=root, nav=nav, body=body,
+    )
+
+    target = os.path.join(out_dir, path)
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    with open(target, "w", encoding="utf-8") as f:
+        f.write(page)
+    return path, len(page.encode()), (time.perf_counter() - started) * 1000
+
+
+def jobs(teams):
+    """(path, title, kind, arg) for every page of the site."""
+    result = [
+        (path, title, kind, teams if kind == "home" else None) for path, title, kind in PAGES
+    ]
+    result += [(team_file(team), f"{team}: Team Analysis", "team", team) for team in teams]
+    return result
+
+
+def export(out_dir, workers=None, partition=None):
+    _init_worker()
+    from plotly.offline import get_plotlyjs
+
+    from analytics.data import DEFAULT_PARTITION, dataset, load_player_stats, using
+
+    started = time.perf_counter()
+    os.makedirs(out_dir, exist_ok=True)
+    with open(os.path.join(out_dir, "plotly.min.js"), "w", encoding="utf-8") as f:
+        f.write(get_plotlyjs())
+
+    # Every worker renders the same published version
+    key = dataset(partition or DEFAULT_PARTITION)
+    with using(key):
+        teams = sorted(load_player_stats()["team"].unique())
+    failures = []
+    with concurrent.futures.ProcessPoolExecutor(workers, initializer=_init_worker) as pool:
+        futures = {pool.submit(render, out_dir, key, *job): job[0] for job in jobs(teams)}
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                path, size, ms = future.result()
+            except Exception as exc:
+                failures.append(f"{futures[future]}: {exc!r}")
+                continue
+            print(f"{path:<45} {size / 1024:>8.0f} KiB {ms:>8.0f} ms")
+
+    print(f"{len(futures) - len(failures)} pages written to {out_dir} in {time.perf_counter() - started:.1f} s")
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+def main(argv=None):
+    from analytics.data import DEFAULT_PARTITION
+
+    parser = argparse.ArgumentParser(description="Render every dashboard into a static HTML site.")
+    parser.add_argument("--out", default=os.path.join(ROOT, "site"), help="output directory")
+    parser.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument("--league", default=DEFAULT_PARTITION[0], help="league of the partition to export")
+    parser.add_argument("--season", default=DEFAULT_PARTITION[1], help="season of the partition to export")
+    args = parser.parse_args(argv)
+    return export(args.out, args.workers, (args.league, args.season))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""Embedded SQL over the season CSVs.
+
+The six CSVs are registered as tables named after their files
+(``standings``, ``player_stats``, ``player_possession_stats``,
+``team_stats``, ``team_possession_stats``, ``fixtures``). With DuckDB
+installed (``pip install duckdb``) they are views over ``read_csv_auto``,
+so filters and aggregates are pushed down into the scan and the data never
+has to fit in pandas; otherwise they are loaded into an in-memory SQLite
+database from the shared loaders. Set PL_SQL_ENGINE=sqlite to force the
+fallback.
+
+Ad-hoc queries come from the public SQL Query page, so the DuckDB
+connection may only read the six CSVs: external access is switched off
+once the views exist, with the CSVs as the only allowed paths, and the
+configuration is locked (DuckDB 1.2 or newer). ``ad_hoc()`` also rejects
+queries that name a file or a file-reading function outright.
+
+    from analytics.sql import query
+    query("SELECT team, SUM(goals) AS goals FROM player_stats GROUP BY team")
+"""
+
+import os
+import re
+import sqlite3
+import threading
+
+import pandas as pd
+import streamlit as st
+
+from analytics.data import (
+    PARTITION_CACHE,
+    data_path,
+    load_fixtures,
+    load_player_possession,
+    load_player_stats,
+    load_standings,
+    load_team_possession,
+    load_team_stats,
+    partitioned,
+)
+
+# table name -> loader; the CSV is <table>.csv
+TABLES = {
+    "standings": load_standings,
+    "player_stats": load_player_stats,
+    "player_possession_stats": load_player_possession,
+    "team_stats": load_team_stats,
+    "team_possession_stats": load_team_possession,
+    "fixtures": load_fixtures,
+}
+
+# Row cap for ad-hoc queries
+MAX_ROWS = 10_000
+
+_lock = threading.Lock()
+
+
+def engine():
+    if os.environ.get("PL_SQL_ENGINE", "").lower() == "sqlite":
+        return "sqlite"
+    try:
+        import duckdb  # noqa: F401
+    except ImportError:
+        return "sqlite"
+    return "duckdb"
+
+
+# One database per league-season partition
+@partitioned
+@st.cache_resource(max_entries=PARTITION_CACHE)
+def connect(partition=None):
+    if engine() == "duckdb":
+        import duckdb
+
+        con = duckdb.connect()
+        paths = [data_path(f"{table}.csv", partition).replace("'", "''") for table in TABLES]
+        for table, path in zip(TABLES, paths):
+            con.execute(f"CREATE VIEW {table} AS SELECT * FROM read_csv_auto('{path}')")
+        # Nothing but the views' own CSVs is readable from here on
+        allowed = ", ".join(f"'{path}'" for path in paths)
+        con.execute(f"SET allowed_paths = [{allowed}]")
+        con.execute("SET enable_external_access = false")
+        con.execute("SET lock_configuration = true")
+        return con
+
+    con = sqlite3.connect(":memory:", check_same_thread=False)
+    for table, loader in TABLES.items():
+        loader().to_sql(table, con, index=False)
+    con.execute("PRAGMA query_only = ON")
+    return con
+
+
+@partitioned
+@st.cache_data(max_entries=PARTITION_CACHE * 64)
+def query(sql, params=(), partition=None):
+    """Run a query against the current partition and return a DataFrame."""
+    con = connect()
+    if engine() == "duckdb":
+        # DuckDB connections are not thread-safe; each cursor is
+        return con.cursor().execute(sql, list(params)).df()
+    with _lock:
+        return pd.read_sql_query(sql, con, params=params)
+
+
+def schema():
+    """{table: [(column, type), ...]} of every registered table."""
+    result = {}
+    for table in TABLES:
+        columns = query(f"SELECT * FROM {table} LIMIT 0")
+        result[table] = [(column, str(dtype)) for column, dtype in columns.dtypes.items()]
+    return result
+
+
+_READ_ONLY = re.compile(r"^\s*(select|with)\b", re.IGNORECASE)
+# Table functions that read files or URLs, and DuckDB's FROM '<path>' shorthand
+_FILE_ACCESS = re.compile(
+    r"\b(read_\w+|\w+_scan|glob|sniff_csv|parquet_\w+|iceberg_\w+|delta_\w+)\s*\(|\b(from|join)\s*'",
+    re.IGNORECASE,
+)
+
+
+def ad_hoc(sql, max_rows=MAX_ROWS):
+    """Run one analyst-supplied SELECT, capped at ``max_rows`` rows.
+
+    Raises ValueError for anything but a single SELECT/WITH statement, and
+    for queries that read anything but the registered tables.
+    """
+    sql = sql.strip().rstrip(";").strip()
+    if not _READ_ONLY.match(sql):
+        raise ValueError("Only SELECT (or WITH ... SELECT) queries are allowed.")
+    if ";" in sql:
+        raise ValueError("Run one statement at a time.")
+    if _FILE_ACCESS.search(sql):
+        raise ValueError("Queries can only read the registered tables.")
+    return query(f"SELECT * FROM ({sql}) LIMIT {int(max_rows)}")
@@ -0,0 +1,73 @@
+"""Small side-channel HTTP server for operational endpoints.
+
+Streamlit owns the main port, so endpoints such as ``/metrics`` are served
+from a plain ``http.server`` on PL_STATUS_PORT (disabled when unset). Other
+modules register handlers with :func:`route` and call :func:`start`, which
+is idempotent.
+
+The server listens on 127.0.0.1 unless PL_STATUS_HOST says otherwise (e.g.
+``0.0.0.0`` for a scraper or load balancer on another host). GET routes are
+open; every other method needs ``Authorization: Bearer $PL_STATUS_TOKEN``
+and is refused outright while PL_STATUS_TOKEN is unset.
+"""
+
+import hmac
+import http.server
+import os
+import threading
+
+_routes = {}
+_server = None
+_lock = threading.Lock()
+
+
+def route(path, handler, method="GET"):
+    """Register ``handler() -> (status, content_type, body)`` for ``method path``."""
+    _routes[method, path] = handler
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def _authorized(self, method):
+        if method == "GET":
+            return True
+        token = os.environ.get("PL_STATUS_TOKEN", "")
+        supplied = self.headers.get("Authorization", "")
+        return bool(token) and hmac.compare_digest(supplied.encode(), f"Bearer {token}".encode())
+
+    def _dispatch(self, method):
+        handler = _routes.get((method, self.path.split("?", 1)[0]))
+        if handler is None:
+            status, content_type, body = 404, "text/plain", "not found\n"
+        elif not self._authorized(method):
+            status, content_type, body = 403, "text/plain", "forbidden\n"
+        else:
+            status, content_type, body = handler()
+        payload = body.encode() if isinstance(body, str) else body
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start(port=None):
+    """Start the server in a daemon thread (once). Returns it, or None if disabled."""
+    global _server
+    port = port or int(os.environ.get("PL_STATUS_PORT", "0"))
+    if not port:
+        return None
+    with _lock:
+        if _server is None:
+            host = os.environ.get("PL_STATUS_HOST", "127.0.0.1")
+            _server = http.server.ThreadingHTTPServer((host, port), _Handler)
+            threading.Thread(target=_server.serve_forever, name="pl-status", daemon=True).start()
+    return _server
@@ -0,0 +1,161 @@
+"""Team style fingerprints and their all-pairs similarity.
+
+Every team-season of every loaded league and season gets a fingerprint of
+rate features (touch shares by third, take-on volume and success, carrying
+and progression per touch, xG per touch), so it describes how a team plays
+rather than how much. Features are z-scored over all team-seasons and the
+rows scaled to unit length; the cosine similarity of every pair is then a
+single matrix product, cached per set of dataset versions.
+
+``linkage()`` is average-linkage agglomerative clustering of a distance
+matrix, in the (n-1) x 4 layout of ``scipy.cluster.hierarchy.linkage``.
+"""
+
+import functools
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from analytics.data import PARTITION_CACHE, data_path, dataset, partitions
+
+FEATURES = {
+    "defensive_share": "Defensive-third touches %",
+    "middle_share": "Middle-third touches %",
+    "attacking_share": "Attacking-third touches %",
+    "take_ons_per_touch": "Take-ons per 100 touches",
+    "take_on_success": "Take-on success %",
+    "carries_per_touch": "Carries per touch",
+    "distance_per_carry": "Distance per carry",
+    "progressive_carries_per_carry": "Progressive carries per 100 carries",
+    "progressive_passes_per_touch": "Progressive passes per 100 touches",
+    "xg_per_touch": "xG per 1000 touches",
+    "possession": "Possession %",
+}
+
+
+def datasets():
+    """(league, season, version) of every loaded partition."""
+    return tuple(sorted(dataset(partition) for partition in partitions()))
+
+
+def versioned(func):
+    """Key a cached function on the versions of every loaded partition."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, datasets=datasets(), **kwargs)
+
+    return wrapper
+
+
+def _season(partition):
+    stats = pd.read_csv(
+        data_path("team_stats.csv", partition),
+        usecols=["team", "expected_goals", "progressive_carries", "progressive_passes"],
+    )
+    df = pd.read_csv(data_path("team_possession_stats.csv", partition)).merge(stats, on="team")
+    df["league"], df["season"] = partition[0], partition[1]
+    return df
+
+
+@versioned
+@st.cache_data(max_entries=PARTITION_CACHE)
+def fingerprints(datasets=None):
+    """(teams, X): team-season labels and their unit-length fingerprints."""
+    df = pd.concat([_season(partition) for partition in datasets], ignore_index=True)
+    touches = df["touches"]
+    features = pd.DataFrame({
+        # The source file spells it "deffensive_touches"
+        "defensive_share": df["deffensive_touches"] / touches * 100,
+        "middle_share": df["middle_touches"] / touches * 100,
+        "attacking_share": df["attacking_touches"] / touches * 100,
+        "take_ons_per_touch": df["attempted_take_ons"] / touches * 100,
+        "take_on_success": df["successful_take_ons"] / df["attempted_take_ons"] * 100,
+        "carries_per_touch": df["carries"] / touches,
+        "distance_per_carry": df["total_distance_carried"] / df["carries"],
+        "progressive_carries_per_carry": df["progressive_carries"] / df["carries"] * 100,
+        "progressive_passes_per_touch": df["progressive_passes"] / touches * 100,
+        "xg_per_touch": df["expected_goals"] / touches * 1000,
+        "possession": df["possession"],
+    })
+
+    values = features.to_numpy(np.float32)
+    values = np.nan_to_num((values - np.nanmean(values, axis=0)) / np.nanstd(values, axis=0))
+    norms = np.linalg.norm(values, axis=1, keepdims=True)
+    X = values / np.where(norms > 0, norms, 1)
+
+    teams = df[["league", "season", "team"]].assign(**features)
+    return teams, X
+
+
+@versioned
+@st.cache_resource(max_entries=PARTITION_CACHE)
+def similarity(datasets=None):
+    """Cosine similarity of every pair of team-seasons (read-only float32)."""
+    _, X = fingerprints()
+    S = X @ X.T
+    S.flags.writeable = False
+    return S
+
+
+def most_similar(row, count=10):
+    """Positions and similarities of the ``count`` team-seasons closest to ``row``."""
+    scores = similarity()[row]
+    count = min(count, len(scores) - 1)
+    candidates = np.argpartition(-scores, count)[:count + 1]
+    candidates = candidates[candidates != row][:count]
+    order = candidates[np.argsort(-scores[candidates])]
+    return order, scores[order]
+
+
+def linkage(distances):
+    """Average-linkage clustering of a square distance matrix.
+
+    Row k of the result merges clusters ``Z[k, 0]`` and ``Z[k, 1]`` (leaves
+    are 0..n-1, the cluster made at row k is n+k) at height ``Z[k, 2]``
+    into a cluster of ``Z[k, 3]`` leaves.
+    """
+    n = len(distances)
+    D = np.array(distances, dtype=float)
+    np.fill_diagonal(D, np.inf)
+    ids = np.arange(n)
+    sizes = np.ones(n)
+    # Each row's nearest cluster, so a merge step scans n values, not n^2
+    nearest = D.argmin(axis=1)
+    nearest_distance = D[np.arange(n), nearest]
+    Z = np.empty((n - 1, 4))
+    for k in range(n - 1):
+        i = int(np.argmin(nearest_distance))
+        j = int(nearest[i])
+        i, j = min(i, j), max(i, j)
+        Z[k] = ids[i], ids[j], D[i, j], sizes[i] + sizes[j]
+        # Lance-Williams update: the merged cluster replaces i, j is retired
+        merged = (sizes[i] * D[i] + sizes[j] * D[j]) / (sizes[i] + sizes[j])
+        D[i], D[:, i] = merged, merged
+        D[i, i] = np.inf
+        D[j], D[:, j] = np.inf, np.inf
+        ids[i], sizes[i] = n + k, sizes[i] + sizes[j]
+        nearest_distance[j] = np.inf
+
+        # Rows that pointed at i or j may have moved away; rescan only those
+        stale = np.flatnonzero((nearest == i) | (nearest == j))
+        stale = np.union1d(stale[nearest_distance[stale] < np.inf], [i])
+        nearest[stale] = D[stale].argmin(axis=1)
+        nearest_distance[stale] = D[stale, nearest[stale]]
+        closer = merged < nearest_distance
+        nearest[closer], nearest_distance[closer] = i, merged[closer]
+    return Z
+
+
+def leaf_order(Z):
+    """Leaves left to right as drawn in the dendrogram."""
+    n = len(Z) + 1
+    order, stack = [], [2 * n - 2]
+    while stack:
+        node = stack.pop()
+        if node < n:
+            order.append(int(node))
+        else:
+            left, right = Z[node - n, :2].astype(int)
+            stack += [right, left]
+    return order
@@ -0,0 +1,514 @@
+"""Synthetic multi-season, multi-league data generator.
+
+Produces the six CSVs the dashboards read (player_stats.csv,
+player_possession_stats.csv, fixtures.csv, standings.csv, team_stats.csv,
+team_possession_stats.csv) with the exact same columns as the shipped files,
+at any scale:
+
+    python -m analytics.synth --out data/synthetic-10x --scale 10
+    python -m analytics.synth --out data/multi --seasons 5 --leagues 4 --seed 7
+
+One league-season (20 teams, 38 weeks) matches the shipped data: ~570
+players and 380 fixtures, so ``--scale 100`` gives 100x production size.
+Point the dashboards at the output with ``PL_DATA_DIR=data/multi``, or
+write one directory per league-season with ``--partitioned`` and select
+them in the app with ``PL_PARTITIONS_DIR``.
+
+Player stats are resampled from the shipped season (per position, with
+noise) so the distributions stay realistic. Players persist across seasons
+with turnover and transfers, names are recombined from real first/last
+names (so duplicate names occur, plus ``--duplicate-rate`` exact clashes),
+and fixture results come from a Poisson model of team strengths. Standings,
+team totals and player goals/assists are all consistent with the fixtures.
+The output is fully determined by ``--seed``.
+"""
+
+import argparse
+import datetime
+import logging
+import os
+
+# The CLI imports analytics.data without a Streamlit runtime; drop the
+# bare-mode warnings its cached loaders would log on import
+logging.getLogger("streamlit.runtime.caching.cache_data_api").addFilter(lambda record: False)
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from analytics.data import DATA_DIR  # noqa: E402
+
+FILES = (
+    "player_stats.csv",
+    "player_possession_stats.csv",
+    "fixtures.csv",
+    "standings.csv",
+    "team_stats.csv",
+    "team_possession_stats.csv",
+)
+
+FIRST_SEASON = 2024
+TEAMS_PER_LEAGUE = 20
+
+PLACES = [
+    "Ashford", "Bramley", "Carrow", "Dunmore", "Eastleigh", "Fenwick", "Glenby",
+    "Harrow", "Irvine", "Kingsbury", "Langford", "Marston", "Northvale",
+    "Oakham", "Penrith", "Queensbury", "Redcliffe", "Stanmore", "Thornbury",
+    "Uxbridge", "Walsall", "Westbury", "Yarmouth", "Ashby", "Belford",
+    "Cranleigh", "Darley", "Elmstead", "Farnham", "Greystone",
+]
+SUFFIXES = ["United", "City", "Town", "Rovers", "Athletic", "Albion", "Wanderers", "County"]
+VENUES = ["Park", "Stadium", "Road", "Lane", "Ground"]
+
+PLAYER_COUNTS = [
+    "played", "starts", "minutes", "goals", "assists", "penalty_kicks",
+    "penalty_kick_attempts", "yellow", "red", "progressive_carries",
+    "progressive_passes", "received_progressive_passes",
+]
+POSSESSION_COUNTS = [
+    "deffensive_touches", "middle_touches", "attacking_touches",
+    "attempted_take_ons", "carries", "received",
+]
+TEAM_POSSESSION_COUNTS = [
+    "touches", "deffensive_touches", "middle_touches", "attacking_touches",
+    "attempted_take_ons", "successful_take_ons", "carries", "total_distance_carried",
+]
+
+# Offsets from the gameweek's Saturday for each weekday
+DAY_OFFSETS = {"Fri": -1, "Sat": 0, "Sun": 1, "Mon": 2, "Tue": 3, "Wed": 4, "Thu": 5}
+
+
+class Template:
+    """The shipped season, used as the empirical distribution to sample from."""
+
+    def __init__(self, source_dir):
+        read = lambda name: pd.read_csv(os.path.join(source_dir, name))
+        self.players = read("player_stats.csv")
+        self.possession = read("player_possession_stats.csv")
+        self.possession["received"] = pd.to_numeric(
+            self.possession["received"], errors="coerce"
+        ).fillna(0)
+        self.fixtures = read("fixtures.csv")
+        standings = read("standings.csv")
+
+        # Positions, nations and name parts come from the same rows
+        self.positions = self.players["position"].to_numpy(dtype=object)
+        self.nations = self.players["nation"].to_numpy(dtype=object)
+        self.nation_codes = self.possession["nation"].to_numpy(dtype=object)
+        names = self.players["name"].str.split(" ", n=1)
+        self.first_names = np.array(sorted({n[0] for n in names if len(n) == 2}), dtype=object)
+        self.last_names = np.array(sorted({n[1] for n in names if len(n) == 2}), dtype=object)
+        self.by_position = {
+            pos: np.flatnonzero(self.positions == pos)
+            for pos in pd.unique(self.positions)
+        }
+        self.squad_sizes = self.players.groupby("team").size().to_numpy()
+
+        # Real clubs, venues and capacities seed the first league
+        home = self.fixtures.groupby("Home")
+        self.teams = standings["team"].tolist()
+        self.venues = home["Venue"].agg(lambda s: s.mode().iloc[0]).reindex(self.teams).tolist()
+        self.capacities = home["Attendance"].max().reindex(self.teams).to_numpy()
+        self.referees = self.fixtures["Referee"].unique().tolist()
+
+        days = self.fixtures["Day"].value_counts(normalize=True)
+        self.days = days.index.to_numpy(dtype=object)
+        self.day_p = days.to_numpy()
+        times = self.fixtures["Time"].value_counts(normalize=True)
+        self.times = times.index.to_numpy(dtype=object)
+        self.time_p = times.to_numpy()
+
+
+# Helpers
+def _noisy(rng, values, sigma=0.2):
+    """Multiplicative log-normal noise, rounded back to non-negative integers."""
+    values = np.asarray(values, dtype=float)
+    return np.rint(values * rng.lognormal(0.0, sigma, values.shape)).clip(0)
+
+
+def _round_robin(n):
+    """Double round-robin (circle method) as (week, home, away) index arrays."""
+    order = list(range(n))
+    weeks, homes, aways = [], [], []
+    for week in range(n - 1):
+        for i in range(n // 2):
+            a, b = order[i], order[n - 1 - i]
+            if (week + i) % 2:
+                a, b = b, a
+            weeks.append(week)
+            homes.append(a)
+            aways.append(b)
+        order = [order[0], order[-1]] + order[1:-1]
+    weeks, homes, aways = np.array(weeks), np.array(homes), np.array(aways)
+    return (
+        np.concatenate([weeks, weeks + n - 1]) + 1,
+        np.concatenate([homes, aways]),
+        np.concatenate([aways, homes]),
+    )
+
+
+def _first_saturday(year):
+    start = datetime.date(year, 8, 16)
+    return start + datetime.timedelta(days=(5 - start.weekday()) % 7)
+
+
+def _clubs(rng, template, league, n_teams, used):
+    """Team names, venues and capacities for one league."""
+    if league == 0 and n_teams <= len(template.teams):
+        return (
+            template.teams[:n_teams],
+            template.venues[:n_teams],
+            np.nan_to_num(template.capacities[:n_teams], nan=30000.0),
+        )
+    names, venues = [], []
+    while len(names) < n_teams:
+        place = PLACES[rng.integers(len(PLACES))]
+        name = f"{place} {SUFFIXES[rng.integers(len(SUFFIXES))]}"
+        if name in used:
+            # Fall back to a numbered name once the combinations run out
+            name = f"{name} {len(used)}"
+        used.add(name)
+        names.append(name)
+        venues.append(f"{place} {VENUES[rng.integers(len(VENUES))]}")
+    capacities = rng.choice(np.nan_to_num(template.capacities, nan=30000.0), n_teams)
+    return names, venues, capacities
+
+
+# Generation
+class LeagueGenerator:
+    """Generates consecutive seasons of one league, carrying players over."""
+
+    def __init__(self, rng, template, league, n_teams, used_team_names, duplicate_rate):
+        self.rng = rng
+        self.template = template
+        self.n_teams = n_teams
+        self.duplicate_rate = duplicate_rate
+        self.teams, self.venues, self.capacities = _clubs(
+            rng, template, league, n_teams, used_team_names
+        )
+        self.strength = rng.normal(0.0, 0.25, n_teams)
+        self.squad = None
+        self.referees = (
+            template.referees if league == 0
+            else list(self._names(len(template.referees)))
+        )
+
+    def _names(self, n):
+        t = self.template
+        first = t.first_names[self.rng.integers(len(t.first_names), size=n)]
+        last = t.last_names[self.rng.integers(len(t.last_names), size=n)]
+        return first + " " + last
+
+    def _new_players(self, team_idx, year):
+        rows = self.rng.integers(len(self.template.players), size=len(team_idx))
+        ages = self.template.players["age"].to_numpy()[rows]
+        return pd.DataFrame({
+            "name": self._names(len(team_idx)),
+            "nation": self.template.nations[rows],
+            "nation_code": self.template.nation_codes[rows],
+            "position": self.template.positions[rows],
+            "team_idx": team_idx,
+            "born": (year + 1) - ages,
+        })
+
+    def _next_squad(self, year):
+        rng = self.rng
+        targets = rng.choice(self.template.squad_sizes, self.n_teams)
+        if self.squad is None:
+            return self._with_keepers(
+                self._new_players(np.repeat(np.arange(self.n_teams), targets), year)
+            )
+
+        # ~72% of players stay in the league, 12% of those change club
+        squad = self.squad[rng.random(len(self.squad)) < 0.72].copy()
+        movers = rng.random(len(squad)) < 0.12
+        squad.loc[movers, "team_idx"] = rng.integers(self.n_teams, size=int(movers.sum()))
+        squad = squad[squad.groupby("team_idx").cumcount() < targets[squad["team_idx"]]]
+        missing = targets - np.bincount(squad["team_idx"], minlength=self.n_teams)
+        fresh = self._new_players(np.repeat(np.arange(self.n_teams), missing.clip(0)), year)
+        return self._with_keepers(pd.concat([squad, fresh], ignore_index=True))
+
+    def _with_keepers(self, squad):
+        """Make sure every team has a goalkeeper."""
+        keepers = squad.loc[squad["position"] == "GK", "team_idx"]
+        without = ~squad["team_idx"].isin(keepers)
+        first = without & ~squad["team_idx"].duplicated()
+        squad.loc[first, "position"] = "GK"
+        return squad
+
+    def _fixtures(self, year):
+        rng, t = self.rng, self.template
+        weeks, home, away = _round_robin(self.n_teams)
+        order = rng.permutation(self.n_teams)
+        home, away = order[home], order[away]
+
+        lam_home = np.exp(0.33 + self.strength[home] - 0.8 * self.strength[away])
+        lam_away = np.exp(0.12 + self.strength[away] - 0.8 * self.strength[home])
+        days = rng.choice(t.days, len(weeks), p=t.day_p)
+        saturday = np.datetime64(_first_saturday(year)) + (weeks - 1) * 7
+        dates = saturday + np.array([DAY_OFFSETS[d] for d in days])
+        attendance = np.rint(self.capacities[home] * rng.uniform(0.85, 1.0, len(weeks)))
+        attendance[rng.random(len(weeks)) < 0.01] = np.nan
+
+        fixtures = pd.DataFrame({
+            "week": weeks.astype(float),
+            "Day": days,
+            "Date": pd.to_datetime(dates).strftime("%Y-%m-%d"),
+            "Time": rng.choice(t.times, len(weeks), p=t.time_p),
+            "Home": np.array(self.teams, dtype=object)[home],
+            "HomeScore": rng.poisson(lam_home),
+            "Away": np.array(self.teams, dtype=object)[away],
+            "AwayScore": rng.poisson(lam_away),
+            "Attendance": attendance,
+            "Venue": np.array(self.venues, dtype=object)[home],
+            "Referee": rng.choice(np.array(self.referees, dtype=object), len(weeks)),
+        })
+        return fixtures.sort_values(["week", "Date", "Time"], kind="stable", ignore_index=True)
+
+    def _allocate(self, totals, weights, team_idx):
+        """Split per-team totals across the squad in one multinomial draw."""
+        sizes = np.bincount(team_idx, minlength=self.n_teams)
+        slot = np.arange(len(team_idx)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        p = np.zeros((self.n_teams, sizes.max()))
+        p[team_idx, slot] = weights
+        p /= p.sum(axis=1, keepdims=True)
+        return self.rng.multinomial(totals, p)[team_idx, slot]
+
+    def season(self, year):
+        rng, t = self.rng, self.template
+        self.squad = squad = self._next_squad(year)
+        fixtures = self._fixtures(year)
+        n = len(squad)
+
+        # Each player's season is resampled from a real player in his position
+        rows = np.empty(n, dtype=int)
+        positions = squad["position"].to_numpy(dtype=object)
+        for pos, candidates in t.by_position.items():
+            mask = positions == pos
+            rows[mask] = rng.choice(candidates, int(mask.sum()))
+        base = t.players.iloc[rows].reset_index(drop=True)
+        base_pos = t.possession.iloc[rows].reset_index(drop=True)
+
+        stats = {c: _noisy(rng, base[c]) for c in PLAYER_COUNTS}
+        stats["played"] = stats["played"].clip(1, 2 * (self.n_teams - 1))
+        stats["starts"] = np.minimum(stats["starts"], stats["played"])
+        stats["minutes"] = np.minimum(stats["minutes"], stats["played"] * 90).clip(1)
+
+        # Goals and assists add up to the goals scored in the fixtures
+        team_idx = squad["team_idx"].to_numpy()
+        index = {name: i for i, name in enumerate(self.teams)}
+        scored = (
+            np.bincount(fixtures["Home"].map(index), fixtures["HomeScore"], self.n_teams)
+            + np.bincount(fixtures["Away"].map(index), fixtures["AwayScore"], self.n_teams)
+        ).astype(int)
+        outfield = positions != "GK"
+        share = stats["minutes"] / stats["minutes"].max()
+        stats["goals"] = self._allocate(
+            scored, (base["goals"].to_numpy() + 0.1) * share * outfield + 1e-9, team_idx
+        )
+        stats["assists"] = self._allocate(
+            np.rint(scored * 0.75).astype(int), (base["assists"].to_numpy() + 0.1) * share + 1e-9, team_idx
+        )
+        stats["penalty_kicks"] = np.minimum(stats["penalty_kicks"], stats["goals"])
+        stats["penalty_kick_attempts"] = np.maximum(stats["penalty_kick_attempts"], stats["penalty_kicks"])
+        xg = 0.5 * stats["goals"] + 0.5 * base["expected_goals"].to_numpy() * rng.lognormal(0, 0.2, n)
+
+        teams = np.array(self.teams, dtype=object)[team_idx]
+        age = (year + 1) - squad["born"].to_numpy()
+        players = pd.DataFrame({
+            "name": squad["name"].to_numpy(),
+            "nation": squad["nation"].to_numpy(),
+            "position": positions,
+            "team": teams,
+            "age": age,
+            "born": squad["born"].to_numpy(),
+        })
+        for c in PLAYER_COUNTS:
+            players[c] = stats[c].astype(int)
+        players.insert(players.columns.get_loc("progressive_carries"), "expected_goals", xg.round(1))
+
+        # Exact name clashes between different players
+        clash = rng.random(n) < self.duplicate_rate
+        if clash.any():
+            players.loc[clash, "name"] = players["name"].to_numpy()[rng.integers(n, size=int(clash.sum()))]
+
+        # Possession stats scale with the minutes the player now has
+        factor = stats["minutes"] / base["minutes"].clip(lower=1).to_numpy()
+        pos_counts = {c: _noisy(rng, base_pos[c] * factor) for c in POSSESSION_COUNTS}
+        zones = pos_counts["deffensive_touches"] + pos_counts["middle_touches"] + pos_counts["attacking_touches"]
+        success = (base_pos["successful_take_ons"] / base_pos["attempted_take_ons"]).fillna(0.45).clip(0, 1)
+        successful = rng.binomial(pos_counts["attempted_take_ons"].astype(int), success.to_numpy())
+        per_carry = (base_pos["total_distance_carried"] / base_pos["carries"]).fillna(4.5).to_numpy()
+        possession = pd.DataFrame({
+            "player": players["name"],
+            "nation": squad["nation_code"].to_numpy(),
+            "position": positions,
+            "team": teams,
+            "age": age,
+            "90s": (stats["minutes"] / 90).round(1),
+            "touches": (zones - rng.binomial(zones.astype(int), 0.03)).astype(int),
+            "deffensive_touches": pos_counts["deffensive_touches"].astype(int),
+            "middle_touches": pos_counts["middle_touches"].astype(int),
+            "attacking_touches": pos_counts["attacking_touches"].astype(int),
+            "attempted_take_ons": pos_counts["attempted_take_ons"].astype(int),
+            "successful_take_ons": successful,
+            "takeons_tackled": rng.binomial(
+                (pos_counts["attempted_take_ons"] - successful).astype(int), 0.8
+            ),
+            "carries": pos_counts["carries"].astype(int),
+            "total_distance_carried": np.rint(
+                pos_counts["carries"] * per_carry * rng.lognormal(0, 0.1, n)
+            ).astype(int),
+            "received": pos_counts["received"].astype(int),
+        })
+
+        standings = self._standings(fixtures, players)
+        team_possession = possession.groupby("team", sort=False)[TEAM_POSSESSION_COUNTS].sum()
+        z = (self.strength - self.strength.mean()) / (self.strength.std() or 1.0)
+        team_possession.insert(
+            0, "possession", pd.Series((50 + 5 * z).clip(35, 65).round(1), index=self.teams)
+        )
+        team_possession = team_possession.reindex(sorted(self.teams)).reset_index()
+
+        by_team = players.groupby("team", sort=False)
+        team_stats = pd.DataFrame({
+            "players": by_team.size(),
+            "age": by_team["age"].mean().round(1),
+            "possession": team_possession.set_index("team")["possession"],
+            "goals": by_team["goals"].sum(),
+            "assists": by_team["assists"].sum(),
+            "penalty_kicks": by_team["penalty_kicks"].sum(),
+            "penalty_kick_attempts": by_team["penalty_kick_attempts"].sum(),
+            "yellows": by_team["yellow"].sum(),
+            "reds": by_team["red"].sum(),
+            "expected_goals": (by_team["expected_goals"].sum() * rng.uniform(0.95, 1.05)).round(1),
+            "expected_assists": (by_team["assists"].sum() * rng.uniform(0.7, 0.95)).round(1),
+            "progressive_carries": by_team["progressive_carries"].sum(),
+            "progressive_passes": by_team["progressive_passes"].sum(),
+        }).reindex(sorted(self.teams)).rename_axis("team").reset_index()
+
+        return {
+            "player_stats.csv": players,
+            "player_possession_stats.csv": possession,
+            "fixtures.csv": fixtures,
+            "standings.csv": standings,
+            "team_stats.csv": team_stats,
+            "team_possession_stats.csv": team_possession,
+        }
+
+    def _standings(self, fixtures, players):
+        home = pd.DataFrame({
+            "team": fixtures["Home"], "gf": fixtures["HomeScore"], "ga": fixtures["AwayScore"],
+            "order": fixtures.index,
+        })
+        away = pd.DataFrame({
+            "team": fixtures["Away"], "gf": fixtures["AwayScore"], "ga": fixtures["HomeScore"],
+            "order": fixtures.index,
+        })
+        results = pd.concat([home, away], ignore_index=True).sort_values("order", kind="stable")
+        results["result"] = np.select(
+            [results["gf"] > results["ga"], results["gf"] < results["ga"]], ["W", "L"], "D"
+        )
+        by_team = results.groupby("team")
+        table = pd.DataFrame({
+            "win": by_team["result"].agg(lambda r: (r == "W").sum()),
+            "loss": by_team["result"].agg(lambda r: (r == "L").sum()),
+            "draw": by_team["result"].agg(lambda r: (r == "D").sum()),
+            "goals": by_team["gf"].sum(),
+            "conceded": by_team["ga"].sum(),
+        })
+        table["points"] = 3 * table["win"] + table["draw"]
+        table["last5"] = by_team["result"].agg(lambda r: " ".join(r.iloc[-5:]))
+        top = players.sort_values("goals", ascending=False).drop_duplicates("team")
+        table["top_scorer"] = top.set_index("team")["name"]
+        keepers = players[players["position"] == "GK"].sort_values("minutes", ascending=False)
+        table["keeper"] = keepers.drop_duplicates("team").set_index("team")["name"]
+        table["gd"] = table["goals"] - table["conceded"]
+        table = table.sort_values(["points", "gd", "goals"], ascending=False).drop(columns="gd")
+        table.insert(0, "rank", np.arange(1, len(table) + 1))
+        return table.rename_axis("team").reset_index()[
+            ["rank", "team", "win", "loss", "draw", "goals", "conceded", "points",
+             "last5", "top_scorer", "keeper"]
+        ]
+
+
+def generate(seasons=1, leagues=1, seed=0, teams=TEAMS_PER_LEAGUE,
+             duplicate_rate=0.02, source_dir=DATA_DIR):
+    """Yield ``(league, season, frames)`` for every league-season."""
+    template = Template(source_dir)
+    root = np.random.SeedSequence(seed)
+    used = set(template.teams)
+    for league, child in enumerate(root.spawn(leagues)):
+        rng = np.random.default_rng(child)
+        generator = LeagueGenerator(rng, template, league, teams, used, duplicate_rate)
+        for season in range(seasons):
+            yield league, FIRST_SEASON + season, generator.season(FIRST_SEASON + season)
+
+
+def partition(league, season):
+    """(league, season) directory names of a generated league-season."""
+    return f"synthetic-{league + 1}", f"{season}-{(season + 1) % 100:02d}"
+
+
+def write_partitions(out_dir, **kwargs):
+    """Write each league-season to ``out_dir/<league>/<season>/``; returns row counts."""
+    counts = {name: 0 for name in FILES}
+    for league, season, frames in generate(**kwargs):
+        directory = os.path.join(out_dir, *partition(league, season))
+        os.makedirs(directory, exist_ok=True)
+        for name in FILES:
+            frames[name].to_csv(os.path.join(directory, name), index=False)
+            counts[name] += len(frames[name])
+    return counts
+
+
+def write(out_dir, **kwargs):
+    """Generate and write the six CSVs into ``out_dir``; returns row counts."""
+    collected = {name: [] for name in FILES}
+    for _, _, frames in generate(**kwargs):
+        for name in FILES:
+            collected[name].append(frames[name])
+
+    os.makedirs(out_dir, exist_ok=True)
+    counts = {}
+    for name in FILES:
+        frame = pd.concat(collected[name], ignore_index=True)
+        frame.to_csv(os.path.join(out_dir, name), index=False)
+        counts[name] = len(frame)
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic season CSVs.")
+    parser.add_argument("--out", required=True, help="output directory")
+    parser.add_argument("--seasons", type=int, default=1, help="seasons per league")
+    parser.add_argument("--leagues", type=int, default=1, help="number of leagues")
+    parser.add_argument(
+        "--scale", type=int,
+        help="total league-seasons (x production size); sets --seasons for the given --leagues, "
+             "rounded to the nearest whole number (at least 1)",
+    )
+    parser.add_argument("--teams", type=int, default=TEAMS_PER_LEAGUE, help="teams per league (even)")
+    parser.add_argument("--duplicate-rate", type=float, default=0.02,
+                        help="share of players given another player's exact name")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--source", default=DATA_DIR, help="directory with the template CSVs")
+    parser.add_argument(
+        "--partitioned", action="store_true",
+        help="write one <league>/<season>/ directory per league-season (see PL_PARTITIONS_DIR)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.teams % 2:
+        parser.error("--teams must be even")
+    seasons = max(1, round(args.scale / args.leagues)) if args.scale else args.seasons
+
+    counts = (write_partitions if args.partitioned else write)(
+        args.out, seasons=seasons, leagues=args.leagues, seed=args.seed,
+        teams=args.teams, duplicate_rate=args.duplicate_rate, source_dir=args.source,
+    )
+    for name, rows in counts.items():
+        print(f"{name:<30} {rows:>10,} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Team x metric feature matrix for side-by-side comparisons.
+
+``team_stats.csv`` and ``team_possession_stats.csv`` are joined on team
+once per dataset version into a dense float matrix, with a min-max scaled
+copy (0 = league minimum, 1 = league maximum; reversed for metrics where
+less is better, such as cards). Comparing teams is then row selection.
+"""
+
+import numpy as np
+import streamlit as st
+
+from analytics.data import PARTITION_CACHE, load_team_possession, load_team_stats, partitioned
+
+# (column, label, group); derived columns are computed in matrix()
+FEATURES = [
+    ("possession", "Possession %", "Possession"),
+    ("touches", "Touches", "Possession"),
+    ("defensive_share", "Defensive-third touches %", "Possession"),
+    ("middle_share", "Middle-third touches %", "Possession"),
+    ("attacking_share", "Attacking-third touches %", "Possession"),
+    ("goals", "Goals", "Attack"),
+    ("expected_goals", "xG", "Attack"),
+    ("assists", "Assists", "Attack"),
+    ("expected_assists", "xA", "Attack"),
+    ("progressive_carries", "Progressive carries", "Progression"),
+    ("progressive_passes", "Progressive passes", "Progression"),
+    ("total_distance_carried", "Distance carried", "Progression"),
+    ("attempted_take_ons", "Take-ons attempted", "Progression"),
+    ("take_on_success", "Take-on success %", "Progression"),
+    ("yellows", "Yellow cards", "Discipline"),
+    ("reds", "Red cards", "Discipline"),
+]
+METRICS = [column for column, _, _ in FEATURES]
+LABELS = {column: label for column, label, _ in FEATURES}
+GROUPS = {column: group for column, _, group in FEATURES}
+
+# Scaled so that fewer is better
+LOWER_IS_BETTER = {"yellows", "reds"}
+
+
+class TeamMatrix:
+    """``values[i, j]`` is metric ``metrics[j]`` of team ``teams[i]``."""
+
+    def __init__(self, teams, metrics, values, scaled):
+        self.teams = list(teams)
+        self.index = {team: i for i, team in enumerate(self.teams)}
+        self.metrics = list(metrics)
+        self.values = values
+        self.scaled = scaled
+
+    def rows(self, teams):
+        """Row positions of ``teams``, in the order given."""
+        return np.array([self.index[team] for team in teams], dtype=int)
+
+
+@partitioned
+@st.cache_data(max_entries=PARTITION_CACHE)
+def matrix(partition=None):
+    """The TeamMatrix of the current dataset, teams in alphabetical order."""
+    stats = load_team_stats().drop(columns="possession")
+    df = stats.merge(load_team_possession(), on="team", how="inner").sort_values("team")
+
+    for third in ("defensive", "middle", "attacking"):
+        # The source file spells it "deffensive_touches"
+        column = "deffensive_touches" if third == "defensive" else f"{third}_touches"
+        df[f"{third}_share"] = df[column] / df["touches"] * 100
+    df["take_on_success"] = df["successful_take_ons"] / df["attempted_take_ons"] * 100
+
+    values = df[METRICS].to_numpy(float)
+    low, high = np.nanmin(values, axis=0), np.nanmax(values, axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scaled = np.where(high > low, (values - low) / (high - low), 0.5)
+    flip = np.isin(METRICS, list(LOWER_IS_BETTER))
+    scaled[:, flip] = 1 - scaled[:, flip]
+    return TeamMatrix(df["team"], METRICS, values, scaled)
@@ -0,0 +1,133 @@
+"""Cross-season player careers.
+
+Joins every season partition of a league (see analytics.data) into one
+career table. Players are matched across seasons on a stable ID, a 64-bit
+hash of (name, nation, birth year), computed vectorized over all rows at
+once rather than by row-wise lookups.
+
+``build(league)`` returns two frames:
+
+- ``players``: one row per player ID with name, nation, birth year and the
+  position and team of their latest season;
+- ``careers``: a compact long-format table (player_id, season, age,
+  metric, value) with ``value`` as float32 and ``metric`` categorical. It
+  is stored metric-major with the same (player_id, season) order in every
+  metric block, so per-90 values are a plain division of two blocks.
+"""
+
+import functools
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from analytics.data import PARTITION_CACHE, data_path, dataset, partitions, season_start
+
+KEY = ["name", "nation", "born"]
+COUNTS = ["minutes", "goals", "assists", "expected_goals", "progressive_carries", "progressive_passes"]
+METRICS = COUNTS + ["goals_minus_xg", "progressive_actions"]
+METRIC_LABELS = {
+    "minutes": "Minutes",
+    "goals": "Goals",
+    "assists": "Assists",
+    "expected_goals": "Expected Goals (xG)",
+    "goals_minus_xg": "Goals - xG",
+    "progressive_carries": "Progressive Carries",
+    "progressive_passes": "Progressive Passes",
+    "progressive_actions": "Progressive Actions (carries + passes)",
+}
+PERCENTILES = [0.1, 0.25, 0.5, 0.75, 0.9]
+
+# Ages with fewer player-seasons than this get no percentile band
+MIN_SAMPLE = 10
+
+
+def player_ids(df):
+    """Stable uint64 ID per row from (name, nation, birth year)."""
+    return pd.util.hash_pandas_object(df[KEY], index=False).to_numpy()
+
+
+def datasets(league):
+    """(league, season, version) of every season of ``league``, oldest first."""
+    return tuple(sorted(dataset((league, season)) for name, season in partitions() if name == league))
+
+
+def versioned(func):
+    """Key a cached per-league function on the versions of all its seasons.
+
+    Passes ``seasons=datasets(league)``, so publishing a new snapshot of any
+    season invalidates the league's entries.
+    """
+    @functools.wraps(func)
+    def wrapper(league, *args, **kwargs):
+        return func(league, *args, seasons=datasets(league), **kwargs)
+
+    return wrapper
+
+
+def _season(partition):
+    df = pd.read_csv(data_path("player_stats.csv", partition), usecols=KEY + ["position", "team"] + COUNTS)
+    df["season"] = season_start(partition)
+    return df
+
+
+@versioned
+@st.cache_data(max_entries=PARTITION_CACHE)
+def build(league, seasons=None):
+    """(players, careers) over every season of ``league``."""
+    df = pd.concat([_season(season) for season in seasons], ignore_index=True)
+    df = df.dropna(subset=["born"])
+    df["player_id"] = player_ids(df)
+    df = df.sort_values(["player_id", "season"], kind="stable")
+
+    # A mid-season transfer gives one row per club; sum them into one player-season
+    totals = df.groupby(["player_id", "season"], sort=True)[COUNTS].sum()
+    totals["goals_minus_xg"] = totals["goals"] - totals["expected_goals"]
+    totals["progressive_actions"] = totals["progressive_carries"] + totals["progressive_passes"]
+
+    ids = totals.index.get_level_values("player_id").to_numpy()
+    season = totals.index.get_level_values("season").to_numpy()
+    born = df.groupby("player_id", sort=True)["born"].first().reindex(ids).to_numpy()
+    n = len(totals)
+    careers = pd.DataFrame({
+        "player_id": np.tile(ids, len(METRICS)),
+        "season": np.tile(season, len(METRICS)).astype(np.int16),
+        "age": np.tile(season - born, len(METRICS)).astype(np.int8),
+        "metric": pd.Categorical.from_codes(np.repeat(np.arange(len(METRICS)), n), METRICS),
+        "value": totals[METRICS].to_numpy(np.float32).T.ravel(),
+    })
+
+    players = df.groupby("player_id", sort=True)[KEY + ["position", "team"]].last()
+    players["seasons"] = totals.groupby(level="player_id").size()
+    return players, careers
+
+
+def metric_values(careers, metric, per_90=False, min_minutes=0):
+    """Rows of one metric block, per 90 minutes if asked, above ``min_minutes``."""
+    n = len(careers) // len(METRICS)
+    minutes = careers["value"].to_numpy()[:n]
+    block = careers.iloc[METRICS.index(metric) * n:(METRICS.index(metric) + 1) * n]
+    values = block["value"].to_numpy()
+    if per_90:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            values = values / minutes * 90
+    keep = minutes >= max(min_minutes, 1 if per_90 else 0)
+    return block[keep].assign(value=values[keep])
+
+
+@versioned
+@st.cache_data(max_entries=PARTITION_CACHE * 32)
+def age_percentiles(league, metric, per_90=False, min_minutes=0, seasons=None):
+    """Age x percentile table of ``metric`` over every player-season of the league."""
+    _, careers = build(league)
+    values = metric_values(careers, metric, per_90, min_minutes)
+    grouped = values.groupby("age")["value"]
+    table = grouped.quantile(PERCENTILES).unstack()
+    return table[grouped.size() >= MIN_SAMPLE]
+
+
+def career(league, ids, metric, per_90=False):
+    """One row per season of each player in ``ids`` (no minutes filter)."""
+    _, careers = build(league)
+    values = metric_values(careers, metric, per_90)
+    return values[values["player_id"].isin(list(ids))]
@@ -0,0 +1,203 @@
+"""Boot-time cache warm-up.
+
+Loads every dataset through the shared loaders and builds each page's
+default figures in a background thread pool, so the first visitor after a
+deploy hits warm st.cache_data entries:
+
+- Ball Progression with its default positions and slider values,
+- Goalscoring Analysis with the default analysis type,
+- the league table, with expected points and power rankings,
+- Team Analysis for Liverpool, with its home-advantage chart and venues,
+- the fixed charts of Age Distribution, Attacking Efficiency and Ball
+  Possession,
+- the Match Predictions model fit, next-fixture table and default matchup,
+- the Team Comparison feature matrix and default radar,
+- the Team Style fingerprints, similarity matrix and default clustering,
+- the Fixture Difficulty heatmap,
+- the Fixture Congestion, Kickoff Times and Scorelines default charts,
+- the Player Trajectories career table and default age curve.
+
+Defaults that depend on the data (the top teams, the selected league) are
+resolved inside the task, so a reload warms them for the new version.
+
+Progress is served at ``/healthz`` on PL_STATUS_PORT (see analytics.status):
+503 while warming, 200 once every task has finished, so a load balancer can
+hold traffic back until then. Tasks that fail are logged and listed in the
+response but don't keep the instance out of rotation.
+"""
+
+import concurrent.futures
+import json
+import logging
+import os
+import threading
+import time
+
+from analytics import congestion, dixon_coles, status, style, team_features
+from analytics import home_advantage as home_advantage_data
+from analytics import scorelines as scorelines_data
+from analytics.charts import (
+    age,
+    attacking,
+    comparison,
+    goalscoring,
+    home,
+    home_advantage,
+    kickoff,
+    possession,
+    predictions,
+    progression,
+    schedule,
+    scorelines,
+    team,
+    trajectory,
+)
+from analytics.charts import congestion as congestion_charts
+from analytics.charts import style as style_charts
+from analytics.data import LOADERS, current
+
+logger = logging.getLogger("analytics.warmup")
+
+WORKERS = int(os.environ.get("PL_WARMUP_WORKERS", "4"))
+THREAD_PREFIX = "pl-warmup"
+
+
+# The pages stop before the matchup and scoreline charts until the first
+# result is in, so there is nothing to warm before that
+def _matchup():
+    if dixon_coles.fit().teams:
+        predictions.build_figure(*predictions.default_matchup())
+
+
+def _scorelines():
+    if scorelines_data.cube().weeks:
+        scorelines.build_figure()
+        scorelines.build_total_goals_figure()
+
+
+def _comparison():
+    return comparison.build_figure(comparison.default_teams())
+
+
+def _style():
+    return style_charts.build_figures(next(iter(style_charts.SCOPES)), current())
+
+
+def _congestion():
+    return congestion_charts.build_figures(congestion.scoped(next(iter(congestion.SCOPES))))
+
+
+def _trajectory():
+    league = current()[0]
+    return trajectory.build_figure(
+        league, trajectory.DEFAULT_METRIC, False, trajectory.DEFAULT_MIN_MINUTES,
+        trajectory.default_players(league),
+    )
+
+
+# (name, cached function, args) in the exact form the pages call them, so
+# the warm-up fills the same cache entries
+FIGURES = [
+    ("League table", home.standings_table, ()),
+    ("Ball Progression", progression.build_progression_graph,
+     (progression.DEFAULT_POSITIONS, False, *progression.DEFAULT_SLIDERS)),
+    ("Goalscoring Analysis", goalscoring.build_figure,
+     (goalscoring.DEFAULT_ANALYSIS, goalscoring.TOP_CHOICES[0])),
+    ("Team Analysis", team.build_figures, (team.DEFAULT_TEAM,)),
+    ("Team Analysis home advantage", home_advantage.build_figure, (team.DEFAULT_TEAM,)),
+    ("Team Analysis venues", home_advantage_data.by_venue, ()),
+    ("Age Distribution", age.build_figures, ()),
+    ("Attacking Efficiency", attacking.build_figures, ()),
+    ("Ball Possession", possession.build_figures, ()),
+    ("Match Predictions", predictions.next_fixtures, ()),
+    ("Match Predictions matchup", _matchup, ()),
+    ("Team Comparison", team_features.matrix, ()),
+    ("Team Comparison radar", _comparison, ()),
+    ("Team Style", style.similarity, ()),
+    ("Team Style clusters", _style, ()),
+    ("Fixture Difficulty", schedule.build_figure, ()),
+    ("Fixture Congestion", _congestion, ()),
+    ("Kickoff Times", kickoff.build_figure, (kickoff.DEFAULT_GROUPING, kickoff.DEFAULT_METRIC)),
+    ("Scorelines", _scorelines, ()),
+    ("Player Trajectories", _trajectory, ()),
+]
+
+_lock = threading.Lock()
+_state = {"state": "idle", "done": 0, "total": 0, "failed": [], "seconds": None}
+_thread = None
+
+
+class _QuietWarmupThreads(logging.Filter):
+    """Drop Streamlit's "no script run context" warnings from warm-up threads."""
+
+    def filter(self, record):
+        return not threading.current_thread().name.startswith(THREAD_PREFIX)
+
+
+for _name in (
+    "streamlit.runtime.caching.cache_data_api",
+    "streamlit.runtime.scriptrunner_utils.script_run_context",
+):
+    logging.getLogger(_name).addFilter(_QuietWarmupThreads())
+
+
+def snapshot():
+    with _lock:
+        return dict(_state, failed=list(_state["failed"]))
+
+
+def ready():
+    return snapshot()["state"] == "ready"
+
+
+def _healthz():
+    state = snapshot()
+    code = 200 if state["state"] == "ready" else 503
+    return code, "application/json", json.dumps(state) + "\n"
+
+
+status.route("/healthz", _healthz)
+
+
+def _run_stage(pool, tasks):
+    futures = {pool.submit(func, *args): name for name, func, args in tasks}
+    for future in concurrent.futures.as_completed(futures):
+        name = futures[future]
+        try:
+            future.result()
+        except Exception:
+            logger.exception("Warm-up of %s failed", name)
+            with _lock:
+                _state["failed"].append(name)
+        with _lock:
+            _state["done"] += 1
+
+
+def run(workers=WORKERS):
+    """Warm every cache; blocks until done and returns the final state."""
+    loaders = [(loader.__name__, loader, ()) for loader in LOADERS]
+    with _lock:
+        _state.update(state="warming", done=0, total=len(loaders) + len(FIGURES), failed=[], seconds=None)
+    started = time.perf_counter()
+
+    with concurrent.futures.ThreadPoolExecutor(workers, thread_name_prefix=THREAD_PREFIX) as pool:
+        # Datasets first, so the figure builders don't all miss on the same CSV
+        _run_stage(pool, loaders)
+        _run_stage(pool, FIGURES)
+
+    with _lock:
+        _state.update(state="ready", seconds=round(time.perf_counter() - started, 3))
+    state = snapshot()
+    logger.info("Cache warm-up done in %.2f s (%d tasks, %d failed)", state["seconds"], state["total"], len(state["failed"]))
+    return state
+
+
+def start(workers=WORKERS):
+    """Run the warm-up in a background thread (once)."""
+    global _thread
+    with _lock:
+        if _thread is None:
+            _state["state"] = "warming"
+            _thread = threading.Thread(target=run, args=(workers,), name=f"{THREAD_PREFIX}-main", daemon=True)
+            _thread.start()
+    return _thread
@@ -1,48 +1,47 @@
 import streamlit as st
-import pandas as pd
-import base64
 
-st.set_page_config(page_title="Premier League 2024/25", layout="wide")
-
-st.markdown("<h1 style='text-align: center;'>Premier League 2024/25 Season Analysis</h1>", unsafe_allow_html=True)
-
-# Load standings data
-@st.cache_data
-def load_standings():
-    return pd.read_csv("standings.csv")
-
-# Image encoding helper
-def get_base64_img(img_path):
-    with open(img_path, "rb") as f:
-        return base64.b64encode(f.read()).decode()
+from analytics import perf
+from analytics.charts.home import standings_table
+from analytics.data import (
+    DEFAULT_PARTITION,
+    card_image,
+    current,
+    label,
+    league_label,
+    partitions,
+    season_label,
+)
 
-df_standings = load_standings()
-table_data = df_standings.iloc[:, :9]  # Get first 9 columns as specified
+# Selected league-season; every page reads it through analytics.data.current()
+available = partitions()
+selected = current()
+if selected not in available:
+    selected = DEFAULT_PARTITION if DEFAULT_PARTITION in available else available[0]
+    st.session_state.partition = selected
 
-# Load and display Premier League table
-st.markdown("## 📊 Premier League Table 2024/25")
+st.set_page_config(page_title=label(selected), layout="wide")
+perf.start("Home")
 
-df_standings = load_standings()
-table_data = df_standings.iloc[:, :9].copy()  # Get first 9 columns as specified
+with st.sidebar:
+    leagues = list(dict.fromkeys(league for league, _ in available))
+    league = st.selectbox("League", leagues, index=leagues.index(selected[0]), format_func=league_label)
+    seasons = [season for name, season in available if name == league]
+    season = st.selectbox(
+        "Season", seasons,
+        index=seasons.index(selected[1]) if selected[1] in seasons else 0,
+        format_func=season_label,
+    )
+if (league, season) != selected:
+    st.session_state.partition = (league, season)
+    st.rerun()
 
-# Add qualification zone indicators
-def get_zone_indicator(position):
-    if position <= 4:
-        return "🟢"  # Champions League
-    elif position <= 7:
-        return "🟠"  # Europa League
-    elif position >= 18:
-        return "🔴"  # Relegation
-    else:
-        return "⚪"  # Mid-table
+st.markdown(f"<h1 style='text-align: center;'>{label(selected)} Season Analysis</h1>", unsafe_allow_html=True)
 
-# Prepare data for display
-display_data = table_data.copy()
-display_data['Zone'] = display_data['rank'].apply(get_zone_indicator)
-display_data = display_data[['Zone', 'rank', 'team', 'win', 'loss', 'draw', 'goals', 'conceded', 'points', 'last5']]
+# Load and display the league table
+st.markdown(f"## 📊 {league_label(selected[0])} Table {season_label(selected[1])}")
 
-# Rename columns for better display
-display_data.columns = ['', 'Pos', 'Team', 'W', 'L', 'D', 'GF', 'GA', 'Pts', 'Last 5']
+display_data = standings_table()
+perf.lap("data load")
 
 # Custom CSS for the dataframe
 st.markdown("""
@@ -88,6 +87,21 @@ st.dataframe(
             "Pos",
             width="small",
         ),
+        "Colley": st.column_config.NumberColumn(
+            "Colley",
+            width="small",
+            help="Position by Colley rating: wins and losses, adjusted for the opponents' strength",
+        ),
+        "Massey": st.column_config.NumberColumn(
+            "Massey",
+            width="small",
+            help="Position by Massey rating: goal margins, adjusted for the opponents' strength",
+        ),
+        "PageRank": st.column_config.NumberColumn(
+            "PageRank",
+            width="small",
+            help="Position by PageRank over the results graph: beating teams that beat others counts more",
+        ),
         "Team": st.column_config.TextColumn(
             "Team",
             width="medium",
@@ -116,6 +130,17 @@ st.dataframe(
             "Pts",
             width="small",
         ),
+        "xPts": st.column_config.NumberColumn(
+            "xPts",
+            width="small",
+            help="Expected points: the win/draw/loss probabilities of each played match under the Dixon-Coles model",
+        ),
+        "Pts - xPts": st.column_config.NumberColumn(
+            "Pts - xPts",
+            width="small",
+            format="%+.1f",
+            help="Points above (+) or below (-) expectation",
+        ),
         "Last 5": st.column_config.TextColumn(
             "Last 5",
             width="medium",
@@ -141,13 +166,16 @@ st.write("---")
 # Dashboard Cards Section
 st.markdown("## 🎯 Analysis Dashboards")
 
+perf.lap("render", "standings table")
+
 # Base64 images for dashboard cards
-img1 = get_base64_img("images/ball_prog.png")
-img2 = get_base64_img("images/goalscoring.png")
-img3 = get_base64_img("images/team_analysis.png")
-img4 = get_base64_img("images/attacking_efficiency.png")
-img5 = get_base64_img("images/age_distribution.png")
-img6 = get_base64_img("images/ball_possession.png")  # Add ball possession image
+img1 = card_image("images/ball_prog.png")
+img2 = card_image("images/goalscoring.png")
+img3 = card_image("images/team_analysis.png")
+img4 = card_image("images/attacking_efficiency.png")
+img5 = card_image("images/age_distribution.png")
+img6 = card_image("images/ball_possession.png")  # Add ball possession image
+perf.lap("data load", "card images")
 
 # Create two rows of cards
 col1, col2, col3 = st.columns(3)
@@ -314,4 +342,6 @@ with col2:
         </a>
         <p style='color: #ccc; font-size: 12px; margin-top: 15px;'>Dataset includes player stats, team stats, possession data, and match fixtures</p>
     </div>
-    """, unsafe_allow_html=True)
\ No newline at end of file
+    """, unsafe_allow_html=True)
+
+perf.finish()
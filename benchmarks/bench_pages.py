@@ -0,0 +1,283 @@
+"""Headless render benchmarks for app.py and every page in pages/.
+
+Each case runs a page through streamlit.testing.v1.AppTest with one widget
+state applied and records:
+
+- wall_ms       median wall time of the measured run
+- peak_kb       peak Python allocations during the run (tracemalloc)
+- figure_bytes  total size of the Plotly JSON sent to the browser
+- traces        total number of Plotly traces across all charts
+- charts        number of st.plotly_chart elements
+
+Usage (from the repository root):
+
+    python benchmarks/bench_pages.py                   # compare with baseline
+    python benchmarks/bench_pages.py --update-baseline # rewrite the baseline
+    python benchmarks/bench_pages.py --only Team       # subset of cases
+
+To benchmark at scale, generate a synthetic dataset and point the pages at
+it (use a separate baseline per dataset):
+
+    python -m analytics.synth --out /tmp/pl-10x --scale 10
+    python benchmarks/bench_pages.py --data-dir /tmp/pl-10x --max-teams 5 \
+        --baseline benchmarks/baseline-10x.json
+
+The run exits non-zero when a case raises or when any metric regresses past
+its tolerance relative to benchmarks/baseline.json.
+"""
+
+import argparse
+import glob
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+import warnings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+
+# Allowed relative increase per metric before a case counts as a regression.
+# Wall time is noisy on shared CI runners, sizes and trace counts are not.
+TOLERANCES = {
+    "wall_ms": 0.50,
+    "peak_kb": 0.25,
+    "figure_bytes": 0.05,
+    "traces": 0.0,
+    "charts": 0.0,
+}
+
+GOALSCORING_ANALYSES = [
+    "Goals vs Expected Goals",
+    "Goal Involvements per 90",
+    "Progressive Pass Recipients",
+]
+
+# (minutes, progressive passes, progressive carries)
+PROGRESSION_SLIDERS = [
+    (0, 0, 0),
+    (500, 30, 20),
+    (1500, 60, 40),
+    (3000, 200, 200),
+]
+
+
+# Widget helpers
+def _widget(widgets, label):
+    for widget in widgets:
+        if widget.label == label:
+            return widget
+    raise KeyError(f"No widget labelled {label!r}")
+
+
+def _set_progression(per_90, positions, sliders):
+    def apply(at):
+        _widget(at.checkbox, "📊 Per 90 Stats").set_value(per_90)
+        _widget(at.checkbox, "🛡️ Defenders").set_value("DF" in positions)
+        _widget(at.checkbox, "⚽ Midfielders").set_value("MF" in positions)
+        _widget(at.checkbox, "🎯 Forwards").set_value("FW" in positions)
+        mins, passes, carries = sliders
+        _widget(at.slider, "Minimum Minutes Played").set_value(mins)
+        _widget(at.slider, "Minimum Progressive Passes").set_value(passes)
+        _widget(at.slider, "Minimum Progressive Carries").set_value(carries)
+
+    return apply
+
+
+def _set_selectbox(label, value):
+    def apply(at):
+        _widget(at.selectbox, label).set_value(value)
+
+    return apply
+
+
+def _team_names():
+    import pandas as pd
+
+    from analytics.data import data_path
+
+    return sorted(pd.read_csv(data_path("player_stats.csv"))["team"].unique())
+
+
+def build_cases(max_teams=None):
+    """Return (name, script, apply) triples covering every page."""
+    cases = [("app", "app.py", None)]
+
+    for per_90 in (False, True):
+        for positions in (("DF",), ("DF", "MF", "FW")):
+            for sliders in PROGRESSION_SLIDERS:
+                name = "Ball_Progression[per90={},pos={},sliders={}]".format(
+                    int(per_90), "+".join(positions), "/".join(map(str, sliders))
+                )
+                cases.append(
+                    (name, "pages/Ball_Progression.py", _set_progression(per_90, positions, sliders))
+                )
+
+    for analysis in GOALSCORING_ANALYSES:
+        cases.append((
+            f"Goalscoring_Analysis[analysis_type={analysis}]",
+            "pages/Goalscoring_Analysis.py",
+            _set_selectbox("Select Analysis Type", analysis),
+        ))
+    cases.append((
+        "Goalscoring_Analysis[analysis_type=Goals vs Expected Goals,top=All]",
+        "pages/Goalscoring_Analysis.py",
+        _set_selectbox("Choose how many Goal Scorers (Sorted by Top):", "All"),
+    ))
+
+    for team in _team_names()[:max_teams]:
+        cases.append((
+            f"Team_Analysis[team={team}]",
+            "pages/Team_Analysis.py",
+            _set_selectbox("Select Team", team),
+        ))
+
+    for page in ("Age_Distribution", "Attacking_Efficiency", "Ball_Possession"):
+        cases.append((page, f"pages/{page}.py", None))
+
+    # Every other page in its default state, so a new page is covered as soon as it lands
+    covered = {script for _, script, _ in cases}
+    for path in sorted(glob.glob(os.path.join(ROOT, "pages", "*.py"))):
+        script = os.path.relpath(path, ROOT)
+        if script not in covered:
+            cases.append((os.path.splitext(os.path.basename(path))[0], script, None))
+
+    return cases
+
+
+# Measurement
+def _render(script, apply):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(os.path.join(ROOT, script), default_timeout=120)
+    at.run()
+    if apply is not None:
+        apply(at)
+    return at
+
+
+def _chart_metrics(at):
+    specs = [chart.proto.spec for chart in at.get("plotly_chart")]
+    return {
+        "figure_bytes": sum(len(spec.encode()) for spec in specs),
+        "traces": sum(len(json.loads(spec).get("data", [])) for spec in specs),
+        "charts": len(specs),
+    }
+
+
+def measure(script, apply, repeat):
+    """Measure the run that applies the widget state (not the initial run)."""
+    # Warm-up so the process-wide st.cache_data entries are populated
+    at = _render(script, apply)
+    at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+
+    timings = []
+    for _ in range(repeat):
+        at = _render(script, apply)
+        start = time.perf_counter()
+        at.run()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    # Separate pass for memory since tracemalloc slows everything down
+    at = _render(script, apply)
+    tracemalloc.start()
+    at.run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = {
+        "wall_ms": round(statistics.median(timings), 2),
+        "peak_kb": round(peak / 1024, 1),
+    }
+    result.update(_chart_metrics(at))
+    return result
+
+
+def compare(results, baseline):
+    """Return a list of human readable regressions."""
+    regressions = []
+    for name, metrics in results.items():
+        base = baseline.get("cases", {}).get(name)
+        if base is None:
+            continue
+        for metric, tolerance in TOLERANCES.items():
+            if metric not in base:
+                continue
+            limit = base[metric] * (1 + tolerance)
+            if metrics[metric] > limit:
+                regressions.append(
+                    f"{name}: {metric} {metrics[metric]} > {limit:.2f} (baseline {base[metric]})"
+                )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per case")
+    parser.add_argument("--only", help="only run cases whose name contains this text")
+    parser.add_argument("--baseline", default=BASELINE, help="baseline JSON path")
+    parser.add_argument("--update-baseline", action="store_true", help="write results as the new baseline")
+    parser.add_argument("--output", help="also write this run's results to a JSON file")
+    parser.add_argument("--data-dir", help="read the season CSVs from here (sets PL_DATA_DIR)")
+    parser.add_argument("--max-teams", type=int, help="limit the Team Analysis sweep to N teams")
+    args = parser.parse_args(argv)
+
+    if args.data_dir:
+        os.environ["PL_DATA_DIR"] = os.path.abspath(args.data_dir)
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+    warnings.filterwarnings("ignore")
+
+    results = {}
+    failures = []
+    for name, script, apply in build_cases(args.max_teams):
+        if args.only and args.only not in name:
+            continue
+        try:
+            results[name] = measure(script, apply, args.repeat)
+        except Exception as exc:
+            failures.append(f"{name}: {exc}")
+            continue
+        m = results[name]
+        print(
+            f"{name:<75} {m['wall_ms']:>9.1f} ms {m['peak_kb']:>10.0f} KiB "
+            f"{m['figure_bytes']:>9} B {m['traces']:>5} traces"
+        )
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "data_dir": args.data_dir,
+        },
+        "cases": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            failures.extend(compare(results, json.load(f)))
+    else:
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
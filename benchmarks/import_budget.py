@@ -0,0 +1,110 @@
+"""Import-time budget for app.py and every page in pages/.
+
+Each script is run in Streamlit's bare mode (``python -X importtime
+<script>``, no server) and the cumulative time of its top-level imports is
+compared with benchmarks/import_budget.json. The landing page also has a
+list of modules it must not import at all, since anything it imports is
+paid for by every cold start.
+
+Usage (from the repository root):
+
+    python benchmarks/import_budget.py           # check against the budget
+    python benchmarks/import_budget.py --update  # rewrite the budget (1.5x measured)
+
+Exits non-zero when a script is over budget or imports a forbidden module.
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET = os.path.join(ROOT, "benchmarks", "import_budget.json")
+
+# Headroom over the measured time when writing a new budget
+HEADROOM = 1.5
+
+# Modules the landing page must leave to the pages that need them
+FORBIDDEN = {
+    "app.py": ["plotly.express", "plotly.graph_objs._figure", "matplotlib", "PIL.Image", "scipy"],
+}
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def scripts():
+    pages = sorted(os.path.relpath(p, ROOT) for p in glob.glob(os.path.join(ROOT, "pages", "*.py")))
+    return ["app.py"] + pages
+
+
+def import_profile(args):
+    """Return ({top-level module: cumulative µs}, set of all imported modules)."""
+    env = dict(os.environ, PYTHONWARNINGS="ignore")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    top, modules = {}, set()
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        _, cumulative, indent, module = match.groups()
+        modules.add(module)
+        if len(indent) == 1:
+            top[module] = int(cumulative)
+    return top, modules
+
+
+def measure(script, runs):
+    """Best-of-``runs`` import time in ms, minus the interpreter's own imports."""
+    baseline = min(sum(import_profile(["-c", "pass"])[0].values()) for _ in range(runs))
+    best, modules = None, set()
+    for _ in range(runs):
+        top, modules = import_profile([script])
+        total = sum(top.values())
+        best = total if best is None else min(best, total)
+    return max(best - baseline, 0) / 1000, modules
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3, help="runs per script (the fastest counts)")
+    parser.add_argument("--update", action="store_true", help="write measured times as the new budget")
+    args = parser.parse_args(argv)
+
+    budget = {}
+    if os.path.exists(BUDGET):
+        with open(BUDGET) as f:
+            budget = json.load(f)
+
+    failures = []
+    measured = {}
+    for script in scripts():
+        ms, modules = measure(script, args.runs)
+        measured[script] = ms
+        limit = budget.get(script)
+        verdict = "" if limit is None else f"(budget {limit:.0f} ms)"
+        print(f"{script:<35} {ms:>8.1f} ms {verdict}")
+        if limit is not None and ms > limit and not args.update:
+            failures.append(f"{script}: imports take {ms:.0f} ms, budget is {limit:.0f} ms")
+        for module in FORBIDDEN.get(script, []):
+            if module in modules:
+                failures.append(f"{script}: imports {module}")
+
+    if args.update:
+        with open(BUDGET, "w") as f:
+            json.dump({s: round(ms * HEADROOM) for s, ms in measured.items()}, f, indent=2, sort_keys=True)
+        print(f"Budget written to {BUDGET}")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,85 +1,27 @@
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import streamlit as st
 
+from analytics import perf
+from analytics.charts.age import build_figures
+from analytics.data import load_player_stats, season_start
+
 
 st.set_page_config(page_title="Age Distribution", layout="wide")
+perf.start("Age Distribution")
 
 st.markdown("<h1 style='text-align: center;'>📅 Age Distribution Dashboard</h1>", unsafe_allow_html=True)
 
 # Load data
-@st.cache_data
-def load_data():
-    return pd.read_csv("player_stats.csv")
-
-df = load_data()
+df = load_player_stats()
+perf.lap("data load")
+figures = build_figures()
+perf.lap("figure build", "heatmaps")
 
 st.write("---")
 
 # VISUALIZATION 1: Minutes by Birth Year and Team
 st.markdown("## 🏟️ Minutes Played by Birth Year and Team")
 
-# Group data by birth year and team
-filt_team = df.groupby(['born', 'team'])['minutes'].sum().reset_index()
-
-fig1 = px.density_heatmap(
-    data_frame=filt_team,
-    x='born',
-    y='team',
-    z='minutes',
-    nbinsx=20,
-    color_continuous_scale=['#90EE90', '#006400'],
-    title='Minutes Played Distribution Across Teams and Birth Years'
-)
-
-fig1.update_layout(
-    plot_bgcolor='#0e1a26',
-    paper_bgcolor='#0e1a26',
-    font_color='white',
-    title={
-        'text': 'Minutes Played Distribution Across Teams and Birth Years',
-        'x': 0.5,
-        'xanchor': 'center',
-        'font': {'color': 'white', 'size': 18}
-    },
-    xaxis=dict(
-        title='Birth Year',
-        gridcolor='rgba(255,255,255,0.3)',
-        gridwidth=1,
-        color='white',
-        showgrid=True,
-        zeroline=False
-    ),
-    yaxis=dict(
-        title='Team',
-        gridcolor='rgba(255,255,255,0.3)',
-        gridwidth=1,
-        color='white',
-        showgrid=True,
-        zeroline=False
-    ),
-    coloraxis_colorbar=dict(
-        title=dict(text="Minutes Played", font=dict(color='white')),
-        tickfont=dict(color='white'),
-        bgcolor='rgba(0,0,0,0.5)',
-        bordercolor='white',
-        borderwidth=1
-    ),
-    height=600
-)
-
-# Add hover template for better interactivity
-fig1.update_traces(
-    hovertemplate="""
-    <b>Team:</b> %{y}<br>
-    <b>Birth Year:</b> %{x}<br>
-    <b>Total Minutes:</b> %{z:,.0f}<br>
-    <extra></extra>
-    """
-)
-
-st.plotly_chart(fig1, use_container_width=True)
+perf.plotly_chart(figures["team heatmap"], use_container_width=True, name="team heatmap")
 
 # Analysis for Visualization 1
 st.markdown("""
@@ -97,66 +39,7 @@ st.write("---")
 # VISUALIZATION 2: Minutes by Birth Year and Position
 st.markdown("## ⚽ Minutes Played by Birth Year and Position")
 
-# Group data by birth year and position
-filt_position = df.groupby(['born', 'position'])['minutes'].sum().reset_index()
-
-fig2 = px.density_heatmap(
-    data_frame=filt_position,
-    x='born',
-    y='position',
-    z='minutes',
-    nbinsx=20,
-    color_continuous_scale=['#90EE90', '#006400'],
-    title='Minutes Played Distribution Across Positions and Birth Years'
-)
-
-fig2.update_layout(
-    plot_bgcolor='#0e1a26',
-    paper_bgcolor='#0e1a26',
-    font_color='white',
-    title={
-        'text': 'Minutes Played Distribution Across Positions and Birth Years',
-        'x': 0.5,
-        'xanchor': 'center',
-        'font': {'color': 'white', 'size': 18}
-    },
-    xaxis=dict(
-        title='Birth Year',
-        gridcolor='rgba(255,255,255,0.3)',
-        gridwidth=1,
-        color='white',
-        showgrid=True,
-        zeroline=False
-    ),
-    yaxis=dict(
-        title='Position',
-        gridcolor='rgba(255,255,255,0.3)',
-        gridwidth=1,
-        color='white',
-        showgrid=True,
-        zeroline=False
-    ),
-    coloraxis_colorbar=dict(
-        title=dict(text="Minutes Played", font=dict(color='white')),
-        tickfont=dict(color='white'),
-        bgcolor='rgba(0,0,0,0.5)',
-        bordercolor='white',
-        borderwidth=1
-    ),
-    height=600
-)
-
-# Add hover template for better interactivity
-fig2.update_traces(
-    hovertemplate="""
-    <b>Position:</b> %{y}<br>
-    <b>Birth Year:</b> %{x}<br>
-    <b>Total Minutes:</b> %{z:,.0f}<br>
-    <extra></extra>
-    """
-)
-
-st.plotly_chart(fig2, use_container_width=True)
+perf.plotly_chart(figures["position heatmap"], use_container_width=True, name="position heatmap")
 
 # Analysis for Visualization 2
 st.markdown("""
@@ -177,7 +60,7 @@ st.markdown("## 📈 Dashboard Summary")
 # Calculate some summary statistics
 total_players = len(df)
 avg_birth_year = df['born'].mean()
-current_year = 2024
+current_year = season_start()
 avg_age = current_year - avg_birth_year
 
 youngest_players = df.nlargest(5, 'born')[['name', 'team', 'born', 'position', 'minutes']]
@@ -202,4 +85,6 @@ st.write("---")
 # Back to homepage button
 st.write("---")
 if st.button("🏠 Back to Homepage"):
-    st.switch_page("app.py")
\ No newline at end of file
+    st.switch_page("app.py")
+
+perf.finish()
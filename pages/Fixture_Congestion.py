@@ -0,0 +1,60 @@
+import streamlit as st
+
+from analytics import perf
+from analytics.charts.congestion import build_figures
+from analytics.congestion import SCOPES, SHORT_REST, by_team, matches, scoped
+from analytics.data import label
+
+
+st.set_page_config(page_title="Fixture Congestion", layout="wide")
+perf.start("Fixture Congestion")
+
+st.markdown(
+    f"<h1 style='text-align: center;'>⏱️ Fixture Congestion: {label()}</h1>",
+    unsafe_allow_html=True,
+)
+
+
+# Only this section re-runs when the scope changes (st.fragment)
+@st.fragment
+@perf.fragment("Fixture Congestion section")
+def congestion_section():
+    scope = st.radio("Matches", list(SCOPES), format_func=SCOPES.get, horizontal=True)
+    datasets = scoped(scope)
+    played = matches(datasets)
+    perf.lap("data load", scope)
+    st.caption(f"{len(played):,} played matches over {len(datasets)} season(s)")
+
+    figures = build_figures(datasets)
+    perf.lap("figure build", scope)
+    col1, col2 = st.columns(2)
+    with col1:
+        perf.plotly_chart(figures["differential"], use_container_width=True, name="rest difference")
+    with col2:
+        perf.plotly_chart(figures["rest"], use_container_width=True, name="days of rest")
+
+    st.markdown("### 📋 Congestion by Team")
+    table = by_team(datasets).round(2)
+    table.columns = [
+        "Team", "Mean rest (days)", f"Matches on ≤{SHORT_REST} days' rest",
+        "Points per game, short rest", "Points per game, otherwise",
+    ]
+    st.dataframe(table, use_container_width=True, hide_index=True)
+
+
+st.write("---")
+congestion_section()
+
+st.markdown(f"""
+### 🔍 How to read these charts
+- **Rest**: days between a team's kickoff and its previous league match's kickoff; a team's first match of a season has none
+- **Rest difference**: home rest minus away rest, rounded to whole days; positive means the home side is fresher
+- **Short rest**: {SHORT_REST} days or fewer
+- Only league fixtures are in the data, so rest after a cup or European match is overstated
+""")
+
+st.write("---")
+if st.button("🏠 Back to Homepage"):
+    st.switch_page("app.py")
+
+perf.finish()
@@ -0,0 +1,48 @@
+import streamlit as st
+
+from analytics import perf
+from analytics.charts.schedule import build_figure
+from analytics.data import label
+from analytics.dixon_coles import fit
+from analytics.schedule import strength_of_schedule
+
+
+st.set_page_config(page_title="Fixture Difficulty", layout="wide")
+perf.start("Fixture Difficulty")
+
+st.markdown(
+    f"<h1 style='text-align: center;'>🗓️ Fixture Difficulty: {label()}</h1>",
+    unsafe_allow_html=True,
+)
+
+if not fit().teams:
+    st.info("No fixture of this season has been played yet, so there are no opponent ratings.")
+    st.stop()
+
+sos = strength_of_schedule()
+perf.lap("data load", "strength of schedule")
+
+fig = build_figure()
+perf.plotly_chart(fig, use_container_width=True, name="difficulty heatmap")
+
+st.markdown("### 📋 Strength of Schedule")
+table = sos.sort_values("remaining", ascending=False, na_position="last").round(2)
+table.columns = ["Team", "Played SOS", "Remaining SOS", "Fixtures Left"]
+st.dataframe(table, use_container_width=True, hide_index=True)
+if not table["Fixtures Left"].any():
+    st.info("Every fixture of this season has been played, so there is no remaining schedule.")
+perf.lap("render", "strength of schedule")
+
+st.markdown("""
+### 🔍 How to read this chart
+- **Each cell** is a team's fixture in that gameweek: the opponent's code, in capitals at home and lower case away
+- **Colour**: the opponent's rating at that venue, its mean expected points against the rest of the league under the Match Predictions model (0-3); green is an easier fixture, red a harder one
+- **Dashed line**: the first gameweek with fixtures still to play
+- **Strength of schedule**: the mean difficulty of a team's played and remaining fixtures
+""")
+
+st.write("---")
+if st.button("🏠 Back to Homepage"):
+    st.switch_page("app.py")
+
+perf.finish()
@@ -0,0 +1,64 @@
+import streamlit as st
+
+from analytics import perf
+from analytics.charts.kickoff import DEFAULT_GROUPING, DEFAULT_METRIC, build_figure
+from analytics.data import label
+from analytics.kickoff import GROUPINGS, METRICS, SLOTS, effects
+from analytics.resample import CONFIDENCE, RESAMPLES
+
+
+st.set_page_config(page_title="Kickoff Times", layout="wide")
+perf.start("Kickoff Times")
+
+st.markdown(
+    f"<h1 style='text-align: center;'>🕒 Kickoff Day and Time: {label()}</h1>",
+    unsafe_allow_html=True,
+)
+
+
+# Only this section re-runs when the controls change (st.fragment)
+@st.fragment
+@perf.fragment("Kickoff Times section")
+def kickoff_section():
+    col1, col2 = st.columns(2)
+    with col1:
+        by = st.radio(
+            "Group by", list(GROUPINGS), index=list(GROUPINGS).index(DEFAULT_GROUPING),
+            format_func=GROUPINGS.get, horizontal=True,
+        )
+    with col2:
+        metric = st.selectbox(
+            "Metric", list(METRICS), index=list(METRICS).index(DEFAULT_METRIC), format_func=METRICS.get,
+        )
+
+    fig = build_figure(by, metric)
+    perf.lap("figure build", f"{by} {metric}")
+    perf.plotly_chart(fig, use_container_width=True, name="kickoff effects")
+
+    st.markdown("### 📋 All Metrics")
+    table = effects(by)[["matches"] + list(METRICS)].round(2)
+    table.columns = ["Matches"] + list(METRICS.values())
+    st.dataframe(table, use_container_width=True)
+
+
+st.write("---")
+if effects("Day").empty:
+    st.info("No fixture of this season has been played yet.")
+    st.stop()
+kickoff_section()
+
+slots = ", ".join(
+    f"{name} (from {start:02d}:00)" if start else f"{name} (before {SLOTS[1][1]:02d}:00)" for name, start in SLOTS
+)
+st.markdown(f"""
+### 🔍 How to read this chart
+- **Bars**: the mean over played matches in each group
+- **Error bars**: {CONFIDENCE:.0%} bootstrap intervals from {RESAMPLES:,} resamples of each group's matches; small groups have wide intervals
+- **Kickoff slots**: {slots}; matches without a kickoff time are left out
+""")
+
+st.write("---")
+if st.button("🏠 Back to Homepage"):
+    st.switch_page("app.py")
+
+perf.finish()
@@ -0,0 +1,100 @@
+import streamlit as st
+
+from analytics import dixon_coles, perf
+from analytics.charts.predictions import build_figure, default_matchup, next_fixtures
+from analytics.data import label
+
+
+st.set_page_config(page_title="Match Predictions", layout="wide")
+perf.start("Match Predictions")
+
+st.markdown(
+    f"<h1 style='text-align: center;'>🔮 Match Predictions: {label()}</h1>",
+    unsafe_allow_html=True,
+)
+
+# Fitted once per dataset version; every pairing is predicted in one batch
+model = dixon_coles.fit()
+pairings = dixon_coles.all_pairings()
+perf.lap("data load", "model fit")
+
+if not model.teams:
+    st.info("No fixture of this season has been played yet, so there is nothing to fit the model to.")
+    st.stop()
+
+PROBABILITIES = {"home_win": "Home %", "draw": "Draw %", "away_win": "Away %"}
+GOALS = {"home_xg": "Home xG", "away_xg": "Away xG"}
+
+
+def display(table):
+    table = table.rename(columns={**PROBABILITIES, **GOALS})
+    table[list(PROBABILITIES.values())] = (table[list(PROBABILITIES.values())] * 100).round(1)
+    table[list(GOALS.values())] = table[list(GOALS.values())].round(2)
+    return table
+
+
+st.markdown("### 📅 Next Fixtures")
+upcoming = next_fixtures()
+if upcoming.empty:
+    st.info("Every fixture of this season has been played.")
+else:
+    st.dataframe(display(upcoming), use_container_width=True, hide_index=True)
+perf.lap("render", "next fixtures")
+
+st.write("---")
+
+
+# Only the matchup section re-runs when a team changes (st.fragment)
+@st.fragment
+@perf.fragment("Match Predictions section")
+def matchup_section():
+    st.markdown("### ⚔️ Matchup Explorer")
+    default_home, default_away = default_matchup()
+    col1, col2 = st.columns(2)
+    with col1:
+        home = st.selectbox("Home team", model.teams, index=model.index[default_home])
+    with col2:
+        away_teams = [team for team in model.teams if team != home]
+        away = st.selectbox(
+            "Away team", away_teams,
+            index=away_teams.index(default_away) if default_away in away_teams else 0,
+        )
+
+    row = pairings[(pairings["Home"] == home) & (pairings["Away"] == away)].iloc[0]
+    cols = st.columns(5)
+    cols[0].metric(f"{home} win", f"{row['home_win']:.1%}")
+    cols[1].metric("Draw", f"{row['draw']:.1%}")
+    cols[2].metric(f"{away} win", f"{row['away_win']:.1%}")
+    cols[3].metric(f"{home} xG", f"{row['home_xg']:.2f}")
+    cols[4].metric(f"{away} xG", f"{row['away_xg']:.2f}")
+
+    fig = build_figure(home, away)
+    perf.lap("figure build", f"{home} vs {away}")
+    perf.plotly_chart(fig, use_container_width=True, name="scorelines")
+
+
+matchup_section()
+
+st.write("---")
+with st.expander("📊 Team Ratings", expanded=False):
+    ratings = model.ratings().round(3)
+    ratings.columns = ["Team", "Attack", "Defence", "Rating"]
+    st.dataframe(ratings, use_container_width=True, hide_index=True)
+    st.caption(
+        f"Home advantage {model.home:+.3f} (log goals), rho {model.rho:+.3f}, "
+        f"log-likelihood {model.log_likelihood:.1f} after {model.iterations} iterations."
+    )
+
+st.markdown("""
+### 🔍 How this works
+- **Model**: Dixon–Coles: each side's goals are Poisson, driven by its attack and the opponent's defence, plus a home advantage
+- **Low scores**: a correction (rho) adjusts the 0-0, 1-0, 0-1 and 1-1 probabilities, which plain Poisson gets wrong
+- **Recency**: older matches count less; a result's weight halves in about a year
+- **Defence**: higher means more goals conceded
+""")
+
+st.write("---")
+if st.button("🏠 Back to Homepage"):
+    st.switch_page("app.py")
+
+perf.finish()
@@ -0,0 +1,86 @@
+import streamlit as st
+
+from analytics import perf
+from analytics.charts import COLORS
+from analytics.charts.trajectory import (
+    DEFAULT_METRIC,
+    DEFAULT_MIN_MINUTES,
+    build_figure,
+    default_players,
+)
+from analytics.data import current, league_label
+from analytics.trajectories import METRIC_LABELS, METRICS, build, career
+
+
+st.set_page_config(page_title="Player Trajectories", layout="wide")
+perf.start("Player Trajectories")
+
+league = current()[0]
+st.markdown(
+    f"<h1 style='text-align: center;'>📈 Player Trajectories: {league_label(league)}</h1>",
+    unsafe_allow_html=True,
+)
+
+# Career table over every season of the selected league
+players, careers = build(league)
+perf.lap("data load", "career table")
+seasons = careers["season"].nunique()
+st.caption(f"{len(players):,} players, {len(careers) // len(METRICS):,} player-seasons over {seasons} season(s)")
+if seasons < 2:
+    st.info("Only one season of this league is loaded; add more under data/<league>/<season>/ to follow careers.")
+
+
+def player_label(player_id):
+    player = players.loc[player_id]
+    return f"{player['name']} ({player['team']}, b. {int(player['born'])})"
+
+
+# Only the chart section re-runs when its controls change (st.fragment)
+@st.fragment
+@perf.fragment("Player Trajectories section")
+def trajectory_section():
+    col1, col2, col3 = st.columns([2, 1, 2])
+    with col1:
+        metric = st.selectbox(
+            "Metric", METRICS, index=METRICS.index(DEFAULT_METRIC), format_func=METRIC_LABELS.get,
+        )
+    with col2:
+        per_90 = st.toggle("Per 90 minutes", value=False, disabled=metric == "minutes")
+    with col3:
+        min_minutes = st.slider("Minimum minutes for the percentiles", 0, 3000, DEFAULT_MIN_MINUTES, 90)
+
+    selected = st.multiselect(
+        "Players", players.index.tolist(), default=list(default_players(league)),
+        format_func=player_label, max_selections=len(COLORS),
+    )
+    player_ids = tuple(int(player_id) for player_id in selected)
+
+    fig = build_figure(league, metric, per_90 and metric != "minutes", min_minutes, player_ids)
+    perf.lap("figure build", metric)
+    perf.plotly_chart(fig, use_container_width=True, name="age curve")
+
+    if player_ids:
+        st.markdown("### 📋 Career Summary")
+        rows = career(league, player_ids, metric, per_90 and metric != "minutes")
+        table = rows.pivot_table(index="player_id", columns="season", values="value")
+        table.index = [players.loc[player_id, "name"] for player_id in table.index]
+        st.dataframe(table.round(2), use_container_width=True)
+
+
+st.write("---")
+trajectory_section()
+
+st.markdown("""
+### 🔍 How to read this chart
+- **Shaded bands**: the 10th–90th and 25th–75th percentiles of every player-season in the league at each age
+- **Dashed line**: the league median at each age
+- **Coloured lines**: the selected players' careers, one point per season
+
+Players are matched across seasons by name, nationality and birth year.
+""")
+
+st.write("---")
+if st.button("🏠 Back to Homepage"):
+    st.switch_page("app.py")
+
+perf.finish()
@@ -0,0 +1,57 @@
+import time
+
+import streamlit as st
+
+from analytics import perf
+from analytics.sql import MAX_ROWS, ad_hoc, engine, schema
+
+
+st.set_page_config(page_title="SQL Query", layout="wide")
+perf.start("SQL Query")
+
+st.markdown("<h1 style='text-align: center;'>🧮 Ad-hoc SQL Query</h1>", unsafe_allow_html=True)
+
+st.markdown(f"""
+Query the season data directly. Every CSV is a table named after its file;
+results are capped at {MAX_ROWS:,} rows. Engine: **{engine()}**.
+""")
+
+# Tables and their columns
+with st.expander("📋 Tables", expanded=False):
+    tables = schema()
+    cols = st.columns(3)
+    for i, (table, columns) in enumerate(tables.items()):
+        with cols[i % 3]:
+            st.markdown(f"**{table}**")
+            st.caption(", ".join(f"{column} ({dtype})" for column, dtype in columns))
+perf.lap("data load", "schema")
+
+EXAMPLE = """SELECT team, SUM(goals) AS goals, ROUND(SUM(expected_goals), 1) AS xg
+FROM player_stats
+GROUP BY team
+ORDER BY goals DESC"""
+
+sql = st.text_area("SQL", value=EXAMPLE, height=180)
+
+if st.button("▶️ Run query", type="primary"):
+    started = time.perf_counter()
+    try:
+        result = ad_hoc(sql)
+    except ValueError as exc:
+        st.error(str(exc))
+    except Exception as exc:
+        st.error(f"Query failed: {exc}")
+    else:
+        elapsed = (time.perf_counter() - started) * 1000
+        perf.lap("query")
+        st.caption(f"{len(result):,} rows in {elapsed:.0f} ms")
+        st.dataframe(result, use_container_width=True, hide_index=True)
+        st.download_button(
+            "⬇️ Download CSV", result.to_csv(index=False), file_name="query.csv", mime="text/csv",
+        )
+
+st.write("---")
+if st.button("🏠 Back to Homepage"):
+    st.switch_page("app.py")
+
+perf.finish()
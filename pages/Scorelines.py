@@ -0,0 +1,77 @@
+import streamlit as st
+
+from analytics import perf
+from analytics.charts.scorelines import build_figure, build_total_goals_figure
+from analytics.data import label
+from analytics.scorelines import MAX_GOALS, SIDES, cube
+
+
+st.set_page_config(page_title="Scorelines", layout="wide")
+perf.start("Scorelines")
+
+st.markdown(
+    f"<h1 style='text-align: center;'>🔢 Scorelines: {label()}</h1>",
+    unsafe_allow_html=True,
+)
+
+# Every played fixture counted once into the cube; the charts are slices of it
+scorelines = cube()
+perf.lap("data load", "scoreline cube")
+
+if not scorelines.weeks:
+    st.info("No played fixtures yet")
+    st.stop()
+
+
+# Only this section re-runs when the slice changes (st.fragment)
+@st.fragment
+@perf.fragment("Scorelines section")
+def scorelines_section():
+    col1, col2, col3 = st.columns([2, 1, 2])
+    with col1:
+        team = st.selectbox("Team", [None] + scorelines.teams, format_func=lambda team: team or "All teams")
+    with col2:
+        side = st.radio(
+            "Venue", [None] + list(SIDES), format_func=lambda side: "Both" if side is None else SIDES[side],
+            horizontal=True, disabled=team is None,
+        )
+    with col3:
+        first, last = scorelines.weeks[0], scorelines.weeks[-1]
+        weeks = st.slider("Gameweeks", first, last, (first, last)) if last > first else (first, last)
+    side = side if team else None
+    weeks = None if weeks == (first, last) else tuple(weeks)
+
+    grid = scorelines.scorelines(team, side, weeks)
+    total = int(grid.sum())
+    if team and total:
+        won, drawn, lost = scorelines.record(team, side, weeks)
+        cols = st.columns(4)
+        cols[0].metric("Matches", total)
+        cols[1].metric("Won", f"{won / total:.0%}")
+        cols[2].metric("Drawn", f"{drawn / total:.0%}")
+        cols[3].metric("Lost", f"{lost / total:.0%}")
+
+    fig = build_figure(team, side, weeks)
+    perf.lap("figure build", f"{team} {side} {weeks}")
+    perf.plotly_chart(fig, use_container_width=True, name="scorelines")
+
+
+st.write("---")
+scorelines_section()
+
+st.write("---")
+st.markdown("### 📅 Goals by Gameweek")
+perf.plotly_chart(build_total_goals_figure(), use_container_width=True, name="total goals")
+
+st.markdown(f"""
+### 🔍 How to read these charts
+- **Scorelines** are always home goals (rows) against away goals (columns), whichever team is selected; {MAX_GOALS}+ groups the rare high scores
+- **Cell numbers** are match counts, the colour their share of the selected matches
+- **Won / Drawn / Lost** are from the selected team's point of view
+""")
+
+st.write("---")
+if st.button("🏠 Back to Homepage"):
+    st.switch_page("app.py")
+
+perf.finish()
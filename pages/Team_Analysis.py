@@ -1,44 +1,35 @@
-import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
-from urllib.parse import parse_qs
-import plotly.express as px
+import streamlit as st
+
+from analytics import home_advantage, perf
+from analytics.charts.home_advantage import build_figure as build_advantage_figure
+from analytics.charts.team import DEFAULT_TEAM, build_figures
+from analytics.data import (
+    load_fixtures,
+    load_player_possession,
+    load_player_stats,
+    load_team_possession,
+    load_team_stats,
+)
+from analytics.resample import CONFIDENCE
 
 st.set_page_config(page_title="Team Analysis", layout="wide")
+perf.start("Team Analysis")
 
 # Get team parameter from URL (if available)
+selected_team = st.query_params.get("team", DEFAULT_TEAM).replace("_", " ")
+
+# Load data; snapshots are validated at ingest (analytics.ingest), so a
+# failure here is a missing dataset rather than a bad file
 try:
-    query_params = st.query_params
-    selected_team = query_params.get("team", "Liverpool").replace("_", " ")
-except:
-    selected_team = "Liverpool"
-
-# Load data
-@st.cache_data
-def load_data():
-    try:
-        return pd.read_csv("player_stats.csv")
-    except:
-        return pd.DataFrame()
-
-
-@st.cache_data
-def load_standings():
-    try:
-        return pd.read_csv("standings.csv")
-    except:
-        return pd.DataFrame()
-
-
-df = load_data()
-standings_df = load_standings()
-ven = pd.read_csv("fixtures.csv")
-team = pd.read_csv("team_stats.csv")
-pl = pd.read_csv("player_possession_stats.csv")
-
-if df.empty:
-    st.error("Player stats data not found. Please ensure 'player_stats.csv' exists.")
+    df = load_player_stats()
+    ven = load_fixtures()
+    team = load_team_stats()
+    pl = load_player_possession()
+except FileNotFoundError as exc:
+    st.error(f"Season data not found: {exc}")
     st.stop()
+perf.lap("data load")
 
 # Team selector (fallback if URL parameter doesn't work)
 if "team" in df.columns:
@@ -64,6 +55,9 @@ if "team" in df.columns:
     attend_data = ven[ven["Home"] == selected_team].copy()
     team_stats = team[team["team"] == selected_team].copy()
     possession_data = pl[pl["team"] == selected_team].copy()
+    perf.lap("derived metrics", "team filters")
+    figures = build_figures(selected_team)
+    perf.lap("figure build", "all team charts")
 
     if team_data.empty:
         st.warning(f"No data found for {selected_team}")
@@ -94,325 +88,100 @@ if "team" in df.columns:
     with col5:
         if "Venue" in attend_data.columns:
             team_attendance = attend_data["Attendance"].mean()
-            st.metric("Avg. Attendance", f"{int(team_attendance):,}")
+            # No attendance before the first home match (a pre-season partition)
+            st.metric("Avg. Attendance", "–" if pd.isna(team_attendance) else f"{int(team_attendance):,}")
 
     st.write("---")
 
+    # Home advantage, alongside the stadium and attendance above
+    advantage = home_advantage.by_team().set_index("team")
+    if selected_team in advantage.index:
+        st.markdown("### 🏟️ Home Advantage")
+        row = advantage.loc[selected_team]
+        col1, col2 = st.columns([1, 2])
+
+        with col1:
+            for metric, name in home_advantage.METRICS.items():
+                st.metric(
+                    f"{name}, home minus away", f"{row[metric]:+.2f}",
+                    help=f"{row[f'home_{metric}']:.2f} at home, {row[f'away_{metric}']:.2f} away",
+                )
+                st.caption(
+                    f"{CONFIDENCE:.0%} interval {row[f'{metric}_low']:+.2f} to {row[f'{metric}_high']:+.2f}; "
+                    f"shrunk towards the league: {row[f'{metric}_shrunk']:+.2f}"
+                )
+            venues = home_advantage.by_venue()
+            venues = venues[venues["team"] == selected_team]
+            if len(venues) > 1:
+                st.dataframe(
+                    venues[["venue", "home_matches", "points", "goals"]].round(2),
+                    hide_index=True, use_container_width=True,
+                )
+
+        with col2:
+            perf.plotly_chart(build_advantage_figure(selected_team), use_container_width=True, name="home advantage")
+
+        st.write("---")
+
     col1, col2 = st.columns(2)
 
     with col1:
-        if "goals" in team_stats.columns:
-            goals = int(team_stats["goals"].iloc[0])
-            xg = float(team_stats["expected_goals"].iloc[0])
         st.markdown("### Goals Scored v/s Expected Goals")
-
-        fig = go.Figure(
-            data=[
-                go.Bar(
-                    x=["Goals"],
-                    y=[int(goals)],
-                    marker_color="blue",
-                    text=[goals],
-                    textposition="outside",
-                    name="Goals",
-                ),
-                go.Bar(
-                    x=["Expected Goals"],
-                    y=[int(xg)],
-                    marker_color="orange",
-                    text=xg,
-                    textposition="outside",
-                    name="xG",
-                ),
-            ]
-        )
-        # Layout settings
-        fig.update_layout(
-            barmode="group",  # side-by-side bars
-            showlegend=False,
-            yaxis=dict(showticklabels=False, visible=False),
-            xaxis=dict(showticklabels=True, tickfont=dict(size=14)),
-            margin=dict(l=10, r=10, t=30, b=30),
-            height=400,
-            width=300,
-        )
-
-        st.plotly_chart(fig, use_container_width=False)
+        if figures["goals vs xG"] is not None:
+            perf.plotly_chart(figures["goals vs xG"], use_container_width=False, name="goals vs xG")
 
     with col2:
-        if "possession" in team_stats.columns:
-            possession_per = float(team_stats["possession"].iloc[0])
-            # st.metric("Avg. Possession %", float(possession_per))
-            fig = go.Figure(
-                data=[
-                    go.Pie(
-                        values=[possession_per, 100 - possession_per],
-                        labels=["Possession", "Non-possession"],
-                        marker=dict(colors=["#57D457", "gray"]),
-                        hole=0.4,
-                        textinfo="none",
-                        hoverinfo="label+value",
-                        sort=False,
-                        direction="clockwise",
-                    )
-                ]
-            )
-            fig.update_layout(
-                showlegend=False,
-                margin=dict(t=0, b=0, l=0, r=0),
-                height=250,
-                width=250,
-            )
+        if figures["possession"] is not None:
             st.markdown("### Avg. Possession %")
-            st.plotly_chart(fig, use_container_width=False)
+            perf.plotly_chart(figures["possession"], use_container_width=False, name="possession")
 
     # Team Position Analysis
     if "position" in team_data.columns:
         st.markdown("### 📊 Squad Composition")
 
-        # Position distribution
-        position_counts = team_data["position"].value_counts()
-
-        fig = go.Figure(
-            data=[
-                go.Bar(
-                    x=position_counts.index,
-                    y=position_counts.values,
-                    marker_color="#37003c",
-                    text=position_counts.values,
-                    textposition="auto",
-                )
-            ]
-        )
-
-        fig.update_layout(
-            title=f"{selected_team} - Players by Position",
-            xaxis_title="Position",
-            yaxis_title="Number of Players",
-            plot_bgcolor="white",
-            height=400,
-        )
-
-        st.plotly_chart(fig, use_container_width=True)
+        perf.plotly_chart(figures["squad composition"], use_container_width=True, name="squad composition")
         st.write("---")
     st.markdown("### 🏃‍♂️ Team Dribbling & Possession Stats")
 
     col1, col2, col3 = st.columns(3)
 
-    with col1:
-        # Top 5 Dribblers (Take-on Success Rate)
-        if not "take_on_success_rate" in possession_data.columns:
-            possession_data["take_on_success_rate"] = (
-                possession_data["successful_take_ons"]
-                / possession_data["attempted_take_ons"]
-            )
-            top_dribblers = possession_data.nlargest(5, "successful_take_ons")[
-                ["player", "take_on_success_rate", "attempted_take_ons"]
-            ]
-            if not top_dribblers.empty:
-
-                fig_dribblers = go.Figure()
-                fig_dribblers.add_trace(
-                    go.Bar(
-                        y=top_dribblers["player"],
-                        x=top_dribblers["take_on_success_rate"],
-                        orientation="h",
-                        marker_color="#ff2d96",
-                        text=[
-                            f"{rate:.1%}"
-                            for rate in top_dribblers["take_on_success_rate"]
-                        ],
-                        textposition="auto",
-                        customdata=top_dribblers["attempted_take_ons"],
-                        hovertemplate="<b>%{y}</b><br>Success Rate: %{x:.1%}<br>Attempts: %{customdata}<extra></extra>",
-                    )
-                )
-
-                fig_dribblers.update_layout(
-                    title="Top 5 Dribblers",
-                    xaxis_title="Success Rate",
-                    height=300,
-                    plot_bgcolor="white",
-                    showlegend=False,
-                )
-
-                st.plotly_chart(fig_dribblers, use_container_width=True)
-
-    with col2:
-        # Top 5 Progressive Carriers
-        if "progressive_carries" in team_data.columns:
-            top_carriers = team_data.nlargest(5, "progressive_carries")[
-                ["name", "progressive_carries", "position"]
-            ]
-            if not top_carriers.empty:
-
-                fig_carriers = go.Figure()
-                fig_carriers.add_trace(
-                    go.Bar(
-                        y=top_carriers["name"],
-                        x=top_carriers["progressive_carries"],
-                        orientation="h",
-                        marker_color="#00ff66",
-                        text=top_carriers["progressive_carries"],
-                        textposition="auto",
-                        customdata=top_carriers["position"],
-                        hovertemplate="<b>%{y}</b><br>Progressive Carries: %{x}<br>Position: %{customdata}<extra></extra>",
-                    )
-                )
-
-                fig_carriers.update_layout(
-                    title="Top 5 Progressive Carriers",
-                    xaxis_title="Progressive Carries",
-                    height=300,
-                    plot_bgcolor="white",
-                    showlegend=False,
-                )
-
-                st.plotly_chart(fig_carriers, use_container_width=True)
-
-    with col3:
-        # Top 5 Progressive Pass Recipients
-        if "received_progressive_passes" in team_data.columns:
-            top_receivers = team_data.nlargest(5, "received_progressive_passes")[
-                ["name", "received_progressive_passes", "position"]
-            ]
-            if not top_receivers.empty:
-                fig_receivers = go.Figure()
-                fig_receivers.add_trace(
-                    go.Bar(
-                        y=top_receivers["name"],
-                        x=top_receivers["received_progressive_passes"],
-                        orientation="h",
-                        marker_color="#4ac8ff",
-                        text=top_receivers["received_progressive_passes"],
-                        textposition="auto",
-                        customdata=top_receivers["position"],
-                        hovertemplate="<b>%{y}</b><br>Received: %{x}<br>Position: %{customdata}<extra></extra>",
-                    )
-                )
-
-                fig_receivers.update_layout(
-                    title="Top 5 Progressive Pass Recipients",
-                    xaxis_title="Progressive Passes Received",
-                    height=300,
-                    plot_bgcolor="white",
-                    showlegend=False,
-                )
+    for column, name in zip((col1, col2, col3), ("dribblers", "carriers", "receivers")):
+        if figures[name] is not None:
+            with column:
+                perf.plotly_chart(figures[name], use_container_width=True, name=name)
 
-                st.plotly_chart(fig_receivers, use_container_width=True)
     # Ternary Plots for Touch Distribution
 if not possession_data.empty:
     st.write("---")
     st.markdown("### 🎯 Touch Distribution by Position")
     
     # Load team possession stats
-    try:
-        team_possession_df = pd.read_csv("team_possession_stats.csv")
-        team_possession_data = team_possession_df[team_possession_df["team"] == selected_team].copy() if not team_possession_df.empty else pd.DataFrame()
-    except:
-        team_possession_data = pd.DataFrame()
-    
+    team_possession_df = load_team_possession()
+    team_possession_data = team_possession_df[team_possession_df["team"] == selected_team]
+    perf.lap("data load", "team possession CSV")
+
     if not team_possession_data.empty:
-        # Position groups
-        defenders = ["DF","DF,MF","MF,DF","DF,FW"]
-        midfielders = ["MF","FW,MF","DF,MF","MF,DF","MF,FW"]
-        forwards = ["FW", "FW,MF", "MF,FW","FW,DF","DF,FW"]
-        
-        # Get team totals
-        team_totals = team_possession_data.iloc[0]
-        team_def = team_totals["deffensive_touches"]
-        team_mid = team_totals["middle_touches"]
-        team_att = team_totals["attacking_touches"]
-        team_total_touches = team_totals["touches"]
-        
         col1, col2, col3 = st.columns(3)
-        
-        # Function to create ternary plot
-        def create_ternary_plot(position_group, group_name, color_palette):
-            filtered = possession_data[possession_data["position"].isin(position_group)].copy()
-            filtered = filtered[filtered["touches"] > 0]  # Avoid div-by-zero
-            
-            if filtered.empty:
-                return None
-                
-            # Normalize for ternary plot
-            filtered["def_pct"] = filtered["deffensive_touches"] / filtered["touches"]
-            filtered["mid_pct"] = filtered["middle_touches"] / filtered["touches"]
-            filtered["att_pct"] = filtered["attacking_touches"] / filtered["touches"]
-            
-            # Compute % contribution to team by each player
-            filtered["def_contrib_pct"] = (filtered["deffensive_touches"] / team_def * 100).round(2)
-            filtered["mid_contrib_pct"] = (filtered["middle_touches"] / team_mid * 100).round(2)
-            filtered["att_contrib_pct"] = (filtered["attacking_touches"] / team_att * 100).round(2)
-            filtered["touch_contrib_pct"] = (filtered["touches"] / team_total_touches * 100).round(2)
-            
-            # Custom hover text
-            filtered["hover_text"] = (
-                filtered["player"] + "<br><br>" +
-                "Defensive Touches: " + filtered["deffensive_touches"].astype(str) + "<br>" +
-                "→ " + filtered["def_contrib_pct"].astype(str) + "% of team total<br>" +
-                "Middle Touches: " + filtered["middle_touches"].astype(str) + "<br>" +
-                "→ " + filtered["mid_contrib_pct"].astype(str) + "% of team total<br>" +
-                "Attacking Touches: " + filtered["attacking_touches"].astype(str) + "<br>" +
-                "→ " + filtered["att_contrib_pct"].astype(str) + "% of team total<br><br>" +
-                "Total Touches: " + filtered["touches"].astype(str) + "<br>" +
-                "→ " + filtered["touch_contrib_pct"].astype(str) + "% of team total"
-            )
-            
-            # Create ternary plot
-            fig = px.scatter_ternary(
-                filtered,
-                a="def_pct",
-                b="mid_pct", 
-                c="att_pct",
-                size="touches",
-                color_discrete_sequence=[color_palette],
-                hover_name="player",
-                custom_data=["hover_text"]
-            )
-            
-            fig.update_traces(
-                hovertemplate="%{customdata[0]}<extra></extra>"
-            )
-            
-            fig.update_layout(
-                title=f"{group_name}",
-                ternary=dict(
-                    sum=1,
-                    aaxis_title="Defensive %",
-                    baxis_title="Middle %", 
-                    caxis_title="Attacking %"
-                ),
-                height=400,
-                plot_bgcolor='#0e1a26',
-                paper_bgcolor='#0e1a26',
-                font_color='white'
-            )
-            
-            return fig
-        
+
         # Create plots for each position group
         with col1:
             st.markdown("#### Defenders")
-            defenders_fig = create_ternary_plot(defenders,"Defenders","#4ac8ff")
-            if defenders_fig:
-                st.plotly_chart(defenders_fig, use_container_width=True)
+            if figures["ternary: defenders"]:
+                perf.plotly_chart(figures["ternary: defenders"], use_container_width=True, name="ternary: defenders")
             else:
                 st.info("No defender data available")
-        
+
         with col2:
             st.markdown("#### Midfielders")
-            midfielders_fig = create_ternary_plot(midfielders,"Midfielders", "#00ff66")
-            if midfielders_fig:
-                st.plotly_chart(midfielders_fig, use_container_width=True)
+            if figures["ternary: midfielders"]:
+                perf.plotly_chart(figures["ternary: midfielders"], use_container_width=True, name="ternary: midfielders")
             else:
                 st.info("No midfielder data available")
-        
+
         with col3:
             st.markdown("#### Forwards")
-            forwards_fig = create_ternary_plot(forwards,"Forwards", "#ff2d96")
-            if forwards_fig:
-                st.plotly_chart(forwards_fig, use_container_width=True)
+            if figures["ternary: forwards"]:
+                perf.plotly_chart(figures["ternary: forwards"], use_container_width=True, name="ternary: forwards")
             else:
                 st.info("No forward data available")
         st.markdown("#### Ternary Triangle Corner Reference:")
@@ -431,80 +200,12 @@ if not possession_data.empty:
         col1, col2 = st.columns(2)
 
         with col1:
-            # Progressive Carries Contribution
-            if (
-                "progressive_carries" in team_data.columns
-                and "progressive_carries" in team_stats.columns
-            ):
-                team_total_prog_carries = team_stats["progressive_carries"].iloc[0]
-                team_data["prog_carries_pct"] = (
-                    team_data["progressive_carries"] / team_total_prog_carries * 100
-                ).round(1)
-
-                # Get top 10 contributors
-                top_prog_carries = team_data.nlargest(10, "prog_carries_pct")[
-                    ["name", "prog_carries_pct", "progressive_carries"]
-                ]
-
-                fig_prog_carries = go.Figure()
-                fig_prog_carries.add_trace(
-                    go.Bar(
-                        y=top_prog_carries["name"],
-                        x=top_prog_carries["prog_carries_pct"],
-                        orientation="h",
-                        marker_color="#ff7300",
-                        customdata=top_prog_carries["progressive_carries"],
-                        hovertemplate="<b>%{y}</b><br>Contribution: %{x}%<br>Actual Carries: %{customdata}<extra></extra>",
-                    )
-                )
-
-                fig_prog_carries.update_layout(
-                    title="Progressive Carries Contribution (%)",
-                    xaxis_title="Percentage of Team Total",
-                    height=500,
-                    plot_bgcolor="white",
-                    showlegend=False,
-                )
-
-                st.plotly_chart(fig_prog_carries, use_container_width=True)
+            if figures["carries contribution"] is not None:
+                perf.plotly_chart(figures["carries contribution"], use_container_width=True, name="carries contribution")
 
         with col2:
-            # Progressive Passes Contribution
-            if (
-                "progressive_passes" in team_data.columns
-                and "progressive_passes" in team_stats.columns
-            ):
-                team_total_prog_passes = team_stats["progressive_passes"].iloc[0]
-                team_data["prog_passes_pct"] = (
-                    team_data["progressive_passes"] / team_total_prog_passes * 100
-                ).round(1)
-
-                # Get top 10 contributors
-                top_prog_passes = team_data.nlargest(10, "prog_passes_pct")[
-                    ["name", "prog_passes_pct", "progressive_passes"]
-                ]
-
-                fig_prog_passes = go.Figure()
-                fig_prog_passes.add_trace(
-                    go.Bar(
-                        y=top_prog_passes["name"],
-                        x=top_prog_passes["prog_passes_pct"],
-                        orientation="h",
-                        marker_color="#c77dff",
-                        customdata=top_prog_passes["progressive_passes"],
-                        hovertemplate="<b>%{y}</b><br>Contribution: %{x}%<br>Actual Passes: %{customdata}<extra></extra>",
-                    )
-                )
-
-                fig_prog_passes.update_layout(
-                    title="Progressive Passes Contribution (%)",
-                    xaxis_title="Percentage of Team Total",
-                    height=500,
-                    plot_bgcolor="white",
-                    showlegend=False,
-                )
-
-                st.plotly_chart(fig_prog_passes, use_container_width=True)
+            if figures["passes contribution"] is not None:
+                perf.plotly_chart(figures["passes contribution"], use_container_width=True, name="passes contribution")
 
     # Top Players Section
     st.write("---")
@@ -564,3 +265,5 @@ else:
 st.write("---")
 if st.button("🏠 Back to Homepage"):
     st.switch_page("app.py")
+
+perf.finish()
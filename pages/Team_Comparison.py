@@ -0,0 +1,57 @@
+import streamlit as st
+
+from analytics import perf
+from analytics.charts import COLORS
+from analytics.charts.comparison import build_figure, default_teams, table
+from analytics.data import label
+from analytics.team_features import matrix
+
+
+st.set_page_config(page_title="Team Comparison", layout="wide")
+perf.start("Team Comparison")
+
+st.markdown(
+    f"<h1 style='text-align: center;'>🆚 Team Comparison: {label()}</h1>",
+    unsafe_allow_html=True,
+)
+
+# Team x metric matrix, built once per dataset version
+features = matrix()
+perf.lap("data load", "team matrix")
+
+
+# Only the comparison re-runs when the selection changes (st.fragment)
+@st.fragment
+@perf.fragment("Team Comparison section")
+def comparison_section():
+    default = [team for team in default_teams() if team in features.index]
+    teams = st.multiselect("Teams", features.teams, default=default, max_selections=len(COLORS))
+    if not teams:
+        st.info("Pick at least one team.")
+        return
+    teams = tuple(teams)
+
+    fig = build_figure(teams)
+    perf.lap("figure build", ", ".join(teams))
+    perf.plotly_chart(fig, use_container_width=True, name="radar")
+
+    st.markdown("### 📋 Side by Side")
+    st.dataframe(table(teams).round(1), use_container_width=True)
+
+
+st.write("---")
+comparison_section()
+
+st.markdown("""
+### 🔍 How to read this chart
+- **Each axis** is scaled to the league: 0 is the lowest value among the teams, 100 the highest
+- **Cards** are reversed, so the fewest cards scores 100
+- **Touches by third** are shares of the team's touches, so they compare style rather than volume
+- **Hover** a point for the raw value
+""")
+
+st.write("---")
+if st.button("🏠 Back to Homepage"):
+    st.switch_page("app.py")
+
+perf.finish()
@@ -0,0 +1,65 @@
+import streamlit as st
+
+from analytics import perf
+from analytics.charts.style import SCOPES, build_figures, row_labels, rows
+from analytics.data import current, label, league_label, season_label
+from analytics.style import FEATURES, fingerprints, most_similar
+
+
+st.set_page_config(page_title="Team Style", layout="wide")
+perf.start("Team Style")
+
+selected = current()
+st.markdown(
+    f"<h1 style='text-align: center;'>🧬 Team Style: {label(selected)}</h1>",
+    unsafe_allow_html=True,
+)
+
+# Fingerprints of every team-season of every loaded league and season
+teams, _ = fingerprints()
+perf.lap("data load", "fingerprints")
+st.caption(f"{len(teams):,} team-seasons loaded across {teams[['league', 'season']].drop_duplicates().shape[0]} season(s)")
+
+
+# Only the clustering re-runs when the scope changes (st.fragment)
+@st.fragment
+@perf.fragment("Team Style section")
+def clusters_section():
+    scope = st.radio("Teams", list(SCOPES), format_func=SCOPES.get, horizontal=True)
+    figures = build_figures(scope, selected)
+    perf.lap("figure build", scope)
+    col1, col2 = st.columns(2)
+    with col1:
+        perf.plotly_chart(figures["dendrogram"], use_container_width=True, name="dendrogram")
+    with col2:
+        perf.plotly_chart(figures["similarity"], use_container_width=True, name="similarity")
+
+
+st.write("---")
+clusters_section()
+
+st.write("---")
+st.markdown("### 🔎 Most Similar Team-Seasons")
+positions = rows("season", selected)
+names = row_labels("season", positions)
+team = st.selectbox("Team", range(len(positions)), format_func=names.__getitem__)
+similar, scores = most_similar(positions[team])
+table = teams.iloc[similar][["team", "league", "season"]].assign(similarity=scores.round(3))
+table["league"] = table["league"].map(league_label)
+table["season"] = table["season"].map(season_label)
+table.columns = ["Team", "League", "Season", "Similarity"]
+st.dataframe(table, use_container_width=True, hide_index=True)
+perf.lap("render", "most similar")
+
+st.markdown(f"""
+### 🔍 How this works
+- **Fingerprint**: {", ".join(FEATURES.values())}
+- **Similarity**: each feature is standardised over every loaded team-season, and two teams' similarity is the cosine of their fingerprints (1 = same style, -1 = opposite)
+- **Dendrogram**: teams joined further left play more alike; the heatmap lists teams in the same order
+""")
+
+st.write("---")
+if st.button("🏠 Back to Homepage"):
+    st.switch_page("app.py")
+
+perf.finish()